@@ -0,0 +1,27 @@
+"""Add rendered HTML cache to articles
+
+Revision ID: 3b7e9d2c4a1f
+Revises: 9cf8ad12703d
+Create Date: 2026-01-12 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e9d2c4a1f'
+down_revision: Union[str, None] = '9cf8ad12703d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('content_html', sa.Text(), nullable=True))
+    op.add_column('articles', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'content_hash')
+    op.drop_column('articles', 'content_html')
@@ -0,0 +1,51 @@
+"""Add indexes for hot query paths
+
+Indexes are built CONCURRENTLY outside the migration transaction so that
+reads and writes are not blocked while they build.
+
+Revision ID: 8d41f0a6c2e5
+Revises: 3b7e9d2c4a1f
+Create Date: 2026-01-19 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0a6c2e5'
+down_revision: Union[str, None] = '3b7e9d2c4a1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_articles_created_at_id', 'articles', ['created_at', 'id']),
+    ('ix_articles_category_id_created_at_id', 'articles', ['category_id', 'created_at', 'id']),
+    ('ix_articles_status_created_at_id', 'articles', ['status', 'created_at', 'id']),
+    ('ix_prompt_templates_category_id_is_active', 'prompt_templates', ['category_id', 'is_active']),
+    ('ix_job_logs_article_id_created_at', 'job_logs', ['article_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY はトランザクション内で実行できない
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,97 @@
+"""Partition job_logs by month
+
+Recreates job_logs as a table partitioned by RANGE (created_at) with one
+partition per month (job_logs_YYYY_MM) and copies the existing rows.
+The primary key becomes (id, created_at) because it must include the
+partition key. Partitions are created from the oldest existing row up to
+three months ahead; afterwards the ARQ cron task
+manage_job_log_partitions_task creates upcoming months and drops
+partitions past the retention window.
+
+Revision ID: a4d9e2b7c1f3
+Revises: f2c8a6d1e4b7
+Create Date: 2026-02-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9e2b7c1f3'
+down_revision: Union[str, None] = 'f2c8a6d1e4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = 'ix_job_logs_article_id_created_at'
+COLUMNS = 'id, article_id, job_type, status, error_message, duration_ms, created_at'
+
+# 既存データの最古の月から3か月先までの月次パーティションを作成（境界はUTC）
+CREATE_PARTITIONS = """
+DO $$
+DECLARE
+    start_month date := date_trunc('month', coalesce(
+        (SELECT min(created_at) FROM job_logs_unpartitioned), now()
+    ) AT TIME ZONE 'UTC')::date;
+    last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months')::date;
+BEGIN
+    WHILE start_month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF job_logs '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'job_logs_' || to_char(start_month, 'YYYY_MM'),
+            start_month || ' 00:00:00+00',
+            (start_month + interval '1 month')::date || ' 00:00:00+00'
+        );
+        start_month := (start_month + interval '1 month')::date;
+    END LOOP;
+END
+$$
+"""
+
+
+def _create_job_logs(partitioned: bool) -> None:
+    op.create_table(
+        'job_logs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('article_id', sa.UUID(), nullable=False),
+        sa.Column('job_type', postgresql.ENUM(name='jobtype', create_type=False), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='jobstatus', create_type=False), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', 'created_at') if partitioned else sa.PrimaryKeyConstraint('id'),
+        **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {}),
+    )
+    op.create_index(INDEX, 'job_logs', ['article_id', 'created_at'])
+
+
+def upgrade() -> None:
+    op.drop_index(INDEX, table_name='job_logs', if_exists=True)
+    op.rename_table('job_logs', 'job_logs_unpartitioned')
+    op.execute('ALTER INDEX job_logs_pkey RENAME TO job_logs_unpartitioned_pkey')
+
+    _create_job_logs(partitioned=True)
+    op.execute(CREATE_PARTITIONS)
+    op.execute(
+        f'INSERT INTO job_logs ({COLUMNS}) '
+        f'SELECT {COLUMNS} FROM job_logs_unpartitioned'
+    )
+    op.drop_table('job_logs_unpartitioned')
+
+
+def downgrade() -> None:
+    op.rename_table('job_logs', 'job_logs_partitioned')
+    op.drop_index(INDEX, table_name='job_logs_partitioned')
+    op.execute('ALTER INDEX job_logs_pkey RENAME TO job_logs_partitioned_pkey')
+
+    _create_job_logs(partitioned=False)
+    op.execute(
+        f'INSERT INTO job_logs ({COLUMNS}) '
+        f'SELECT {COLUMNS} FROM job_logs_partitioned'
+    )
+    # パーティションも親テーブルとともに削除される
+    op.drop_table('job_logs_partitioned')
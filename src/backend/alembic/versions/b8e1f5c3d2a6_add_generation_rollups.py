@@ -0,0 +1,74 @@
+"""Add generation analytics rollups
+
+Adds per-job usage columns to job_logs (template, model, token counts)
+and the generation_rollups table holding hourly aggregates by
+category x template x model. The rollups are filled by the ARQ cron
+task refresh_generation_rollups_task.
+
+Revision ID: b8e1f5c3d2a6
+Revises: a4d9e2b7c1f3
+Create Date: 2026-02-23 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e1f5c3d2a6'
+down_revision: Union[str, None] = 'a4d9e2b7c1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_logs', sa.Column('prompt_template_id', sa.UUID(), nullable=True))
+    op.add_column('job_logs', sa.Column('model', sa.String(length=100), nullable=True))
+    op.add_column('job_logs', sa.Column('input_tokens', sa.Integer(), nullable=True))
+    op.add_column('job_logs', sa.Column('output_tokens', sa.Integer(), nullable=True))
+
+    op.create_table(
+        'generation_rollups',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('category_id', sa.UUID(), nullable=False),
+        sa.Column('prompt_template_id', sa.UUID(), nullable=True),
+        sa.Column('template_version', sa.Integer(), nullable=True),
+        sa.Column('model', sa.String(length=100), nullable=True),
+        sa.Column('job_count', sa.Integer(), nullable=False),
+        sa.Column('success_count', sa.Integer(), nullable=False),
+        sa.Column('failed_count', sa.Integer(), nullable=False),
+        sa.Column('duration_count', sa.Integer(), nullable=False),
+        sa.Column('duration_sum_ms', sa.BigInteger(), nullable=False),
+        sa.Column('duration_max_ms', sa.Integer(), nullable=True),
+        sa.Column('duration_histogram', postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column('input_tokens', sa.BigInteger(), nullable=False),
+        sa.Column('output_tokens', sa.BigInteger(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_generation_rollups_bucket_dimensions',
+        'generation_rollups',
+        ['bucket', 'category_id', 'prompt_template_id', 'model'],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.create_index(
+        'ix_generation_rollups_category_id_bucket',
+        'generation_rollups',
+        ['category_id', 'bucket'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generation_rollups_category_id_bucket', table_name='generation_rollups')
+    op.drop_index('uq_generation_rollups_bucket_dimensions', table_name='generation_rollups')
+    op.drop_table('generation_rollups')
+
+    op.drop_column('job_logs', 'output_tokens')
+    op.drop_column('job_logs', 'input_tokens')
+    op.drop_column('job_logs', 'model')
+    op.drop_column('job_logs', 'prompt_template_id')
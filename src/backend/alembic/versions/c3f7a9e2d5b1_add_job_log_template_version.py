@@ -0,0 +1,52 @@
+"""Record the template version on job_logs
+
+Adds job_logs.template_version (the prompt template version actually
+used by the generation) and makes it a dimension of generation_rollups.
+Previously the rollups took the template's current version at refresh
+time, so recomputed hours were attributed to the wrong version after a
+template edit. Existing rollups are cleared so the next refresh rebuilds
+them from job_logs.
+
+Revision ID: c3f7a9e2d5b1
+Revises: b8e1f5c3d2a6
+Create Date: 2026-02-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7a9e2d5b1'
+down_revision: Union[str, None] = 'b8e1f5c3d2a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_logs', sa.Column('template_version', sa.Integer(), nullable=True))
+
+    op.execute('DELETE FROM generation_rollups')
+    op.drop_index('uq_generation_rollups_bucket_dimensions', table_name='generation_rollups')
+    op.create_index(
+        'uq_generation_rollups_bucket_dimensions',
+        'generation_rollups',
+        ['bucket', 'category_id', 'prompt_template_id', 'template_version', 'model'],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute('DELETE FROM generation_rollups')
+    op.drop_index('uq_generation_rollups_bucket_dimensions', table_name='generation_rollups')
+    op.create_index(
+        'uq_generation_rollups_bucket_dimensions',
+        'generation_rollups',
+        ['bucket', 'category_id', 'prompt_template_id', 'model'],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+    op.drop_column('job_logs', 'template_version')
@@ -0,0 +1,42 @@
+"""Add unique index on articles (category_id, keyword)
+
+Required by bulk article creation (INSERT ... ON CONFLICT DO NOTHING).
+Built CONCURRENTLY; the build fails if duplicate keywords already exist
+in a category, in which case they must be resolved first.
+
+Revision ID: c5a2e8f1b9d3
+Revises: 8d41f0a6c2e5
+Create Date: 2026-01-26 11:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a2e8f1b9d3'
+down_revision: Union[str, None] = '8d41f0a6c2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_articles_category_id_keyword',
+            'articles',
+            ['category_id', 'keyword'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_articles_category_id_keyword',
+            table_name='articles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,34 @@
+"""Record when an article was claimed for generation
+
+Adds articles.generation_started_at, set when a selector batch claims an
+article (status GENERATING). Claims older than the batch claim lease are
+reclaimable, so articles left GENERATING by a timed-out, cancelled or
+lost job no longer stay stuck forever. Existing GENERATING rows have no
+timestamp and are reclaimable immediately.
+
+Revision ID: d4b8f2a6c1e9
+Revises: c3f7a9e2d5b1
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8f2a6c1e9'
+down_revision: Union[str, None] = 'c3f7a9e2d5b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'articles',
+        sa.Column('generation_started_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'generation_started_at')
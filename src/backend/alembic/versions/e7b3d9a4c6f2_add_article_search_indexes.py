@@ -0,0 +1,52 @@
+"""Add trigram indexes for article search
+
+Enables pg_trgm and adds GIN indexes on articles.title / articles.content
+for ILIKE substring search (works for Japanese text without word
+boundaries). Built CONCURRENTLY.
+
+Revision ID: e7b3d9a4c6f2
+Revises: c5a2e8f1b9d3
+Create Date: 2026-02-02 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d9a4c6f2'
+down_revision: Union[str, None] = 'c5a2e8f1b9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_articles_title_trgm', 'title'),
+    ('ix_articles_content_trgm', 'content'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name,
+                'articles',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name='articles',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,65 @@
+"""Store rendered HTML on the content revision
+
+Moves the rendered HTML cache from articles.content_html/content_hash to
+article_contents.content_html, next to the revision it was rendered from.
+HTML is copied only where it was rendered from the current revision's
+Markdown; other rows are rendered again on first read. Also drops
+ix_article_contents_article_id_content_hash, which no query uses (content
+is only deduplicated against the current revision).
+
+Revision ID: e9c3a7d5b2f8
+Revises: d4b8f2a6c1e9
+Create Date: 2026-03-03 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c3a7d5b2f8'
+down_revision: Union[str, None] = 'd4b8f2a6c1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('article_contents', sa.Column('content_html', sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE article_contents AS c
+        SET content_html = a.content_html
+        FROM articles AS a
+        WHERE a.current_content_id = c.id
+          AND a.content_html IS NOT NULL
+          AND a.content_hash = c.content_hash
+        """
+    )
+    op.drop_column('articles', 'content_hash')
+    op.drop_column('articles', 'content_html')
+
+    op.drop_index(
+        'ix_article_contents_article_id_content_hash', table_name='article_contents'
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_article_contents_article_id_content_hash',
+        'article_contents',
+        ['article_id', 'content_hash'],
+    )
+
+    op.add_column('articles', sa.Column('content_html', sa.Text(), nullable=True))
+    op.add_column('articles', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.execute(
+        """
+        UPDATE articles AS a
+        SET content_html = c.content_html, content_hash = c.content_hash
+        FROM article_contents AS c
+        WHERE a.current_content_id = c.id
+          AND c.content_html IS NOT NULL
+        """
+    )
+    op.drop_column('article_contents', 'content_html')
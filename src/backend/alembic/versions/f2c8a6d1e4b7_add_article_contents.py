@@ -0,0 +1,125 @@
+"""Move article bodies to versioned article_contents
+
+Creates article_contents (one row per content revision; the current
+revision keeps plain text for search, older revisions are zstd-compressed
+by the application) and replaces articles.content with a pointer to the
+current revision. Existing bodies become revision 1.
+
+Revision ID: f2c8a6d1e4b7
+Revises: e7b3d9a4c6f2
+Create Date: 2026-02-09 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a6d1e4b7'
+down_revision: Union[str, None] = 'e7b3d9a4c6f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'article_contents',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('article_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('body', sa.LargeBinary(), nullable=True),
+        sa.Column('char_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'uq_article_contents_article_id_revision',
+        'article_contents',
+        ['article_id', 'revision'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_article_contents_article_id_content_hash',
+        'article_contents',
+        ['article_id', 'content_hash'],
+    )
+
+    op.add_column('articles', sa.Column('current_content_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('articles', sa.Column('content_revision', sa.Integer(), server_default='0', nullable=False))
+    op.create_foreign_key(
+        'fk_articles_current_content_id',
+        'articles',
+        'article_contents',
+        ['current_content_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+
+    # 既存の本文を版 1 として移行
+    op.execute(
+        """
+        INSERT INTO article_contents
+            (id, article_id, revision, content_hash, content, char_count, created_at)
+        SELECT gen_random_uuid(), id, 1,
+               encode(sha256(convert_to(content, 'UTF8')), 'hex'),
+               content, char_length(content), updated_at
+        FROM articles
+        WHERE content IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE articles AS a
+        SET current_content_id = c.id, content_revision = 1
+        FROM article_contents AS c
+        WHERE c.article_id = a.id
+        """
+    )
+
+    op.drop_index('ix_articles_content_trgm', table_name='articles', if_exists=True)
+    op.drop_column('articles', 'content')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_article_contents_content_trgm',
+            'article_contents',
+            ['content'],
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+            postgresql_where=sa.text('content IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # 過去の版（圧縮済み）は破棄し、現在の版の本文のみを articles に戻す
+    op.add_column('articles', sa.Column('content', sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE articles AS a
+        SET content = c.content
+        FROM article_contents AS c
+        WHERE c.id = a.current_content_id
+        """
+    )
+    op.drop_constraint('fk_articles_current_content_id', 'articles', type_='foreignkey')
+    op.drop_column('articles', 'content_revision')
+    op.drop_column('articles', 'current_content_id')
+    op.drop_table('article_contents')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_content_trgm',
+            'articles',
+            ['content'],
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -42,18 +43,139 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
     secret_key: str = Field(...)
     database_url: PostgresDsn = Field(...)
+    # 読み取り専用セッションの接続先（未設定時は database_url の接続プールを共有）
+    database_replica_url: Optional[PostgresDsn] = Field(default=None)
+
+    # データベース接続プール設定
+    # DB_POOL_PROFILE で API（api）とARQワーカー（worker）のプールサイズを切り替え
+    db_pool_profile: Literal["api", "worker"] = Field(default="api")
+    db_pool_size: int = Field(default=10, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    # ワーカーは1ジョブ1セッションのため、既定は同時実行ジョブ数と同数でオーバーフローなし
+    db_worker_pool_size: Optional[int] = Field(default=None, ge=1)
+    db_worker_max_overflow: int = Field(default=0, ge=0)
+    db_pool_timeout: float = Field(default=30.0, gt=0)
+    db_pool_recycle: int = Field(default=1800, ge=-1)
+    db_pool_pre_ping: bool = Field(default=True)
+    # asyncpg のプリペアドステートメントキャッシュ（PgBouncer のトランザクションモードでは 0）
+    db_statement_cache_size: int = Field(default=100, ge=0)
+    db_command_timeout: Optional[float] = Field(default=None, gt=0)
+
+    # ARQワーカーの同時実行ジョブ数
+    worker_max_jobs: int = Field(default=10, ge=1)
     redis_url: RedisDsn = Field(...)
+    # ジョブキュー（ARQ）の共有Redis接続プール設定
+    redis_max_connections: int = Field(default=20, ge=1)
+    redis_health_check_interval: int = Field(default=30, ge=0)
     google_api_key: str = Field(...)
     wordpress_url: str = Field(...)
     wordpress_username: str = Field(...)
     wordpress_app_password: str = Field(...)
+    wordpress_bulk_concurrency: int = Field(default=5, ge=1)
+    # バックグラウンド一括投稿のコミット単位（記事数）とジョブのタイムアウト（秒）
+    wordpress_bulk_chunk_size: int = Field(default=50, ge=1)
+    wordpress_bulk_job_timeout: int = Field(default=3600, ge=1)
     google_credentials_json: str = Field(...)
     frontend_url: str = Field(default="http://localhost:3000")
 
+    # 共有HTTPクライアントの接続プール設定
+    http_max_connections: int = Field(default=20, ge=1)
+    http_max_keepalive_connections: int = Field(default=10, ge=0)
+    http_keepalive_expiry: float = Field(default=30.0, ge=0)
+    http2_enabled: bool = Field(default=True)
+
+    # レスポンス圧縮設定
+    compression_enabled: bool = Field(default=True)
+    compression_minimum_size: int = Field(default=1024, ge=0)
+    compression_gzip_level: int = Field(default=6, ge=1, le=9)
+    compression_brotli_enabled: bool = Field(default=True)
+    compression_brotli_level: int = Field(default=4, ge=0, le=11)
+
+    # 参照データキャッシュ設定（プロセス内 + Redis）
+    cache_enabled: bool = Field(default=True)
+    cache_ttl: int = Field(default=3600, ge=1)
+    cache_local_ttl: float = Field(default=30.0, ge=0)
+    cache_local_max_entries: int = Field(default=1024, ge=1)
+
+    # ジョブログの一括書き込み設定（コミット時の複数行 INSERT の最大行数）
+    # まとめるのは1セッション（トランザクション）内のログのみで、記事1件のジョブは
+    # コミットごとに1回の INSERT になります。セッションをまたいだ集約や、件数・時間に
+    # よる書き込み、シャットダウン時の書き込みは行いません。
+    job_log_batch_size: int = Field(default=500, ge=1)
+    # job_logs の保持月数（当月を含む）と事前に作成するパーティションの月数
+    job_log_retention_months: int = Field(default=6, ge=1)
+    job_log_partitions_ahead: int = Field(default=3, ge=1)
+
+    # 生成分析の集計設定（ワーカーの定期タスク）
+    # 集計の更新間隔（分）と、遅れて書き込まれたログを反映するため再計算する幅（分）
+    analytics_refresh_interval_minutes: int = Field(default=5, ge=1, le=60)
+    analytics_lateness_minutes: int = Field(default=60, ge=0)
+
+    # バッチ進捗イベント（Redis Streams）の設定
+    # ストリームの最大長と保持秒数、SSE/WebSocket の keep-alive 間隔（秒）と同時購読数の上限
+    batch_events_maxlen: int = Field(default=10000, ge=100)
+    batch_events_ttl: int = Field(default=86400, ge=60)
+    batch_events_heartbeat: float = Field(default=15.0, gt=0)
+    batch_events_max_streams: int = Field(default=100, ge=1)
+
+    # セレクター指定のバッチ生成の設定
+    # 1ジョブあたりの記事数、1リクエストでエンキューする記事数の上限、
+    # エンキューを受け付けるジョブキューの待機中ジョブ数の上限（0 は無制限）
+    batch_select_chunk_size: int = Field(default=10, ge=1, le=1000)
+    batch_select_max_articles: int = Field(default=10000, ge=1)
+    batch_queue_max_depth: int = Field(default=1000, ge=0)
+    # バッチ生成の1記事あたりの想定最大時間（秒）。batch_generate_task の
+    # タイムアウトは batch_select_chunk_size 件分（ワーカーの既定値以上）
+    batch_article_timeout: int = Field(default=120, ge=1)
+    # batch_generate_task がキューで開始を待つ上限（秒）。超えたジョブは実行せず破棄
+    batch_job_expires: int = Field(default=3600, ge=60)
+
+    @property
+    def batch_job_timeout(self) -> int:
+        """batch_generate_task のタイムアウト（秒。ARQ の既定値 300 秒以上）"""
+        return max(300, self.batch_article_timeout * self.batch_select_chunk_size)
+
+    @property
+    def batch_claim_lease(self) -> int:
+        """バッチ生成で確保した記事を再確保できるまでの秒数
+
+        キューでの待機（batch_job_expires）と実行（batch_job_timeout）の上限を
+        過ぎても生成中のままの記事は、ジョブのタイムアウト・キャンセル・
+        ワーカーの停止などで取り残されたものとして再確保できます。
+        """
+        return self.batch_job_expires + self.batch_job_timeout
+
     @property
     def async_database_url(self) -> str:
         return str(self.database_url).replace("postgresql://", "postgresql+asyncpg://")
 
+    def db_pool_options(self) -> dict:
+        """DB_POOL_PROFILE に応じた create_async_engine のプール設定"""
+        if self.db_pool_profile == "worker":
+            pool_size = self.db_worker_pool_size or self.worker_max_jobs
+            max_overflow = self.db_worker_max_overflow
+        else:
+            pool_size = self.db_pool_size
+            max_overflow = self.db_max_overflow
+
+        connect_args: dict = {"statement_cache_size": self.db_statement_cache_size}
+        if self.db_command_timeout is not None:
+            connect_args["command_timeout"] = self.db_command_timeout
+
+        return {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+            "connect_args": connect_args,
+        }
+
+    @property
+    def async_replica_database_url(self) -> str:
+        url = self.database_replica_url or self.database_url
+        return str(url).replace("postgresql://", "postgresql+asyncpg://")
+
 
 @lru_cache
 def get_settings() -> Settings:
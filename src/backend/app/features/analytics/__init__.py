@@ -0,0 +1 @@
+"""生成分析機能"""
@@ -0,0 +1,4 @@
+"""生成分析アプリケーション層"""
+from .report import histogram_percentile, summarize
+
+__all__ = ["histogram_percentile", "summarize"]
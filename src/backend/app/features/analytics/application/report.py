@@ -0,0 +1,152 @@
+"""生成分析の再集計
+
+1時間ごとの集計行（GenerationRollup）を、指定された軸・期間の単位で
+合算します。件数・トークン数・処理時間の合計とヒストグラムは加算できるため、
+生ログを参照せずに任意の粒度の統計を算出できます。
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from app.features.analytics.domain.models import DURATION_BUCKETS_MS
+from app.features.analytics.domain.schemas import (
+    GenerationDuration,
+    GenerationStats,
+    GroupBy,
+    Interval,
+)
+
+# 軸ごとにキーに含める集計行の属性
+GROUP_COLUMNS: dict[str, tuple[str, ...]] = {
+    "category": ("category_id",),
+    "template": ("prompt_template_id", "template_version"),
+    "model": ("model",),
+}
+
+_NO_BUCKET = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class _Totals:
+    """1グループ分の合計"""
+
+    jobs: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    duration_count: int = 0
+    duration_sum_ms: int = 0
+    duration_max_ms: Optional[int] = None
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(DURATION_BUCKETS_MS) + 1)
+    )
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def add(self, row: Any) -> None:
+        self.jobs += row.job_count
+        self.succeeded += row.success_count
+        self.failed += row.failed_count
+        self.duration_count += row.duration_count
+        self.duration_sum_ms += row.duration_sum_ms
+        if row.duration_max_ms is not None:
+            self.duration_max_ms = max(self.duration_max_ms or 0, row.duration_max_ms)
+        for index, count in enumerate(row.duration_histogram):
+            self.histogram[index] += count
+        self.input_tokens += row.input_tokens
+        self.output_tokens += row.output_tokens
+
+
+def histogram_percentile(
+    histogram: Sequence[int], p: float, max_ms: Optional[int] = None
+) -> Optional[float]:
+    """ヒストグラムからパーセンタイルを算出（区間内は線形補間）
+
+    Args:
+        histogram: DURATION_BUCKETS_MS の区間ごとの件数
+        p: 0〜1 のパーセンタイル
+        max_ms: 最大値（上限のない最後の区間の上限、および結果の上限）
+
+    Returns:
+        パーセンタイル値（ミリ秒）。件数が 0 の場合は None
+    """
+    total = sum(histogram)
+    if total == 0:
+        return None
+
+    rank = p * total
+    cumulative = 0
+    for index, count in enumerate(histogram):
+        if count and cumulative + count >= rank:
+            lower = DURATION_BUCKETS_MS[index - 1] if index > 0 else 0
+            if index < len(DURATION_BUCKETS_MS):
+                upper = DURATION_BUCKETS_MS[index]
+            else:
+                upper = max(max_ms or lower, lower)
+            value = lower + (upper - lower) * (rank - cumulative) / count
+            return round(min(value, max_ms) if max_ms is not None else value, 1)
+        cumulative += count
+    return None
+
+
+def truncate_bucket(bucket: datetime, interval: Interval) -> Optional[datetime]:
+    """集計行の時刻を期間の単位に切り捨て（total の場合は None）"""
+    if interval == "total":
+        return None
+    bucket = bucket.astimezone(timezone.utc)
+    if interval == "day":
+        return bucket.replace(hour=0, minute=0, second=0, microsecond=0)
+    return bucket.replace(minute=0, second=0, microsecond=0)
+
+
+def summarize(
+    rows: Iterable[Any], group_by: Sequence[GroupBy], interval: Interval
+) -> list[GenerationStats]:
+    """集計行を軸・期間の単位ごとに合算
+
+    Args:
+        rows: GenerationRollup の行
+        group_by: 集計の軸
+        interval: 期間の単位
+
+    Returns:
+        期間・ジョブ件数の多い順の集計値
+    """
+    columns = [column for axis in group_by for column in GROUP_COLUMNS[axis]]
+    groups: dict[tuple, _Totals] = {}
+    for row in rows:
+        key = (
+            truncate_bucket(row.bucket, interval),
+            *(getattr(row, column) for column in columns),
+        )
+        groups.setdefault(key, _Totals()).add(row)
+
+    items = [
+        GenerationStats(
+            bucket=key[0],
+            **dict(zip(columns, key[1:])),
+            jobs=totals.jobs,
+            succeeded=totals.succeeded,
+            failed=totals.failed,
+            failure_rate=round(totals.failed / totals.jobs, 4) if totals.jobs else 0.0,
+            duration=_duration(totals),
+            input_tokens=totals.input_tokens,
+            output_tokens=totals.output_tokens,
+        )
+        for key, totals in groups.items()
+    ]
+    items.sort(key=lambda item: (item.bucket or _NO_BUCKET, -item.jobs))
+    return items
+
+
+def _duration(totals: _Totals) -> GenerationDuration:
+    if not totals.duration_count:
+        return GenerationDuration()
+    return GenerationDuration(
+        mean_ms=round(totals.duration_sum_ms / totals.duration_count, 1),
+        p50_ms=histogram_percentile(totals.histogram, 0.50, totals.duration_max_ms),
+        p95_ms=histogram_percentile(totals.histogram, 0.95, totals.duration_max_ms),
+        p99_ms=histogram_percentile(totals.histogram, 0.99, totals.duration_max_ms),
+        max_ms=totals.duration_max_ms,
+    )
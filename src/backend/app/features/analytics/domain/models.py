@@ -0,0 +1,71 @@
+"""生成分析ドメインモデル"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.infrastructure.database import Base
+
+# 処理時間ヒストグラムの区間の上限（ミリ秒）。最後の区間は上限なし
+DURATION_BUCKETS_MS = (
+    1000, 2000, 3000, 5000, 7500, 10000, 15000, 20000,
+    30000, 45000, 60000, 90000, 120000, 180000, 300000,
+)
+
+
+class GenerationRollup(Base):
+    """記事生成ジョブの1時間ごとの集計
+
+    job_logs（GENERATE）を 時間 × カテゴリ × テンプレート（バージョン）× モデル で
+    集計した値です。
+    処理時間はパーセンタイルを算出できるよう、DURATION_BUCKETS_MS の区間ごとの
+    件数（ヒストグラム）で保持します。ヒストグラムは加算できるため、
+    任意の期間・軸で再集計できます。
+    """
+
+    __tablename__ = "generation_rollups"
+    __table_args__ = (
+        Index(
+            "uq_generation_rollups_bucket_dimensions",
+            "bucket",
+            "category_id",
+            "prompt_template_id",
+            "template_version",
+            "model",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        # カテゴリで絞り込んだ期間指定の集計
+        Index("ix_generation_rollups_category_id_bucket", "category_id", "bucket"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    # 集計期間の開始時刻（1時間単位）
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    category_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    prompt_template_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    template_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    job_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # 処理時間が記録されたジョブの件数・合計・最大値
+    duration_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    duration_sum_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    duration_max_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    duration_histogram: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False
+    )
+    input_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    output_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,59 @@
+"""生成分析Pydanticスキーマ"""
+
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+# 集計の軸と期間の単位
+GroupBy = Literal["category", "template", "model"]
+Interval = Literal["hour", "day", "total"]
+
+
+class GenerationDuration(BaseModel):
+    """生成時間の統計（ミリ秒）
+
+    パーセンタイルはヒストグラムの区間内を線形補間した近似値です。
+    """
+
+    mean_ms: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    max_ms: Optional[int] = None
+
+
+class GenerationStats(BaseModel):
+    """生成ジョブの集計値
+
+    group_by・interval に含まれない軸は None です。
+    """
+
+    bucket: Optional[datetime] = Field(
+        None, description="期間の開始時刻（interval=total の場合は None）"
+    )
+    category_id: Optional[UUID] = None
+    prompt_template_id: Optional[UUID] = None
+    template_version: Optional[int] = None
+    model: Optional[str] = None
+    jobs: int
+    succeeded: int
+    failed: int
+    failure_rate: float = Field(..., description="失敗率（0〜1）")
+    duration: GenerationDuration
+    input_tokens: int
+    output_tokens: int
+
+
+class GenerationAnalyticsResponse(BaseModel):
+    """生成分析レスポンス"""
+
+    start: datetime
+    end: datetime
+    interval: Interval
+    group_by: list[GroupBy]
+    refreshed_at: Optional[datetime] = Field(
+        None, description="集計の最終更新日時（これ以降のジョブは含まれない）"
+    )
+    items: list[GenerationStats]
@@ -0,0 +1,180 @@
+"""生成分析リポジトリ"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Integer, case, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.analytics.domain.models import DURATION_BUCKETS_MS, GenerationRollup
+from app.features.articles.domain.models import Article
+from app.features.job_logs.domain.models import JobLog
+from app.features.prompt_templates.domain.models import PromptTemplate
+from app.shared.domain.enums import JobStatus, JobType
+
+# 集計の再計算を直列化する pg_advisory_xact_lock のキー
+REFRESH_LOCK_KEY = 0x67656E726F6C6C  # "genroll"
+
+
+class GenerationRollupRepository:
+    """生成分析リポジトリ"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_range(
+        self,
+        start: datetime,
+        end: datetime,
+        category_id: Optional[UUID] = None,
+        model: Optional[str] = None,
+    ) -> list[GenerationRollup]:
+        """期間内の集計行を取得
+
+        Args:
+            start: 開始日時（この時刻を含む1時間から）
+            end: 終了日時（含まない）
+            category_id: カテゴリIDで絞り込み
+            model: モデル名で絞り込み
+
+        Returns:
+            集計行
+        """
+        query = (
+            select(GenerationRollup)
+            .where(GenerationRollup.bucket >= truncate_hour(start))
+            .where(GenerationRollup.bucket < end)
+        )
+        if category_id:
+            query = query.where(GenerationRollup.category_id == category_id)
+        if model:
+            query = query.where(GenerationRollup.model == model)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def last_refreshed_at(self) -> Optional[datetime]:
+        """集計の最終更新日時"""
+        result = await self.session.execute(select(func.max(GenerationRollup.refreshed_at)))
+        return result.scalar_one_or_none()
+
+    async def refresh(self, lateness: timedelta) -> Optional[datetime]:
+        """直近の集計行を生ログから再計算
+
+        最新の集計行の時刻から lateness 前以降の時間を削除し、job_logs から
+        再計算して挿入します（遅れて書き込まれたログ・削除された記事を反映）。
+        job_logs は created_at で絞り込むため、対象の月のパーティションのみを
+        走査します。集計行がない場合はすべてのログを集計します。
+
+        Args:
+            lateness: 再計算する時間の幅（ログの書き込みの遅れの上限）
+
+        Returns:
+            再計算を開始した時刻（ログがない場合は None）
+        """
+        await self.session.execute(select(func.pg_advisory_xact_lock(REFRESH_LOCK_KEY)))
+
+        latest = (
+            await self.session.execute(select(func.max(GenerationRollup.bucket)))
+        ).scalar_one_or_none()
+        if latest is not None:
+            since = truncate_hour(latest - lateness)
+        else:
+            since = (
+                await self.session.execute(
+                    select(func.min(JobLog.created_at)).where(
+                        JobLog.job_type == JobType.GENERATE
+                    )
+                )
+            ).scalar_one_or_none()
+            if since is None:
+                return None
+            since = truncate_hour(since)
+
+        await self.session.execute(
+            delete(GenerationRollup).where(GenerationRollup.bucket >= since)
+        )
+        columns, query = rollup_query(since)
+        await self.session.execute(insert(GenerationRollup).from_select(columns, query))
+        return since
+
+
+def truncate_hour(value: datetime) -> datetime:
+    """UTC の時単位に切り捨て"""
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def rollup_query(since: datetime):
+    """job_logs（GENERATE）を1時間ごとに集計するクエリ
+
+    テンプレートのバージョンはログに記録した生成時点の値を使います。
+    バージョンを記録していない既存のログのみ、テンプレートの現在の
+    バージョンで代用します。トークン数・モデル名を記録していない既存のログは、
+    成功したものに限り記事の metadata の値を使います。
+
+    Returns:
+        INSERT 先の列名と SELECT 文
+    """
+    legacy = JobLog.model.is_(None) & (JobLog.status == JobStatus.SUCCESS)
+
+    def legacy_metadata(key: str):
+        return case((legacy, Article.metadata_[key].astext))
+
+    template_id = func.coalesce(JobLog.prompt_template_id, Article.prompt_template_id)
+    logs = (
+        select(
+            func.date_trunc("hour", JobLog.created_at, "UTC").label("bucket"),
+            Article.category_id,
+            template_id.label("prompt_template_id"),
+            func.coalesce(JobLog.template_version, PromptTemplate.version).label(
+                "template_version"
+            ),
+            func.coalesce(JobLog.model, legacy_metadata("model")).label("model"),
+            JobLog.status,
+            JobLog.duration_ms,
+            func.width_bucket(JobLog.duration_ms, array(DURATION_BUCKETS_MS)).label(
+                "duration_bin"
+            ),
+            func.coalesce(
+                JobLog.input_tokens, legacy_metadata("input_tokens").cast(Integer)
+            ).label("input_tokens"),
+            func.coalesce(
+                JobLog.output_tokens, legacy_metadata("output_tokens").cast(Integer)
+            ).label("output_tokens"),
+        )
+        .select_from(JobLog)
+        .join(Article, Article.id == JobLog.article_id)
+        .outerjoin(PromptTemplate, PromptTemplate.id == template_id)
+        .where(JobLog.job_type == JobType.GENERATE)
+        .where(JobLog.created_at >= since)
+        .subquery("logs")
+    )
+
+    dimensions = [
+        logs.c.bucket,
+        logs.c.category_id,
+        logs.c.prompt_template_id,
+        logs.c.template_version,
+        logs.c.model,
+    ]
+    values = {
+        "id": func.gen_random_uuid(),
+        **{column.name: column for column in dimensions},
+        "job_count": func.count(),
+        "success_count": func.count().filter(logs.c.status == JobStatus.SUCCESS),
+        "failed_count": func.count().filter(logs.c.status == JobStatus.FAILED),
+        "duration_count": func.count(logs.c.duration_ms),
+        "duration_sum_ms": func.coalesce(func.sum(logs.c.duration_ms), 0),
+        "duration_max_ms": func.max(logs.c.duration_ms),
+        "duration_histogram": array([
+            func.count().filter(logs.c.duration_bin == index)
+            for index in range(len(DURATION_BUCKETS_MS) + 1)
+        ]),
+        "input_tokens": func.coalesce(func.sum(logs.c.input_tokens), 0),
+        "output_tokens": func.coalesce(func.sum(logs.c.output_tokens), 0),
+    }
+    query = select(*(value.label(name) for name, value in values.items())).group_by(
+        *dimensions
+    )
+    return list(values), query
@@ -0,0 +1,82 @@
+"""生成分析APIルート"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional, get_args
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+
+from app.features.analytics.application.report import summarize
+from app.features.analytics.domain.schemas import (
+    GenerationAnalyticsResponse,
+    GroupBy,
+    Interval,
+)
+from app.features.analytics.infrastructure.repository import GenerationRollupRepository
+from app.shared.domain.exceptions import ValidationError
+from app.shared.infrastructure.dependencies import ReadOnlyDbSession
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+# 期間の既定値と上限
+DEFAULT_RANGE = timedelta(days=1)
+MAX_RANGE = timedelta(days=366)
+
+
+@router.get("/generation", response_model=GenerationAnalyticsResponse)
+async def generation_analytics(
+    db: ReadOnlyDbSession,
+    start: Optional[datetime] = Query(
+        None, description="開始日時（省略時は end の24時間前）"
+    ),
+    end: Optional[datetime] = Query(None, description="終了日時（省略時は現在時刻）"),
+    group_by: str = Query(
+        "category", description="集計の軸（category, template, model のカンマ区切り）"
+    ),
+    interval: Interval = Query("total", description="期間の単位"),
+    category_id: Optional[UUID] = Query(None, description="カテゴリIDでフィルタ"),
+    model: Optional[str] = Query(None, description="モデル名でフィルタ"),
+):
+    """記事生成の分析
+
+    生成時間（平均・p50・p95・p99・最大）、失敗率、トークン数を集計します。
+    生ログではなく1時間ごとの集計テーブル（ワーカーの定期タスクで更新）から
+    算出するため、直近数分のジョブは含まれない場合があります（refreshed_at）。
+    start は1時間単位に切り捨てます。
+    """
+    end = _utc(end) if end else datetime.now(timezone.utc)
+    start = _utc(start) if start else end - DEFAULT_RANGE
+    if start >= end:
+        raise ValidationError("start must be before end")
+    if end - start > MAX_RANGE:
+        raise ValidationError(f"Range must be at most {MAX_RANGE.days} days")
+    axes = _parse_group_by(group_by)
+
+    repo = GenerationRollupRepository(db)
+    rows = await repo.find_range(start, end, category_id=category_id, model=model)
+    return GenerationAnalyticsResponse(
+        start=start,
+        end=end,
+        interval=interval,
+        group_by=axes,
+        refreshed_at=await repo.last_refreshed_at(),
+        items=summarize(rows, axes, interval),
+    )
+
+
+def _utc(value: datetime) -> datetime:
+    """タイムゾーンのない日時は UTC とみなす"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _parse_group_by(group_by: str) -> list[GroupBy]:
+    """group_by= パラメータを集計の軸のリストに変換
+
+    Raises:
+        ValidationError: 不明な軸が含まれる場合
+    """
+    axes = list(dict.fromkeys(a.strip() for a in group_by.split(",") if a.strip()))
+    unknown = [axis for axis in axes if axis not in get_args(GroupBy)]
+    if unknown:
+        raise ValidationError(f"Unknown group_by: {', '.join(unknown)}")
+    return axes
@@ -0,0 +1,137 @@
+"""生成分析の再集計のテスト"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+
+from app.features.analytics.application.report import histogram_percentile, summarize
+from app.features.analytics.domain.models import DURATION_BUCKETS_MS, GenerationRollup
+from app.features.analytics.infrastructure.repository import rollup_query
+from app.features.analytics.presentation.routes import _parse_group_by
+from app.shared.domain import models  # noqa
+from app.shared.domain.exceptions import ValidationError
+
+CATEGORY_A = uuid4()
+CATEGORY_B = uuid4()
+
+
+def _histogram(**bins):
+    histogram = [0] * (len(DURATION_BUCKETS_MS) + 1)
+    for index, count in bins.items():
+        histogram[int(index.removeprefix("b"))] = count
+    return histogram
+
+
+def _row(hour, category_id, model="gemini", jobs=10, failed=0, histogram=None):
+    histogram = histogram or _histogram(b2=jobs)  # 2000〜3000ms
+    return SimpleNamespace(
+        bucket=datetime(2026, 2, 1, hour, tzinfo=timezone.utc),
+        category_id=category_id,
+        prompt_template_id=None,
+        template_version=None,
+        model=model,
+        job_count=jobs,
+        success_count=jobs - failed,
+        failed_count=failed,
+        duration_count=sum(histogram),
+        duration_sum_ms=sum(histogram) * 2500,
+        duration_max_ms=2900,
+        duration_histogram=histogram,
+        input_tokens=jobs * 100,
+        output_tokens=jobs * 1000,
+    )
+
+
+class TestHistogramPercentile:
+    """histogram_percentile のテスト"""
+
+    def test_interpolates_within_bucket(self):
+        """区間内を線形補間することをテスト"""
+        histogram = _histogram(b0=50, b1=50)  # 0〜1000ms と 1000〜2000ms
+
+        assert histogram_percentile(histogram, 0.25) == 500.0
+        assert histogram_percentile(histogram, 0.50) == 1000.0
+        assert histogram_percentile(histogram, 0.95) == 1900.0
+
+    def test_last_bucket_is_capped_by_max(self):
+        """上限のない最後の区間は最大値で打ち切ることをテスト"""
+        histogram = _histogram(**{f"b{len(DURATION_BUCKETS_MS)}": 10})
+
+        assert histogram_percentile(histogram, 0.99, max_ms=400000) <= 400000
+
+    def test_empty_histogram(self):
+        assert histogram_percentile(_histogram(), 0.5) is None
+
+
+class TestSummarize:
+    """summarize のテスト"""
+
+    def test_groups_by_category_over_total_range(self):
+        """期間全体をカテゴリごとに合算することをテスト"""
+        rows = [
+            _row(0, CATEGORY_A, jobs=10, failed=1),
+            _row(1, CATEGORY_A, jobs=30, failed=3),
+            _row(1, CATEGORY_B, jobs=5),
+        ]
+
+        items = summarize(rows, ["category"], "total")
+
+        assert [item.category_id for item in items] == [CATEGORY_A, CATEGORY_B]
+        first = items[0]
+        assert first.bucket is None
+        assert first.model is None
+        assert (first.jobs, first.failed, first.failure_rate) == (40, 4, 0.1)
+        assert first.input_tokens == 4000
+        assert first.duration.mean_ms == 2500.0
+        assert 2000 <= first.duration.p50_ms <= 3000
+        assert first.duration.max_ms == 2900
+
+    def test_groups_by_hour_and_model(self):
+        """時間 × モデルで合算することをテスト"""
+        rows = [
+            _row(0, CATEGORY_A, model="gemini"),
+            _row(0, CATEGORY_B, model="gemini"),
+            _row(1, CATEGORY_A, model="other"),
+        ]
+
+        items = summarize(rows, ["model"], "hour")
+
+        assert [(item.bucket.hour, item.model, item.jobs) for item in items] == [
+            (0, "gemini", 20),
+            (1, "other", 10),
+        ]
+        assert items[0].category_id is None
+
+
+class TestRollupQuery:
+    """集計クエリのテスト"""
+
+    def test_aggregates_generate_logs_since_window(self):
+        """期間で絞り込んだ GENERATE ログを時間 × 軸で集計することをテスト"""
+        columns, query = rollup_query(datetime(2026, 2, 1, tzinfo=timezone.utc))
+        sql = str(
+            insert(GenerationRollup)
+            .from_select(columns, query)
+            .compile(dialect=postgresql.dialect())
+        )
+
+        assert "job_logs.created_at >=" in sql
+        assert "job_logs.job_type =" in sql
+        assert (
+            "GROUP BY logs.bucket, logs.category_id, logs.prompt_template_id, "
+            "logs.template_version, logs.model"
+        ) in sql
+        # 生成時点のバージョンを使い、未記録の既存ログのみ現在のバージョンで代用
+        assert "coalesce(job_logs.template_version, prompt_templates.version)" in sql
+        assert sql.count("FILTER (WHERE logs.duration_bin =") == len(DURATION_BUCKETS_MS) + 1
+
+
+def test_parse_group_by_rejects_unknown_axis():
+    """不明な集計の軸でエラーになることをテスト"""
+    assert _parse_group_by("model, category,model") == ["model", "category"]
+    with pytest.raises(ValidationError):
+        _parse_group_by("category,keyword")
@@ -1,16 +1,19 @@
 """Articles application layer."""
 from .article_generator import ArticleGenerator, GenerationResult, get_article_generator
+from .html_renderer import refresh_rendered_html
 from .prompt_builder import PromptBuilder, BuiltPrompt, get_prompt_builder
-from .response_parser import ResponseParser, ParsedArticle, get_response_parser
+from .response_parser import ResponseParser, ParsedArticle, Section, get_response_parser
 
 __all__ = [
     "ArticleGenerator",
     "GenerationResult",
     "get_article_generator",
+    "refresh_rendered_html",
     "PromptBuilder",
     "BuiltPrompt",
     "get_prompt_builder",
     "ResponseParser",
     "ParsedArticle",
+    "Section",
     "get_response_parser",
 ]
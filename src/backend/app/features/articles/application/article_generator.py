@@ -12,23 +12,31 @@ This module orchestrates the complete article generation workflow:
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.features.articles.application.html_renderer import refresh_rendered_html
 from app.features.articles.application.prompt_builder import get_prompt_builder
 from app.features.articles.application.response_parser import get_response_parser
 from app.features.articles.domain.models import Article
-from app.features.categories.domain.models import Category
-from app.features.job_logs.domain.models import JobLog
-from app.features.prompt_templates.domain.models import PromptTemplate
+from app.features.categories.infrastructure.repository import CategoryRepository
+from app.features.job_logs.infrastructure.writer import job_log_writer
+from app.features.prompt_templates.domain.schemas import PromptTemplateResponse
+from app.features.prompt_templates.infrastructure.repository import (
+    PromptTemplateRepository,
+)
 from app.features.sheets.infrastructure.google_sheets_service import sheets_service
 from app.shared.domain.enums import ArticleStatus, JobStatus, JobType
 from app.shared.domain.llm.base import LLMConfig
 from app.shared.infrastructure.llm.claude_service import get_claude_service
 
+# Called with an event name and fields, e.g. progress("generated", duration_ms=1200)
+ProgressCallback = Callable[..., Awaitable[Any]]
+
 
 @dataclass
 class GenerationResult:
@@ -68,7 +76,8 @@ class ArticleGenerator:
         self,
         db: AsyncSession,
         article_id: UUID,
-        options: Optional[dict] = None
+        options: Optional[dict] = None,
+        progress: Optional[ProgressCallback] = None
     ) -> GenerationResult:
         """Generate article content using Claude API.
 
@@ -87,6 +96,8 @@ class ArticleGenerator:
             db: Database session
             article_id: UUID of article to generate
             options: Optional generation options (temperature, char_count, etc.)
+            progress: Optional callback notified with a ``generated`` event
+                (LLM call duration) once the Claude response arrives
 
         Returns:
             GenerationResult with success status and metadata
@@ -118,7 +129,12 @@ class ArticleGenerator:
         article.status = ArticleStatus.GENERATING
         await db.flush()
 
+        template = None
+        llm_config = None
         try:
+            # Resolve the model first so failed jobs are logged with it too
+            llm_config = self._build_llm_config(options)
+
             # Step 3: Get prompt template
             template = await self._get_template(db, article)
 
@@ -130,12 +146,17 @@ class ArticleGenerator:
             )
 
             # Step 5: Generate with Claude API
-            llm_config = self._build_llm_config(options)
+            llm_start = datetime.utcnow()
             llm_response = await self.claude_service.generate(
                 built_prompt.system_prompt,
                 built_prompt.user_prompt,
                 llm_config
             )
+            if progress:
+                await progress(
+                    "generated",
+                    duration_ms=int((datetime.utcnow() - llm_start).total_seconds() * 1000)
+                )
 
             # Step 6: Parse and validate
             min_chars = options.get("char_count_min", 2000) if options else 2000
@@ -149,13 +170,16 @@ class ArticleGenerator:
             # Step 7: Update article
             article.title = parsed.title or article.keyword
             article.content = parsed.content
+            refresh_rendered_html(article)
             article.status = (
                 ArticleStatus.REVIEW_PENDING if parsed.is_valid
                 else ArticleStatus.FAILED
             )
             article.prompt_template_id = template.id if template else None
             article.metadata_ = {
+                **(article.metadata_ or {}),
                 "char_count": parsed.char_count,
+                "structure": parsed.structure(),
                 "input_tokens": llm_response.input_tokens,
                 "output_tokens": llm_response.output_tokens,
                 "model": llm_response.model,
@@ -164,13 +188,19 @@ class ArticleGenerator:
             duration_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
 
             # Step 8: Create job log
-            db.add(JobLog(
+            job_log_writer.add(
+                db,
                 article_id=article.id,
                 job_type=JobType.GENERATE,
                 status=JobStatus.SUCCESS if parsed.is_valid else JobStatus.FAILED,
                 error_message="; ".join(parsed.errors) if parsed.errors else None,
-                duration_ms=duration_ms
-            ))
+                duration_ms=duration_ms,
+                prompt_template_id=article.prompt_template_id,
+                template_version=template.version if template else None,
+                model=llm_response.model,
+                input_tokens=llm_response.input_tokens,
+                output_tokens=llm_response.output_tokens
+            )
 
             await db.flush()
 
@@ -188,7 +218,7 @@ class ArticleGenerator:
 
         except Exception as e:
             # Handle generation errors
-            return await self._handle_error(db, article, start, e)
+            return await self._handle_error(db, article, start, e, template, llm_config)
 
     async def _fetch_article(
         self,
@@ -197,6 +227,9 @@ class ArticleGenerator:
     ) -> Optional[Article]:
         """Fetch article from database.
 
+        The current content is loaded as well, since generation
+        replaces it.
+
         Args:
             db: Database session
             article_id: Article UUID
@@ -205,7 +238,9 @@ class ArticleGenerator:
             Article or None if not found
         """
         result = await db.execute(
-            select(Article).where(Article.id == article_id)
+            select(Article)
+            .where(Article.id == article_id)
+            .options(joinedload(Article.current_content))
         )
         return result.scalar_one_or_none()
 
@@ -213,7 +248,7 @@ class ArticleGenerator:
         self,
         db: AsyncSession,
         article: Article
-    ) -> Optional[PromptTemplate]:
+    ) -> Optional[PromptTemplateResponse]:
         """Get prompt template for article.
 
         Priority:
@@ -221,29 +256,24 @@ class ArticleGenerator:
         2. Category's active template
         3. None (uses default prompts)
 
+        Templates are read through the shared reference-data cache.
+
         Args:
             db: Database session
             article: Article to get template for
 
         Returns:
-            PromptTemplate or None
+            Read-only template snapshot or None
         """
+        repo = PromptTemplateRepository(db)
+
         # Check for article-specific template
         if article.prompt_template_id:
-            result = await db.execute(
-                select(PromptTemplate)
-                .where(PromptTemplate.id == article.prompt_template_id)
-            )
-            return result.scalar_one_or_none()
+            return await repo.find_by_id_cached(article.prompt_template_id)
 
         # Check for category's active template
         if article.category_id:
-            result = await db.execute(
-                select(PromptTemplate)
-                .where(PromptTemplate.category_id == article.category_id)
-                .where(PromptTemplate.is_active == True)  # noqa: E712
-            )
-            return result.scalar_one_or_none()
+            return await repo.find_active_by_category_cached(article.category_id)
 
         return None
 
@@ -285,10 +315,9 @@ class ArticleGenerator:
         """
         try:
             # Get category to check for sheet_id
-            result = await db.execute(
-                select(Category).where(Category.id == article.category_id)
+            category = await CategoryRepository(db).find_by_id_cached(
+                article.category_id
             )
-            category = result.scalar_one_or_none()
 
             if category and category.sheet_id:
                 sheets_service.update_article_status(
@@ -306,7 +335,9 @@ class ArticleGenerator:
         db: AsyncSession,
         article: Article,
         start: datetime,
-        error: Exception
+        error: Exception,
+        template: Optional[PromptTemplateResponse] = None,
+        llm_config: Optional[LLMConfig] = None
     ) -> GenerationResult:
         """Handle generation error.
 
@@ -315,6 +346,8 @@ class ArticleGenerator:
             article: Article being generated
             start: Generation start time
             error: Exception that occurred
+            template: Template in use when the error occurred (if resolved)
+            llm_config: LLM configuration in use (if built)
 
         Returns:
             GenerationResult indicating failure
@@ -323,13 +356,17 @@ class ArticleGenerator:
         duration_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
 
         # Create error job log
-        db.add(JobLog(
+        job_log_writer.add(
+            db,
             article_id=article.id,
             job_type=JobType.GENERATE,
             status=JobStatus.FAILED,
             error_message=str(error),
-            duration_ms=duration_ms
-        ))
+            duration_ms=duration_ms,
+            prompt_template_id=template.id if template else article.prompt_template_id,
+            template_version=template.version if template else None,
+            model=llm_config.model if llm_config else None
+        )
 
         await db.flush()
 
@@ -0,0 +1,35 @@
+"""Rendered HTML cache for article content.
+
+The Markdown → HTML conversion is done once when article content is
+written and stored on the current content revision
+(``ArticleContent.content_html``). A revision's Markdown never changes, so
+the stored HTML stays valid until the article gets a new revision. Readers
+(the HTML endpoint, WordPress publishing) reuse the stored HTML and only
+render when it is missing, e.g. for revisions written before the cache
+existed.
+"""
+from typing import Optional
+
+from app.features.articles.domain.models import Article
+from app.shared.infrastructure.services.markdown_converter import markdown_converter
+
+
+def refresh_rendered_html(article: Article) -> Optional[str]:
+    """Get the cached article HTML, rendering it if it is missing.
+
+    Call this whenever ``article.content`` is written, and to read the HTML.
+    ``article.current_content`` must be loaded.
+
+    Args:
+        article: Article whose content was written
+
+    Returns:
+        Rendered HTML, or None if the article has no content
+    """
+    current = article.current_content
+    if current is None or not current.content:
+        return None
+
+    if current.content_html is None:
+        current.content_html = markdown_converter.convert(current.content)
+    return current.content_html
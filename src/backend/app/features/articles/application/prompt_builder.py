@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Optional
 
-from app.features.prompt_templates.domain.models import PromptTemplate
+from app.features.prompt_templates.domain.schemas import PromptTemplateResponse
 
 
 @dataclass
@@ -48,7 +48,7 @@ class PromptBuilder:
 
     def build(
         self,
-        template: Optional[PromptTemplate],
+        template: Optional[PromptTemplateResponse],
         keyword: str,
         options: Optional[dict] = None
     ) -> BuiltPrompt:
@@ -3,9 +3,27 @@
 This module parses LLM responses into structured article data,
 validating content and extracting metadata.
 """
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
+from typing import Optional
+
+# Markup characters excluded from the character count
+# (bold/italic/list markers and inline code/fence backticks)
+_MARKUP_CHARS = ("*", "`")
+
+
+@dataclass
+class Section:
+    """A h2/h3 section of a parsed article.
+
+    Attributes:
+        level: Heading level (2 or 3)
+        heading: Heading text
+        char_count: Character count of the section body (excluding markup)
+    """
+    level: int
+    heading: str
+    char_count: int = 0
 
 
 @dataclass
@@ -15,15 +33,50 @@ class ParsedArticle:
     Attributes:
         title: Extracted article title
         content: Full article content (Markdown)
-        char_count: Character count (excluding markup)
+        char_count: Character count (excluding markup and line breaks)
         is_valid: Whether the article meets validation criteria
         errors: List of validation error messages
+        h2_count: Number of h2 headings
+        h3_count: Number of h3 headings
+        sections: h2/h3 sections in document order
     """
     title: str
     content: str
     char_count: int
     is_valid: bool
     errors: list[str]
+    h2_count: int = 0
+    h3_count: int = 0
+    sections: list[Section] = field(default_factory=list)
+
+    def structure(self) -> dict:
+        """Get the heading structure for storing in ``Article.metadata_``.
+
+        Returns:
+            JSON-serializable heading counts and section lengths
+        """
+        return {
+            "h2_count": self.h2_count,
+            "h3_count": self.h3_count,
+            "sections": [
+                {
+                    "level": section.level,
+                    "heading": section.heading,
+                    "char_count": section.char_count,
+                }
+                for section in self.sections
+            ],
+        }
+
+
+@dataclass
+class _ScanResult:
+    """Intermediate result of a single scan over the content."""
+    title: str = ""
+    char_count: int = 0
+    h2_count: int = 0
+    h3_count: int = 0
+    sections: list[Section] = field(default_factory=list)
 
 
 class ResponseParser:
@@ -60,44 +113,114 @@ class ResponseParser:
             >>> print(result.title)
             AI入門
         """
-        # Remove markdown code block markers
+        # Remove the code fence the response is wrapped in
         content = self._clean_markdown_fences(response)
 
-        # Extract title
-        title = self._extract_title(content)
-
-        # Calculate character count
-        char_count = self._count_characters(content)
+        # Extract title, count characters and record structure in one pass
+        scan = self._scan(content)
 
         # Validate content
-        errors = self._validate(title, char_count, min_chars, max_chars)
+        errors = self._validate(scan.title, scan.char_count, min_chars, max_chars)
 
         return ParsedArticle(
-            title=title,
+            title=scan.title,
             content=content,
-            char_count=char_count,
+            char_count=scan.char_count,
             is_valid=len(errors) == 0,
-            errors=errors
+            errors=errors,
+            h2_count=scan.h2_count,
+            h3_count=scan.h3_count,
+            sections=scan.sections,
         )
 
     def _clean_markdown_fences(self, text: str) -> str:
-        """Remove markdown code block fences.
+        """Remove the markdown code fence wrapping the response.
+
+        Only the opening fence on the first line and the closing fence on
+        the last line are removed, so code blocks inside the article are
+        kept intact.
 
         Args:
-            text: Text possibly containing ```markdown``` fences
+            text: Text possibly wrapped in ```markdown``` fences
 
         Returns:
-            Text with fences removed
+            Text with the wrapping fences removed
         """
-        # Remove opening and closing markdown fences
-        cleaned = re.sub(
-            r"^```(?:markdown)?\n?",
-            "",
-            text,
-            flags=re.MULTILINE
-        )
-        cleaned = re.sub(r"```$", "", cleaned, flags=re.MULTILINE)
-        return cleaned.strip()
+        text = text.strip()
+        if text.startswith("```"):
+            first_break = text.find("\n")
+            if first_break < 0:
+                return ""
+            opening = text[3:first_break].strip()
+            if opening in ("", "markdown", "md"):
+                text = text[first_break + 1:]
+        if text.endswith("```"):
+            last_break = text.rfind("\n")
+            if text[last_break + 1:].strip() == "```":
+                text = text[:max(last_break, 0)]
+        return text.strip()
+
+    def _scan(self, content: str) -> _ScanResult:
+        """Scan the content once.
+
+        Finds the first h1 as the title, counts visible characters and
+        records h2/h3 sections with their body lengths. Visible characters
+        exclude heading markers, ``*``/backtick markup and line breaks.
+        Only heading lines are visited individually; everything else is
+        counted with ``str.count`` over offsets, without copying the text.
+
+        Args:
+            content: Markdown content without wrapping fences
+
+        Returns:
+            Scan result
+        """
+        result = _ScanResult()
+        # Heading markers ("## ") of the whole document / the current section
+        markers = 0
+        section_markers = 0
+        section: Optional[Section] = None
+        section_start = 0
+
+        for start in _heading_starts(content):
+            end = content.find("\n", start)
+            if end < 0:
+                end = len(content)
+            line = content[start:end]
+            level = len(line) - len(line.lstrip("#"))
+            text = line[level:].lstrip()
+            if level > 6 or len(text) == len(line) - level:
+                # "#tag", "#######" and a bare "##" are not headings
+                continue
+
+            marker = len(line) - len(text)
+            markers += marker
+            title = text.strip()
+
+            if level == 1 and title and not result.title:
+                result.title = title
+            if (level == 2 or level == 3) and title:
+                if level == 2:
+                    result.h2_count += 1
+                else:
+                    result.h3_count += 1
+                if section is not None:
+                    section.char_count = (
+                        _visible_length(content, section_start, start) - section_markers
+                    )
+                section = Section(level=level, heading=title)
+                result.sections.append(section)
+                section_start = end
+                section_markers = 0
+            else:
+                section_markers += marker
+
+        result.char_count = _visible_length(content, 0, len(content)) - markers
+        if section is not None:
+            section.char_count = (
+                _visible_length(content, section_start, len(content)) - section_markers
+            )
+        return result
 
     def _extract_title(self, content: str) -> str:
         """Extract title from markdown content.
@@ -110,14 +233,13 @@ class ResponseParser:
         Returns:
             Extracted title or empty string if not found
         """
-        match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        return match.group(1).strip() if match else ""
+        return self._scan(content).title
 
     def _count_characters(self, content: str) -> int:
         """Count characters excluding markdown syntax.
 
-        Removes headings markers, bold/italic markers to get
-        approximate plain text character count.
+        Heading markers, bold/italic/code markers and line breaks are
+        not counted.
 
         Args:
             content: Markdown content
@@ -125,19 +247,7 @@ class ResponseParser:
         Returns:
             Approximate character count
         """
-        # Remove heading markers
-        plain = re.sub(r"^#+\s+", "", content, flags=re.MULTILINE)
-
-        # Remove bold markers
-        plain = re.sub(r"\*\*(.+?)\*\*", r"\1", plain)
-
-        # Remove italic markers
-        plain = re.sub(r"\*(.+?)\*", r"\1", plain)
-
-        # Remove inline code markers
-        plain = re.sub(r"`(.+?)`", r"\1", plain)
-
-        return len(plain)
+        return self._scan(content).char_count
 
     def _validate(
         self,
@@ -171,6 +281,24 @@ class ResponseParser:
         return errors
 
 
+def _heading_starts(content: str):
+    """Yield the offsets of lines starting with "#"."""
+    if content.startswith("#"):
+        yield 0
+    position = content.find("\n#")
+    while position >= 0:
+        yield position + 1
+        position = content.find("\n#", position + 1)
+
+
+def _visible_length(content: str, start: int, end: int) -> int:
+    """Count characters in content[start:end] excluding line breaks and markup."""
+    hidden = content.count("\n", start, end)
+    for char in _MARKUP_CHARS:
+        hidden += content.count(char, start, end)
+    return end - start - hidden
+
+
 @lru_cache
 def get_response_parser() -> ResponseParser:
     """Get singleton instance of ResponseParser.
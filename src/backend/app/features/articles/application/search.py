@@ -0,0 +1,50 @@
+"""Helpers for article search.
+
+Search itself runs in PostgreSQL as an ILIKE substring match backed by
+pg_trgm GIN indexes (see ``ArticleRepository.search``). This module
+renders highlighted titles and snippets from its results.
+"""
+import html
+import re
+from typing import Optional
+
+
+def highlight(text: Optional[str], query: str) -> Optional[str]:
+    """HTML-escape ``text`` and wrap occurrences of ``query`` in <mark>.
+
+    Args:
+        text: Title or content excerpt
+        query: Search text (matched case-insensitively)
+
+    Returns:
+        Escaped HTML, or None if text is None
+    """
+    if text is None:
+        return None
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    parts: list[str] = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return "".join(parts)
+
+
+def snippet(excerpt: Optional[str], query: str, at_start: bool, at_end: bool) -> Optional[str]:
+    """Render a highlighted content snippet with ellipses.
+
+    Args:
+        excerpt: Content excerpt around the first match
+        query: Search text
+        at_start: Whether the excerpt starts at the beginning of the content
+        at_end: Whether the excerpt reaches the end of the content
+
+    Returns:
+        Highlighted snippet, or None if there is no content
+    """
+    if not excerpt:
+        return None
+    body = highlight(" ".join(excerpt.split()), query)
+    return f"{'' if at_start else '…'}{body}{'' if at_end else '…'}"
@@ -4,11 +4,24 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+import zstandard
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.domain.enums import ArticleStatus
+from app.shared.domain.hashing import sha256_hex
 from app.shared.infrastructure.database import Base
 
 if TYPE_CHECKING:
@@ -21,6 +34,21 @@ class Article(Base):
     """記事モデル"""
 
     __tablename__ = "articles"
+    __table_args__ = (
+        # 一覧取得: フィルタ + (created_at, id) 順のキーセットページネーション
+        Index("ix_articles_created_at_id", "created_at", "id"),
+        Index("ix_articles_category_id_created_at_id", "category_id", "created_at", "id"),
+        Index("ix_articles_status_created_at_id", "status", "created_at", "id"),
+        # 同一カテゴリ内のキーワード重複防止（一括作成の ON CONFLICT 対象）
+        Index("uq_articles_category_id_keyword", "category_id", "keyword", unique=True),
+        # 部分一致検索（pg_trgm）
+        Index(
+            "ix_articles_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
@@ -37,10 +65,28 @@ class Article(Base):
     )
     keyword: Mapped[str] = mapped_column(String(200), nullable=False)
     title: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
-    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # 本文は article_contents に版ごとに保存し、現在の版のみを参照
+    current_content_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "article_contents.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_articles_current_content_id",
+        ),
+        nullable=True,
+    )
+    # 最新の版番号（本文未設定の場合は 0）
+    content_revision: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     status: Mapped[ArticleStatus] = mapped_column(
         Enum(ArticleStatus), default=ArticleStatus.PENDING
     )
+    # バッチ生成で生成中として確保した日時（期限切れの確保は再確保できる）
+    generation_started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     wp_post_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     wp_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     wp_published_at: Mapped[Optional[datetime]] = mapped_column(
@@ -64,3 +110,117 @@ class Article(Base):
     job_logs: Mapped[list["JobLog"]] = relationship(
         "JobLog", back_populates="article", cascade="all, delete-orphan"
     )
+    # 本文は大きいため既定では読み込まない。本文を読み書きする場合は
+    # joinedload(Article.current_content) で明示的に読み込む
+    current_content: Mapped[Optional["ArticleContent"]] = relationship(
+        "ArticleContent",
+        foreign_keys=[current_content_id],
+        post_update=True,
+        lazy="raise",
+    )
+
+    @property
+    def content(self) -> Optional[str]:
+        """現在の版の本文（Markdown）"""
+        return self.current_content.content if self.current_content else None
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        """本文を設定
+
+        現在の版と同じ本文の場合は何もしません。異なる場合は新しい版を作成し、
+        それまでの版の本文は zstd で圧縮して履歴として残します。
+        """
+        current = self.current_content
+        if value is None:
+            if current is not None:
+                current.archive()
+            self.current_content = None
+            return
+
+        digest = sha256_hex(value)
+        if current is not None:
+            if current.content_hash == digest:
+                return
+            current.archive()
+
+        self.content_revision = (self.content_revision or 0) + 1
+        self.current_content = ArticleContent(
+            article=self,
+            revision=self.content_revision,
+            content_hash=digest,
+            content=value,
+            char_count=len(value),
+        )
+
+
+# 履歴の本文の zstd 圧縮レベル
+ZSTD_LEVEL = 10
+
+_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+class ArticleContent(Base):
+    """記事本文の版
+
+    現在の版は検索・抜粋のため本文を content に平文で保持し、現在の版でなくなった
+    時点で zstd で圧縮して body に移します。content_hash で現在の版と同一の本文を
+    判定します。content_html は現在の版の本文から生成したHTMLです。
+    """
+
+    __tablename__ = "article_contents"
+    __table_args__ = (
+        Index(
+            "uq_article_contents_article_id_revision",
+            "article_id",
+            "revision",
+            unique=True,
+        ),
+        # 現在の版の本文の部分一致検索（pg_trgm）
+        Index(
+            "ix_article_contents_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_where=text("content IS NOT NULL"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    article_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    revision: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # 現在の版の本文（平文）
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # 過去の版の本文（zstd 圧縮）
+    body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    # 現在の版の本文から生成したHTML（未生成・過去の版は NULL）
+    content_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    char_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # リレーション
+    article: Mapped["Article"] = relationship("Article", foreign_keys=[article_id])
+
+    @property
+    def text(self) -> str:
+        """本文（圧縮されている場合は展開）"""
+        if self.content is not None:
+            return self.content
+        return _decompressor.decompress(self.body).decode("utf-8")
+
+    def archive(self) -> None:
+        """本文を圧縮して履歴に移す（生成済みのHTMLは破棄）"""
+        if self.content is not None:
+            self.body = _compressor.compress(self.content.encode("utf-8"))
+            self.content = None
+        self.content_html = None
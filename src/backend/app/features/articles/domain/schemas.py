@@ -1,10 +1,10 @@
 """記事Pydanticスキーマ"""
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from app.shared.domain.enums import ArticleStatus
 
@@ -17,6 +17,26 @@ class ArticleCreate(BaseModel):
     prompt_template_id: Optional[UUID] = None
 
 
+class ArticleBulkCreate(BaseModel):
+    """記事一括作成リクエスト"""
+
+    category_id: UUID
+    keywords: list[
+        Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+    ] = Field(..., min_length=1, max_length=50000)
+    prompt_template_id: Optional[UUID] = None
+
+
+class ArticleBulkCreateResponse(BaseModel):
+    """記事一括作成レスポンス"""
+
+    requested: int = Field(..., description="リクエストされたキーワード数")
+    duplicates: int = Field(..., description="リクエスト内で重複していたキーワード数")
+    created: int = Field(..., description="作成した記事数")
+    skipped: int = Field(..., description="カテゴリ内に既に存在したため作成しなかった記事数")
+    ids: list[UUID] = Field(..., description="作成した記事のID")
+
+
 class ArticleUpdate(BaseModel):
     """記事更新リクエスト"""
 
@@ -26,8 +46,8 @@ class ArticleUpdate(BaseModel):
     status: Optional[ArticleStatus] = None
 
 
-class ArticleResponse(BaseModel):
-    """記事レスポンス"""
+class ArticleSummaryResponse(BaseModel):
+    """記事サマリーレスポンス（本文・メタデータを含まない）"""
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -36,21 +56,106 @@ class ArticleResponse(BaseModel):
     prompt_template_id: Optional[UUID] = None
     keyword: str
     title: Optional[str] = None
-    content: Optional[str] = None
     status: ArticleStatus
     wp_post_id: Optional[int] = None
     wp_url: Optional[str] = None
     wp_published_at: Optional[datetime] = None
-    metadata_: Optional[dict] = None
     created_at: datetime
     updated_at: datetime
 
 
+class ArticleResponse(ArticleSummaryResponse):
+    """記事レスポンス"""
+
+    content: Optional[str] = None
+    metadata_: Optional[dict] = None
+
+
+class ArticleListItem(BaseModel):
+    """記事一覧の項目
+
+    fields= で指定したフィールドのみが設定されます（未指定時はサマリーのフィールド）。
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+    prompt_template_id: Optional[UUID] = None
+    keyword: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    status: Optional[ArticleStatus] = None
+    wp_post_id: Optional[int] = None
+    wp_url: Optional[str] = None
+    wp_published_at: Optional[datetime] = None
+    metadata_: Optional[dict] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ArticleRevisionSummary(BaseModel):
+    """記事本文の版（本文を含まない）"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    revision: int
+    content_hash: str
+    char_count: int
+    created_at: datetime
+
+
+class ArticleRevisionResponse(ArticleRevisionSummary):
+    """記事本文の版"""
+
+    content: str
+
+
+class ArticleRevisionListResponse(BaseModel):
+    """記事本文の版の一覧レスポンス"""
+
+    current_revision: Optional[int] = Field(
+        None, description="現在の版（本文が未設定の場合は None）"
+    )
+    items: list[ArticleRevisionSummary]
+
+
+# 一覧で選択可能なフィールドと既定のフィールド
+ARTICLE_FIELDS = tuple(ArticleResponse.model_fields)
+ARTICLE_SUMMARY_FIELDS = tuple(ArticleSummaryResponse.model_fields)
+
+
 class ArticleListResponse(BaseModel):
-    """記事一覧レスポンス"""
+    """記事一覧レスポンス
+
+    total は include_total 指定時のみ、page はページ番号方式の場合のみ設定されます。
+    next_cursor は次ページが存在する場合に設定されます。
+    """
+
+    items: list[ArticleListItem]
+    total: Optional[int] = None
+    page: Optional[int] = None
+    per_page: int
+    next_cursor: Optional[str] = None
+
+
+class ArticleSearchItem(ArticleSummaryResponse):
+    """記事検索結果の項目"""
+
+    rank: float = Field(..., description="関連度（タイトル一致 > 本文一致、タイトル類似度で加点）")
+    title_highlight: Optional[str] = Field(
+        None, description="一致箇所を<mark>で囲んだタイトル（HTMLエスケープ済み）"
+    )
+    snippet: Optional[str] = Field(
+        None, description="本文の一致箇所周辺を<mark>で囲んだ抜粋（HTMLエスケープ済み）"
+    )
+
+
+class ArticleSearchResponse(BaseModel):
+    """記事検索レスポンス"""
 
-    items: list[ArticleResponse]
-    total: int
+    items: list[ArticleSearchItem]
+    q: str
     page: int
     per_page: int
 
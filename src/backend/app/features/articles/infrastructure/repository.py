@@ -1,13 +1,49 @@
 """記事リポジトリ"""
 
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    case,
+    func,
+    inspect,
+    or_,
+    select,
+    tuple_,
+    union,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.features.articles.domain.models import Article
+from app.features.articles.domain.models import Article, ArticleContent
 from app.shared.domain.enums import ArticleStatus
+from app.shared.infrastructure.pagination import CursorKey
+
+# 一括作成で1文に含める行数（1行あたり5パラメータ）
+BULK_INSERT_CHUNK_SIZE = 5000
+
+# 検索結果の本文抜粋で、最初の一致箇所の前後に含める文字数
+SNIPPET_RADIUS = 60
+
+
+def like_pattern(query: str) -> str:
+    """query を部分一致で検索する LIKE パターン
+
+    Args:
+        query: 検索文字列
+
+    Returns:
+        ワイルドカードをエスケープしたパターン（エスケープ文字はバックスラッシュ）
+    """
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class ArticleRepository:
@@ -22,35 +58,239 @@ class ArticleRepository:
         status: Optional[ArticleStatus] = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[list[Article], int]:
-        """記事一覧取得（フィルタ・ページネーション対応）"""
-        query = select(Article)
-        count_query = select(func.count(Article.id))
+        after: Optional[CursorKey] = None,
+        with_total: bool = True,
+    ) -> tuple[list[Article], Optional[int]]:
+        """記事一覧取得（フィルタ・ページネーション対応）
 
-        # フィルタ適用
-        if category_id:
-            query = query.where(Article.category_id == category_id)
-            count_query = count_query.where(Article.category_id == category_id)
-        if status:
-            query = query.where(Article.status == status)
-            count_query = count_query.where(Article.status == status)
+        (created_at, id) の降順で取得します。after を指定した場合は
+        そのキーより後ろの行をキーセット方式で取得します（offset は無視）。
+        with_total が False の場合は count(*) を実行せず総数は None になります。
+        """
+        query = self._list_query(select(Article), category_id, status, offset, limit, after)
+        total = await self._count(category_id, status) if with_total else None
+        result = await self.session.execute(query)
+        return list(result.scalars().all()), total
+
+    async def find_all_fields(
+        self,
+        fields: Sequence[str],
+        category_id: Optional[UUID] = None,
+        status: Optional[ArticleStatus] = None,
+        offset: int = 0,
+        limit: int = 20,
+        after: Optional[CursorKey] = None,
+        with_total: bool = True,
+    ) -> tuple[list[RowMapping], Optional[int]]:
+        """指定したカラムのみで記事一覧取得
+
+        ORMオブジェクトを生成せず、指定カラムだけをSELECTします。
+        本文などの大きなカラムを読み込まないため、一覧の取得コストが
+        記事の長さに依存しません。条件・順序は find_all と同じです。
 
-        # 総数取得
-        total = (await self.session.execute(count_query)).scalar()
+        Args:
+            fields: 取得する属性名（例: "id", "title", "metadata_"）
+            その他: find_all と同じ
 
-        # ページネーション適用
-        query = (
-            query.order_by(Article.created_at.desc()).offset(offset).limit(limit)
+        Returns:
+            属性名をキーとする行のリストと総数
+        """
+        query = self._list_query(
+            self._select_fields(fields), category_id, status, offset, limit, after
         )
+        total = await self._count(category_id, status) if with_total else None
         result = await self.session.execute(query)
-        articles = list(result.scalars().all())
+        return list(result.mappings().all()), total
+
+    async def search(
+        self,
+        query: str,
+        fields: Sequence[str],
+        category_id: Optional[UUID] = None,
+        status: Optional[ArticleStatus] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[RowMapping]:
+        """タイトル・本文の部分一致検索
+
+        ILIKE による部分一致で検索します（タイトル・本文それぞれの pg_trgm の
+        GIN インデックスで一致した記事IDの UNION）。
+        タイトル一致を本文一致より上位とし、タイトルとの類似度で順位付けします。
+        本文は全体を返さず、最初の一致箇所の前後のみを切り出して返します。
+        本文は現在の版（article_contents）を検索します。
+
+        Args:
+            query: 検索文字列
+            fields: 結果に含める記事の属性名
+            category_id: カテゴリIDでフィルタ
+            status: ステータスでフィルタ
+            offset: 取得開始位置
+            limit: 取得件数
+
+        Returns:
+            fields の各属性と rank, excerpt, excerpt_start, content_length を持つ行
+        """
+        statement = self.search_query(query, fields, category_id, status, offset, limit)
+        result = await self.session.execute(statement)
+        return list(result.mappings().all())
+
+    @classmethod
+    def search_query(
+        cls,
+        query: str,
+        fields: Sequence[str],
+        category_id: Optional[UUID] = None,
+        status: Optional[ArticleStatus] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Select:
+        """search() の SELECT 文（引数は search() と同じ）"""
+        pattern = like_pattern(query)
+        # インデックス（ix_articles_title_trgm）の式と同じ列をそのまま使う
+        title_match = Article.title.ilike(pattern, escape="\\")
+        content = ArticleContent.content
+        content_match = content.ilike(pattern, escape="\\")
+
+        # タイトルと本文は別テーブルのため、OR で結合すると両方のインデックスを
+        # 使えない。それぞれのインデックスで一致した記事IDの UNION を結合する
+        # （本文は現在の版のみ平文で保持するため ix_article_contents_content_trgm）
+        matches = union(
+            select(Article.id.label("id")).where(title_match),
+            select(ArticleContent.article_id.label("id")).where(
+                content.is_not(None), content_match
+            ),
+        ).subquery("matches")
+
+        rank = (
+            case((title_match, 2.0), else_=0.0)
+            + case((content_match, 1.0), else_=0.0)
+            + func.word_similarity(query, func.coalesce(Article.title, ""))
+        ).label("rank")
+
+        position = func.strpos(func.lower(content), query.lower())
+        excerpt_start = func.greatest(position - SNIPPET_RADIUS, 1)
+
+        statement = (
+            cls._select_fields(fields, join_content=True)
+            .add_columns(
+                rank,
+                func.substr(
+                    content, excerpt_start, SNIPPET_RADIUS * 2 + len(query)
+                ).label("excerpt"),
+                excerpt_start.label("excerpt_start"),
+                func.char_length(content).label("content_length"),
+            )
+            .join(matches, matches.c.id == Article.id)
+        )
+
+        return (
+            cls._filter(statement, category_id, status)
+            .order_by(rank.desc(), Article.created_at.desc(), Article.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+    async def stream_keys(
+        self,
+        category_id: Optional[UUID] = None,
+        status: Optional[ArticleStatus] = None,
+        created_before: Optional[datetime] = None,
+        after: Optional[CursorKey] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[list[CursorKey]]:
+        """条件に一致する記事のキー (created_at, id) を chunk_size 件ずつ取得
+
+        サーバーサイドカーソルで (created_at, id) の昇順（古い順）に読み進めるため、
+        一致する件数にかかわらずメモリに保持するのは1チャンク分だけです。
+        セッションのトランザクションはすべて読み終えるまで開いたままになります。
+
+        Args:
+            category_id: カテゴリIDで絞り込み
+            status: ステータスで絞り込み
+            created_before: この日時より前に作成された記事に絞り込み
+            after: このキーより後の記事から取得（前回の続き）
+            limit: 取得する最大件数（None は無制限）
+            chunk_size: 1回に取得する件数
+
+        Yields:
+            キーのリスト（最後以外は chunk_size 件）
+        """
+        query = self._filter(select(Article.created_at, Article.id), category_id, status)
+        if created_before:
+            query = query.where(Article.created_at < created_before)
+        if after:
+            query = query.where(tuple_(Article.created_at, Article.id) > after)
+        query = query.order_by(Article.created_at, Article.id).limit(limit)
+
+        result = await self.session.stream(
+            query, execution_options={"yield_per": chunk_size}
+        )
+        try:
+            async for rows in result.partitions(chunk_size):
+                yield [(row.created_at, row.id) for row in rows]
+        finally:
+            await result.close()
+
+    async def claim_for_generation(
+        self, article_ids: Sequence[UUID], lease: timedelta
+    ) -> list[UUID]:
+        """生成中でない記事を生成中（GENERATING）にして確保
+
+        生成待ちの記事を重複してエンキューしないよう、エンキュー前に確保し、
+        コミットしてからエンキューします。並行するリクエストが同じ記事を確保
+        しようとした場合、後のリクエストは先のトランザクションの終了を待って
+        再評価されるため、同じ記事を確保できるのは1つだけです。
 
-        return articles, total
+        確保から lease を過ぎても生成中のままの記事（ジョブのタイムアウト・
+        キャンセル・ワーカーの停止で取り残されたもの）と、確保日時のない
+        生成中の記事は再確保できます。
 
-    async def find_by_id(self, article_id: UUID) -> Optional[Article]:
-        """IDで記事取得"""
+        Args:
+            article_ids: 対象記事IDリスト
+            lease: 確保の有効期間
+
+        Returns:
+            確保できた記事IDリスト（article_ids の順序）
+        """
+        if not article_ids:
+            return []
+        result = await self.session.execute(
+            update(Article)
+            .where(
+                Article.id.in_(article_ids),
+                or_(
+                    Article.status != ArticleStatus.GENERATING,
+                    Article.generation_started_at.is_(None),
+                    Article.generation_started_at < func.now() - lease,
+                ),
+            )
+            .values(status=ArticleStatus.GENERATING, generation_started_at=func.now())
+            .returning(Article.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = set(result.scalars().all())
+        return [article_id for article_id in article_ids if article_id in claimed]
+
+    async def find_by_id(
+        self, article_id: UUID, with_content: bool = False
+    ) -> Optional[Article]:
+        """IDで記事取得
+
+        Args:
+            article_id: 記事ID
+            with_content: 本文（現在の版）も読み込むか。本文を読み書きする場合は True
+        """
+        query = select(Article).where(Article.id == article_id)
+        if with_content:
+            query = query.options(joinedload(Article.current_content))
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def find_updated_at(self, article_id: UUID) -> Optional[datetime]:
+        """IDで記事の更新日時のみ取得（条件付きGETの検証用）"""
         result = await self.session.execute(
-            select(Article).where(Article.id == article_id)
+            select(Article.updated_at).where(Article.id == article_id)
         )
         return result.scalar_one_or_none()
 
@@ -59,8 +299,54 @@ class ArticleRepository:
         self.session.add(article)
         await self.session.flush()
         await self.session.refresh(article)
+        if "current_content" in inspect(article).unloaded:
+            # 本文を指定せずに作成した記事には版がないため、読み込まずに None とする
+            set_committed_value(article, "current_content", None)
         return article
 
+    async def bulk_create(
+        self,
+        category_id: UUID,
+        keywords: Sequence[str],
+        prompt_template_id: Optional[UUID] = None,
+    ) -> list[UUID]:
+        """記事一括作成
+
+        複数行の INSERT ... VALUES で作成し、カテゴリ内に既に存在する
+        キーワードは ON CONFLICT DO NOTHING でスキップします。
+        バインドパラメータ数の上限（32767）を超えないよう
+        BULK_INSERT_CHUNK_SIZE 行ごとに1文を発行します。
+
+        Args:
+            category_id: カテゴリID
+            keywords: 重複を除いたキーワード
+            prompt_template_id: プロンプトテンプレートID
+
+        Returns:
+            作成した記事のID
+        """
+        created: list[UUID] = []
+        for start in range(0, len(keywords), BULK_INSERT_CHUNK_SIZE):
+            rows = [
+                {
+                    "id": uuid4(),
+                    "category_id": category_id,
+                    "prompt_template_id": prompt_template_id,
+                    "keyword": keyword,
+                    "status": ArticleStatus.PENDING,
+                }
+                for keyword in keywords[start:start + BULK_INSERT_CHUNK_SIZE]
+            ]
+            query = (
+                insert(Article)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["category_id", "keyword"])
+                .returning(Article.id)
+            )
+            result = await self.session.execute(query)
+            created.extend(result.scalars().all())
+        return created
+
     async def update(self, article: Article) -> Article:
         """記事更新"""
         await self.session.flush()
@@ -71,3 +357,78 @@ class ArticleRepository:
         """記事削除"""
         await self.session.delete(article)
         await self.session.flush()
+
+    async def find_revisions(self, article_id: UUID) -> list[ArticleContent]:
+        """記事本文の版の一覧取得（新しい順、本文は読み込まない）"""
+        result = await self.session.execute(
+            select(ArticleContent)
+            .options(defer(ArticleContent.content), defer(ArticleContent.body))
+            .where(ArticleContent.article_id == article_id)
+            .order_by(ArticleContent.revision.desc())
+        )
+        return list(result.scalars().all())
+
+    async def find_revision(
+        self, article_id: UUID, revision: int
+    ) -> Optional[ArticleContent]:
+        """記事本文の指定した版を取得"""
+        result = await self.session.execute(
+            select(ArticleContent)
+            .where(ArticleContent.article_id == article_id)
+            .where(ArticleContent.revision == revision)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _select_fields(fields: Sequence[str], join_content: bool = False) -> Select:
+        """指定した属性のみを SELECT するクエリ
+
+        本文（content）は現在の版（article_contents）を結合して取得します。
+        """
+        columns = [
+            ArticleContent.content.label(field)
+            if field == "content"
+            else getattr(Article, field).label(field)
+            for field in fields
+        ]
+        query = select(*columns).select_from(Article)
+        if join_content or "content" in fields:
+            query = query.outerjoin(
+                ArticleContent, Article.current_content_id == ArticleContent.id
+            )
+        return query
+
+    def _list_query(
+        self,
+        query: Select,
+        category_id: Optional[UUID],
+        status: Optional[ArticleStatus],
+        offset: int,
+        limit: int,
+        after: Optional[CursorKey],
+    ) -> Select:
+        """一覧クエリにフィルタ・順序・ページネーションを適用"""
+        query = self._filter(query, category_id, status)
+        if after:
+            query = query.where(tuple_(Article.created_at, Article.id) < after)
+        else:
+            query = query.offset(offset)
+        return query.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit)
+
+    async def _count(
+        self, category_id: Optional[UUID], status: Optional[ArticleStatus]
+    ) -> int:
+        """フィルタ条件に一致する記事数を取得"""
+        query = self._filter(select(func.count(Article.id)), category_id, status)
+        return (await self.session.execute(query)).scalar()
+
+    @staticmethod
+    def _filter(
+        query: Select, category_id: Optional[UUID], status: Optional[ArticleStatus]
+    ) -> Select:
+        """フィルタ適用"""
+        if category_id:
+            query = query.where(Article.category_id == category_id)
+        if status:
+            query = query.where(Article.status == status)
+        return query
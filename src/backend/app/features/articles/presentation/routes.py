@@ -4,49 +4,161 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Query, status
+from fastapi.responses import HTMLResponse
 
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
+from app.features.articles.application.html_renderer import refresh_rendered_html
+from app.features.articles.application.search import highlight, snippet
 from app.features.articles.domain.models import Article
 from app.features.articles.domain.schemas import (
+    ARTICLE_FIELDS,
+    ARTICLE_SUMMARY_FIELDS,
+    ArticleBulkCreate,
+    ArticleBulkCreateResponse,
     ArticleCreate,
+    ArticleListItem,
     ArticleListResponse,
     ArticleResponse,
+    ArticleRevisionListResponse,
+    ArticleRevisionResponse,
+    ArticleRevisionSummary,
+    ArticleSearchItem,
+    ArticleSearchResponse,
     ArticleUpdate,
 )
 from app.features.articles.infrastructure.repository import ArticleRepository
-from app.features.categories.domain.models import Category
 from app.features.categories.infrastructure.repository import CategoryRepository
 from app.features.sheets.infrastructure.google_sheets_service import sheets_service
 from app.shared.domain.enums import ArticleStatus
-from app.shared.domain.exceptions import NotFoundError, ValidationError
-from app.shared.infrastructure.dependencies import DbSession, Pagination
+from app.shared.domain.exceptions import ConflictError, NotFoundError, ValidationError
+from app.shared.infrastructure.conditional import row_etag, rows_etag, validator_headers
+from app.shared.infrastructure.dependencies import (
+    Conditional,
+    DbSession,
+    Pagination,
+    ReadOnlyDbSession,
+)
+from app.shared.infrastructure.pagination import encode_cursor
+from app.shared.infrastructure.responses import ModelResponse
 
 router = APIRouter(prefix="/articles", tags=["Articles"])
 
 
 @router.get("", response_model=ArticleListResponse)
 async def list_articles(
-    db: DbSession,
+    db: ReadOnlyDbSession,
     pagination: Pagination,
+    conditional: Conditional,
     category_id: Optional[UUID] = Query(None, description="カテゴリIDでフィルタ"),
     status: Optional[ArticleStatus] = Query(None, description="ステータスでフィルタ"),
+    fields: Optional[str] = Query(
+        None,
+        description="取得するフィールド（カンマ区切り）。省略時は本文・メタデータを除くサマリー",
+    ),
 ):
-    """記事一覧取得"""
+    """記事一覧取得
+
+    指定されたフィールドのカラムのみをSELECTします（既定では content と metadata_ を
+    読み込みません）。id と created_at はページネーションのため常に含まれます。
+    next_cursor を cursor に指定すると、OFFSET を使わずに次ページを取得します。
+    総件数は include_total=true の場合のみ計算します（ページ番号方式では既定で計算）。
+    ETag は返却する行の id・updated_at と総数・次ページの有無から生成する
+    弱いETagで、If-None-Match が一致する場合はレスポンスを構築せずに 304 を
+    返却します。
+    """
+    selected = _parse_fields(fields)
+    # ETag の生成のため updated_at は常に取得
+    columns = selected if "updated_at" in selected else [*selected, "updated_at"]
+
     repo = ArticleRepository(db)
-    articles, total = await repo.find_all(
+    # 次ページの有無を判定するため1件多く取得
+    rows, total = await repo.find_all_fields(
+        columns,
         category_id=category_id,
         status=status,
         offset=pagination.offset,
-        limit=pagination.per_page,
+        limit=pagination.per_page + 1,
+        after=pagination.cursor,
+        with_total=pagination.include_total,
     )
 
-    return ArticleListResponse(
-        items=[ArticleResponse.model_validate(a) for a in articles],
+    has_more = len(rows) > pagination.per_page
+    rows = rows[:pagination.per_page]
+
+    etag = rows_etag(((row["id"], row["updated_at"]) for row in rows), total, has_more)
+    not_modified = conditional.not_modified(etag)
+    if not_modified:
+        return not_modified
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    # DBから取得した値は型が確定しているため検証せずにモデルを構築
+    response = ArticleListResponse.model_construct(
+        items=[
+            ArticleListItem.model_construct(**{field: row[field] for field in selected})
+            for row in rows
+        ],
         total=total,
         page=pagination.page,
         per_page=pagination.per_page,
+        next_cursor=next_cursor,
     )
+    return ModelResponse(response, headers=validator_headers(etag), exclude_unset=True)
+
+
+@router.get("/search", response_model=ArticleSearchResponse)
+async def search_articles(
+    db: ReadOnlyDbSession,
+    q: str = Query(..., min_length=1, max_length=200, description="検索文字列"),
+    category_id: Optional[UUID] = Query(None, description="カテゴリIDでフィルタ"),
+    status: Optional[ArticleStatus] = Query(None, description="ステータスでフィルタ"),
+    page: int = Query(1, ge=1, description="ページ番号"),
+    per_page: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
+):
+    """記事検索
+
+    タイトル・本文を部分一致で検索し、関連度順に返却します。
+    一致箇所を<mark>で囲んだタイトルと本文の抜粋を含みます。
+    3文字以上の検索文字列でインデックスが有効に使われます。
+    """
+    q = q.strip()
+    if not q:
+        raise ValidationError("Search query is empty")
+
+    repo = ArticleRepository(db)
+    rows = await repo.search(
+        q,
+        ARTICLE_SUMMARY_FIELDS,
+        category_id=category_id,
+        status=status,
+        offset=(page - 1) * per_page,
+        limit=per_page,
+    )
+
+    items = []
+    for row in rows:
+        excerpt = row["excerpt"]
+        start = row["excerpt_start"] or 1
+        items.append(
+            ArticleSearchItem(
+                **{field: row[field] for field in ARTICLE_SUMMARY_FIELDS},
+                rank=row["rank"],
+                title_highlight=highlight(row["title"], q),
+                snippet=snippet(
+                    excerpt,
+                    q,
+                    at_start=start <= 1,
+                    at_end=excerpt is not None
+                    and start - 1 + len(excerpt) >= (row["content_length"] or 0),
+                ),
+            )
+        )
+
+    return ArticleSearchResponse(items=items, q=q, page=page, per_page=per_page)
 
 
 @router.post("", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
@@ -54,32 +166,149 @@ async def create_article(data: ArticleCreate, db: DbSession):
     """記事作成"""
     # カテゴリ存在確認
     category_repo = CategoryRepository(db)
-    category = await category_repo.find_by_id(data.category_id)
+    category = await category_repo.find_by_id_cached(data.category_id)
     if not category:
         raise NotFoundError("Category", str(data.category_id))
 
     # 記事作成
     article_repo = ArticleRepository(db)
     article = Article(**data.model_dump())
-    created = await article_repo.create(article)
+    try:
+        created = await article_repo.create(article)
+    except IntegrityError:
+        raise ConflictError(f"Article already exists: {data.keyword}")
     return created
 
 
+@router.post(
+    "/bulk",
+    response_model=ArticleBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_articles_bulk(data: ArticleBulkCreate, db: DbSession):
+    """記事一括作成
+
+    1カテゴリに対して複数キーワードの記事をまとめて作成します。
+    リクエスト内の重複は除外し、カテゴリ内に既に存在するキーワードはスキップします。
+    """
+    category_repo = CategoryRepository(db)
+    category = await category_repo.find_by_id_cached(data.category_id)
+    if not category:
+        raise NotFoundError("Category", str(data.category_id))
+
+    keywords = list(dict.fromkeys(data.keywords))
+
+    article_repo = ArticleRepository(db)
+    ids = await article_repo.bulk_create(
+        data.category_id, keywords, data.prompt_template_id
+    )
+
+    return ArticleBulkCreateResponse(
+        requested=len(data.keywords),
+        duplicates=len(data.keywords) - len(keywords),
+        created=len(ids),
+        skipped=len(keywords) - len(ids),
+        ids=ids,
+    )
+
+
 @router.get("/{article_id}", response_model=ArticleResponse)
-async def get_article(article_id: UUID, db: DbSession):
-    """記事取得"""
+async def get_article(
+    article_id: UUID, db: ReadOnlyDbSession, conditional: Conditional
+):
+    """記事取得
+
+    ETag・Last-Modified は記事の更新日時から生成します。If-None-Match /
+    If-Modified-Since が一致する場合は、本文を読み込まずに 304 を返却します。
+    """
+    repo = ArticleRepository(db)
+    updated_at = await repo.find_updated_at(article_id)
+    if updated_at is None:
+        raise NotFoundError("Article", str(article_id))
+    not_modified = conditional.not_modified(row_etag(article_id, updated_at), updated_at)
+    if not_modified:
+        return not_modified
+
+    article = await repo.find_by_id(article_id, with_content=True)
+    if not article:
+        raise NotFoundError("Article", str(article_id))
+    return ModelResponse(
+        ArticleResponse.model_validate(article),
+        headers=validator_headers(
+            row_etag(article.id, article.updated_at), article.updated_at
+        ),
+    )
+
+
+@router.get("/{article_id}/html", response_class=HTMLResponse)
+async def get_article_html(
+    article_id: UUID,
+    db: DbSession,
+    conditional: Conditional,
+):
+    """記事本文HTML取得
+
+    記事の保存時に生成済みのHTMLを返却します（未生成の場合はここで生成して保存）。
+    ETag はHTMLの生成元（現在の版）のMarkdownのハッシュで、If-None-Match が一致する場合は
+    304 を返却します。
+    """
+    repo = ArticleRepository(db)
+    article = await repo.find_by_id(article_id, with_content=True)
+    if not article:
+        raise NotFoundError("Article", str(article_id))
+
+    html = refresh_rendered_html(article)
+    if html is None:
+        raise ValidationError("Article has no content")
+
+    etag = f'"{article.current_content.content_hash}"'
+    not_modified = conditional.not_modified(etag)
+    if not_modified:
+        return not_modified
+
+    return HTMLResponse(content=html, headers=validator_headers(etag))
+
+
+@router.get("/{article_id}/revisions", response_model=ArticleRevisionListResponse)
+async def list_article_revisions(article_id: UUID, db: ReadOnlyDbSession):
+    """記事本文の版の一覧取得（新しい順）"""
     repo = ArticleRepository(db)
     article = await repo.find_by_id(article_id)
     if not article:
         raise NotFoundError("Article", str(article_id))
-    return article
+
+    revisions = await repo.find_revisions(article_id)
+    return ArticleRevisionListResponse(
+        current_revision=(
+            article.content_revision if article.current_content_id else None
+        ),
+        items=[ArticleRevisionSummary.model_validate(r) for r in revisions],
+    )
+
+
+@router.get(
+    "/{article_id}/revisions/{revision}", response_model=ArticleRevisionResponse
+)
+async def get_article_revision(article_id: UUID, revision: int, db: ReadOnlyDbSession):
+    """記事本文の指定した版を取得（過去の版は展開して返却）"""
+    repo = ArticleRepository(db)
+    content = await repo.find_revision(article_id, revision)
+    if not content:
+        raise NotFoundError("Article revision", f"{article_id}@{revision}")
+    return ArticleRevisionResponse(
+        revision=content.revision,
+        content_hash=content.content_hash,
+        char_count=content.char_count,
+        created_at=content.created_at,
+        content=content.text,
+    )
 
 
 @router.patch("/{article_id}", response_model=ArticleResponse)
 async def update_article(article_id: UUID, data: ArticleUpdate, db: DbSession):
     """記事更新"""
     repo = ArticleRepository(db)
-    article = await repo.find_by_id(article_id)
+    article = await repo.find_by_id(article_id, with_content=True)
     if not article:
         raise NotFoundError("Article", str(article_id))
 
@@ -87,6 +316,8 @@ async def update_article(article_id: UUID, data: ArticleUpdate, db: DbSession):
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(article, field, value)
+    if "content" in update_data:
+        refresh_rendered_html(article)
 
     updated = await repo.update(article)
 
@@ -106,6 +337,26 @@ async def delete_article(article_id: UUID, db: DbSession):
     await repo.delete(article)
 
 
+def _parse_fields(fields: Optional[str]) -> list[str]:
+    """fields= パラメータを取得するカラム名のリストに変換
+
+    Raises:
+        ValidationError: 不明なフィールドが含まれる場合
+    """
+    if not fields:
+        return list(ARTICLE_SUMMARY_FIELDS)
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in ARTICLE_FIELDS]
+    if unknown:
+        raise ValidationError(f"Unknown fields: {', '.join(unknown)}")
+
+    # ページネーションのキーは常に取得
+    selected = ["id", "created_at"]
+    selected.extend(field for field in requested if field not in selected)
+    return selected
+
+
 async def _sync_to_sheets(db: DbSession, article: Article) -> None:
     """Google Sheetsに記事ステータスを同期
 
@@ -118,10 +369,7 @@ async def _sync_to_sheets(db: DbSession, article: Article) -> None:
     """
     try:
         # カテゴリを取得してsheet_idを確認
-        result = await db.execute(
-            select(Category).where(Category.id == article.category_id)
-        )
-        category = result.scalar_one_or_none()
+        category = await CategoryRepository(db).find_by_id_cached(article.category_id)
 
         if category and category.sheet_id:
             sheets_service.update_article_status(
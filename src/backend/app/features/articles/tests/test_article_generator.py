@@ -4,6 +4,7 @@ This module contains tests for the article generation orchestrator,
 verifying the complete workflow from prompt building to database updates.
 """
 import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -13,8 +14,10 @@ from app.features.articles.application.article_generator import (
 )
 from app.features.articles.domain.models import Article
 from app.features.categories.domain.models import Category
-from app.shared.domain.enums import ArticleStatus
-from app.shared.domain.llm.base import LLMResponse
+from app.features.job_logs.infrastructure.writer import pending_rows
+from app.features.prompt_templates.domain.models import PromptTemplate
+from app.shared.domain.enums import ArticleStatus, JobStatus
+from app.shared.domain.llm.base import LLMConfig, LLMResponse
 
 
 @pytest.fixture
@@ -29,6 +32,7 @@ def mock_db():
     db = AsyncMock()
     db.flush = AsyncMock()
     db.add = MagicMock()
+    db.info = {}
     return db
 
 
@@ -103,6 +107,7 @@ async def test_generate_successful(
         return result
 
     mock_db.execute = mock_execute
+    progress = AsyncMock()
 
     # Mock Gemini API response
     mock_llm_response = LLMResponse(
@@ -120,7 +125,8 @@ async def test_generate_successful(
         result = await article_generator.generate(
             mock_db,
             sample_article.id,
-            {"char_count_min": 100, "char_count_max": 2000}
+            {"char_count_min": 100, "char_count_max": 2000},
+            progress=progress
         )
 
     assert result.success is True
@@ -135,6 +141,11 @@ async def test_generate_successful(
     assert sample_article.content is not None
     assert sample_article.status == ArticleStatus.REVIEW_PENDING
 
+    # Verify the LLM call was reported to the progress callback
+    progress.assert_awaited_once()
+    assert progress.await_args.args == ("generated",)
+    assert progress.await_args.kwargs["duration_ms"] >= 0
+
 
 @pytest.mark.asyncio
 async def test_generate_with_validation_errors(
@@ -193,21 +204,64 @@ async def test_generate_handles_exception(
     sample_article
 ):
     """Test generation handles exceptions properly."""
-    # Mock database to return article
-    mock_db.execute = AsyncMock(
-        return_value=MagicMock(
-            scalar_one_or_none=MagicMock(return_value=sample_article)
-        )
+    template = PromptTemplate(
+        id=uuid4(),
+        category_id=sample_article.category_id,
+        name="default",
+        system_prompt="あなたはライターです。",
+        user_prompt_template="{keyword}について書いてください。",
+        is_active=True,
+        version=2,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
     )
 
+    # Mock database to return the article, then the category's active template
+    mock_db.execute = AsyncMock(side_effect=[
+        MagicMock(scalar_one_or_none=MagicMock(return_value=sample_article)),
+        MagicMock(scalar_one_or_none=MagicMock(return_value=template)),
+    ])
+
     # Mock Gemini service to raise exception
     with patch.object(
         article_generator.claude_service,
         'generate',
         side_effect=Exception("API Error")
-    ):
+    ) as generate:
         result = await article_generator.generate(mock_db, sample_article.id)
 
+    generate.assert_awaited_once()
     assert result.success is False
     assert "API Error" in result.errors
     assert sample_article.status == ArticleStatus.FAILED
+
+    log = pending_rows(mock_db)[0]
+    assert log["model"] == LLMConfig().model
+    assert log["prompt_template_id"] == template.id
+    assert log["template_version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_error_logs_configured_model(
+    article_generator,
+    mock_db,
+    sample_article
+):
+    """Test failed generations are logged with the model and template version."""
+    template = MagicMock(id=uuid4(), version=3)
+
+    await article_generator._handle_error(
+        mock_db,
+        sample_article,
+        datetime.utcnow(),
+        RuntimeError("API Error"),
+        template,
+        LLMConfig(model="gemini-1.5-flash")
+    )
+
+    log = pending_rows(mock_db)[0]
+    assert log["status"] == JobStatus.FAILED
+    assert log["model"] == "gemini-1.5-flash"
+    assert log["prompt_template_id"] == template.id
+    assert log["template_version"] == 3
+    assert sample_article.status == ArticleStatus.FAILED
@@ -0,0 +1,80 @@
+"""Tests for the article list projection."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.features.articles.domain.schemas import ARTICLE_SUMMARY_FIELDS
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.features.articles.presentation.routes import _parse_fields
+from app.shared.domain import models  # noqa
+from app.shared.domain.exceptions import ValidationError
+
+
+def test_default_fields_exclude_body():
+    """The default projection is the summary without content and metadata."""
+    fields = _parse_fields(None)
+
+    assert fields == list(ARTICLE_SUMMARY_FIELDS)
+    assert "content" not in fields
+    assert "metadata_" not in fields
+
+
+def test_requested_fields_include_pagination_keys():
+    """id and created_at are always selected for the cursor."""
+    assert _parse_fields("title, status,id") == ["id", "created_at", "title", "status"]
+
+
+def test_unknown_field_is_rejected():
+    """Unknown field names are a validation error."""
+    with pytest.raises(ValidationError):
+        _parse_fields("title,password")
+
+
+@pytest.mark.asyncio
+async def test_find_all_fields_selects_only_requested_columns():
+    """Only the requested columns appear in the SELECT list."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+
+    rows, total = await ArticleRepository(session).find_all_fields(
+        ["id", "created_at", "title", "metadata_"], with_total=False
+    )
+
+    statement = session.execute.await_args.args[0]
+    assert [column.name for column in statement.selected_columns] == [
+        "id", "created_at", "title", "metadata_"
+    ]
+    assert "articles.content" not in str(statement)
+    assert rows == []
+    assert total is None
+
+
+def test_list_response_serializes_only_selected_fields():
+    """Constructed list items serialize only the selected fields."""
+    import json
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from app.features.articles.domain.schemas import ArticleListItem, ArticleListResponse
+    from app.shared.infrastructure.responses import ModelResponse
+
+    row = {"id": uuid4(), "created_at": datetime.now(timezone.utc), "title": "タイトル"}
+    response = ModelResponse(
+        ArticleListResponse.model_construct(
+            items=[ArticleListItem.model_construct(**row)],
+            total=None,
+            per_page=20,
+            next_cursor=None,
+        ),
+        exclude_unset=True,
+    )
+
+    body = json.loads(response.body)
+    assert body["items"] == [
+        {"id": str(row["id"]), "created_at": row["created_at"].isoformat().replace("+00:00", "Z"), "title": "タイトル"}
+    ]
+    assert body["total"] is None
+    assert "page" not in body
+    assert response.media_type == "application/json"
@@ -0,0 +1,51 @@
+"""Tests for bulk article creation."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.features.articles.domain.schemas import ArticleBulkCreate
+from app.features.articles.infrastructure import repository
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.shared.domain import models  # noqa
+
+
+def _session():
+    session = AsyncMock()
+
+    async def execute(statement):
+        result = MagicMock()
+        rows = statement.compile(dialect=postgresql.dialect()).params
+        count = sum(1 for key in rows if key.startswith("id_"))
+        result.scalars.return_value.all.return_value = [uuid4() for _ in range(count)]
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_uses_multi_row_insert_on_conflict(monkeypatch):
+    """Rows are inserted in chunks with ON CONFLICT DO NOTHING."""
+    monkeypatch.setattr(repository, "BULK_INSERT_CHUNK_SIZE", 2)
+    session = _session()
+
+    ids = await ArticleRepository(session).bulk_create(uuid4(), ["a", "b", "c"])
+
+    assert len(ids) == 3
+    assert session.execute.await_count == 2
+    statement = session.execute.await_args_list[0].args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (category_id, keyword) DO NOTHING" in sql
+    assert "RETURNING articles.id" in sql
+
+
+def test_bulk_request_strips_and_validates_keywords():
+    """Keywords are stripped and empty keywords are rejected."""
+    request = ArticleBulkCreate(category_id=uuid4(), keywords=[" AI ", "機械学習"])
+    assert request.keywords == ["AI", "機械学習"]
+
+    with pytest.raises(ValidationError):
+        ArticleBulkCreate(category_id=uuid4(), keywords=["AI", "  "])
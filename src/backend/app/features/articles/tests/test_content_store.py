@@ -0,0 +1,95 @@
+"""Tests for versioned article content."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.features.articles.domain.models import Article
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.shared.domain import models  # noqa
+from app.shared.domain.hashing import sha256_hex
+
+
+def _article(content=None):
+    return Article(id=uuid4(), category_id=uuid4(), keyword="AI", content=content)
+
+
+def test_first_content_creates_revision_one():
+    """Setting content creates the first revision with its hash."""
+    article = _article("本文")
+
+    current = article.current_content
+    assert article.content == "本文"
+    assert article.content_revision == 1
+    assert current.revision == 1
+    assert current.content_hash == sha256_hex("本文")
+    assert current.char_count == 2
+    assert current.body is None
+
+
+def test_identical_content_does_not_create_revision():
+    """Writing the same body again keeps the current revision."""
+    article = _article("本文")
+    current = article.current_content
+
+    article.content = "本文"
+
+    assert article.current_content is current
+    assert article.content_revision == 1
+
+
+def test_new_content_archives_previous_revision():
+    """The previous revision is compressed and can still be read back."""
+    article = _article("最初の本文" * 100)
+    previous = article.current_content
+
+    article.content = "再生成した本文"
+
+    assert article.content == "再生成した本文"
+    assert article.content_revision == 2
+    assert article.current_content.revision == 2
+    assert previous.content is None
+    assert len(previous.body) < len(("最初の本文" * 100).encode("utf-8"))
+    assert previous.text == "最初の本文" * 100
+
+
+def test_clearing_content_archives_current_revision():
+    """Setting None archives the current revision and clears the pointer."""
+    article = _article("本文")
+    previous = article.current_content
+
+    article.content = None
+
+    assert article.content is None
+    assert article.current_content is None
+    assert previous.text == "本文"
+    assert article.content_revision == 1
+
+
+def test_select_fields_joins_current_revision_for_content():
+    """Selecting content reads it from the current revision."""
+    sql = str(ArticleRepository._select_fields(["id", "content"]))
+
+    assert "article_contents.content AS content" in sql
+    assert "LEFT OUTER JOIN article_contents" in sql
+    assert "article_contents" not in str(ArticleRepository._select_fields(["id"]))
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_loads_content_only_when_requested():
+    """The content revision is joined only for callers that read the body."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = ArticleRepository(session)
+
+    await repo.find_by_id(uuid4())
+    await repo.find_by_id(uuid4(), with_content=True)
+
+    plain, joined = (str(c.args[0]) for c in session.execute.await_args_list)
+    assert "article_contents" not in plain
+    assert "LEFT OUTER JOIN article_contents" in joined
+
+
+def test_current_content_is_not_loaded_implicitly():
+    """Loading an Article never pulls the content body implicitly."""
+    assert Article.current_content.property.lazy == "raise"
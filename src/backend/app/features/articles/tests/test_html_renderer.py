@@ -0,0 +1,53 @@
+"""Tests for the rendered HTML cache."""
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.features.articles.application.html_renderer import refresh_rendered_html
+from app.features.articles.domain.models import Article
+from app.shared.domain import models  # noqa
+from app.shared.infrastructure.services.markdown_converter import markdown_converter
+
+
+def _article(content):
+    return Article(id=uuid4(), category_id=uuid4(), keyword="AI", content=content)
+
+
+def test_renders_and_stores_on_current_revision():
+    """HTML is stored on the revision it was rendered from."""
+    article = _article("# タイトル\n\n本文")
+
+    html = refresh_rendered_html(article)
+
+    assert html == "<h1>タイトル</h1>\n<p>本文</p>"
+    assert article.current_content.content_html == html
+
+
+def test_reuses_cached_html_until_content_changes():
+    """Unchanged content is not converted again."""
+    article = _article("本文")
+    convert = patch.object(
+        markdown_converter, "convert", wraps=markdown_converter.convert
+    )
+
+    with convert as mock_convert:
+        refresh_rendered_html(article)
+        refresh_rendered_html(article)
+        assert mock_convert.call_count == 1
+
+        previous = article.current_content
+        article.content = "新しい本文"
+        assert refresh_rendered_html(article) == "<p>新しい本文</p>"
+        assert mock_convert.call_count == 2
+        # The archived revision drops its HTML
+        assert previous.content_html is None
+
+
+def test_no_html_without_content():
+    """No HTML is returned when the content is removed."""
+    article = _article("本文")
+    refresh_rendered_html(article)
+
+    article.content = None
+
+    assert refresh_rendered_html(article) is None
+    assert article.current_content is None
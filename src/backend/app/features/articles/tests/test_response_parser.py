@@ -120,3 +120,34 @@ class TestResponseParser:
         assert len(errors) == 2
         assert "タイトルが見つかりません" in errors
         assert any("文字数不足" in error for error in errors)
+
+    def test_parse_records_structure(self):
+        """Test heading counts and section lengths."""
+        content = "# タイトル\n\n導入\n\n## 見出し1\n\n本文**強調**\n\n### 小見出し\n\nあいう\n\n## 見出し2\n\nえお"
+
+        result = self.parser.parse(content, min_chars=1, max_chars=1000)
+
+        assert result.h2_count == 2
+        assert result.h3_count == 1
+        assert [(s.level, s.heading, s.char_count) for s in result.sections] == [
+            (2, "見出し1", 4),
+            (3, "小見出し", 3),
+            (2, "見出し2", 2),
+        ]
+        assert result.structure()["sections"][0] == {
+            "level": 2, "heading": "見出し1", "char_count": 4
+        }
+
+    def test_count_characters_excludes_markup(self):
+        """Test that markers and line breaks are not counted."""
+        content = "# タイトル\n\n**太字**と*斜体*と`コード`"
+
+        assert self.parser._count_characters(content) == len("タイトル太字と斜体とコード")
+
+    def test_clean_markdown_fences_keeps_inner_code_blocks(self):
+        """Test that only the wrapping fence is removed."""
+        content = "```markdown\n# タイトル\n\n```python\nprint(1)\n```\n```"
+
+        result = self.parser._clean_markdown_fences(content)
+
+        assert result == "# タイトル\n\n```python\nprint(1)\n```"
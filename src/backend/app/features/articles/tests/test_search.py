@@ -0,0 +1,56 @@
+"""Tests for article search."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.articles.application.search import highlight, snippet
+from app.features.articles.domain.schemas import ARTICLE_SUMMARY_FIELDS
+from app.features.articles.infrastructure.repository import ArticleRepository, like_pattern
+from app.shared.domain import models  # noqa
+
+
+def test_like_pattern_escapes_wildcards():
+    """LIKE wildcards in the query are matched literally."""
+    assert like_pattern("100%_達成\\") == "%100\\%\\_達成\\\\%"
+
+
+def test_highlight_escapes_and_marks_matches():
+    """Matches are wrapped in <mark> and the rest is HTML-escaped."""
+    result = highlight("<b>Python</b>入門とpython", "python")
+
+    assert result == "&lt;b&gt;<mark>Python</mark>&lt;/b&gt;入門と<mark>python</mark>"
+
+
+def test_snippet_adds_ellipses_and_collapses_whitespace():
+    """Ellipses mark truncated ends; line breaks become spaces."""
+    assert snippet("前文\n機械学習の\n基本", "機械学習", False, True) == (
+        "…前文 <mark>機械学習</mark>の 基本"
+    )
+    assert snippet(None, "機械学習", True, True) is None
+
+
+@pytest.mark.asyncio
+async def test_search_query_uses_ilike_on_title_and_content():
+    """The repository searches title and content with escaped ILIKE."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+
+    await ArticleRepository(session).search("機械学習", ARTICLE_SUMMARY_FIELDS, limit=10)
+
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    # Each side of the UNION filters one table, so each can use its trigram index
+    outer, matches = sql.split("JOIN (SELECT articles.id AS id", 1)
+    title_side, content_side = matches.split("UNION", 1)
+    assert "articles.title ILIKE" in title_side and "ESCAPE" in title_side
+    assert "coalesce" not in matches
+    assert "coalesce(articles.title" in outer
+    assert "article_contents.content IS NOT NULL" in content_side
+    assert "article_contents.content ILIKE" in content_side
+    assert " OR " not in sql
+    assert "LEFT OUTER JOIN article_contents" in sql
+    assert "word_similarity" in sql
+    assert "ORDER BY rank DESC" in sql
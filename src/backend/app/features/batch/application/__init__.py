@@ -0,0 +1 @@
+"""Batch application layer."""
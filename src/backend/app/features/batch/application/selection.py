@@ -0,0 +1,130 @@
+"""セレクター指定のバッチ生成
+
+条件（カテゴリ・ステータス・作成日時）に一致する記事IDをサーバーサイド
+カーソルで読み進め、chunk_size 件ごとに batch_generate_task として
+エンキューします。クライアントは記事IDを列挙せずに、1回のリクエストで
+条件に一致する記事をまとめて生成できます。
+
+件数は次の上限で制限します。上限に達した場合は一致する記事が残っていても
+そこで打ち切り、最後にエンキューした記事のキーを続きのカーソルとして
+返却します。同じ条件とカーソルで再度リクエストすると、エンキュー済みの
+記事の後から再開します。
+
+同じ記事を重複してエンキューしないよう、各チャンクはエンキューの前に
+生成中（GENERATING）として確保してコミットし、確保できた記事（他の
+リクエスト・ジョブで生成中でないもの）だけをエンキューします。確保には期限があり、ジョブは確保の期限内に開始できなければ
+実行せずに破棄されます（expires）。
+
+- batch_select_max_articles: 1リクエストでエンキューする記事数
+- batch_queue_max_depth: ジョブキューの待機中ジョブ数（0 は無制限）
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID, uuid4
+
+from arq.connections import ArqRedis
+from arq.constants import default_queue_name
+
+from app.shared.infrastructure.pagination import CursorKey
+
+
+@dataclass
+class Selection:
+    """エンキューの結果"""
+
+    job_ids: list[str] = field(default_factory=list)
+    total: int = 0
+    skipped: int = 0
+    has_more: bool = False
+    last_key: Optional[CursorKey] = None
+
+
+def effective_limit(
+    limit: Optional[int],
+    max_articles: int,
+    chunk_size: int,
+    queue_capacity: Optional[int] = None,
+) -> int:
+    """リクエストの limit に上限を適用した件数
+
+    Args:
+        limit: リクエストで指定した件数（None は上限まで）
+        max_articles: 1リクエストあたりの記事数の上限
+        chunk_size: 1ジョブあたりの記事数
+        queue_capacity: エンキューできるジョブ数（None は無制限）
+
+    Returns:
+        エンキューする最大件数
+    """
+    limits = [max_articles]
+    if limit is not None:
+        limits.append(limit)
+    if queue_capacity is not None:
+        limits.append(queue_capacity * chunk_size)
+    return max(0, min(limits))
+
+
+async def queue_capacity(pool: ArqRedis, max_depth: int) -> Optional[int]:
+    """キューにあと何件ジョブを追加できるか（max_depth が 0 の場合は None）"""
+    if not max_depth:
+        return None
+    depth = await pool.zcard(default_queue_name)
+    return max(0, max_depth - depth)
+
+
+async def enqueue_selection(
+    pool: ArqRedis,
+    chunks: AsyncIterator[list[CursorKey]],
+    limit: int,
+    options: Optional[dict] = None,
+    claim: Optional[Callable[[list[UUID]], Awaitable[list[UUID]]]] = None,
+    expires: Optional[int] = None,
+) -> Selection:
+    """記事のチャンクごとに batch_generate_task をエンキュー
+
+    Args:
+        pool: 共有の ArqRedis クライアント
+        chunks: 記事のキー (created_at, id) のチャンク
+            （limit + 1 件まで。超過分で has_more を判定）
+        limit: 読み進める最大件数
+        options: 生成オプション（全記事に適用）
+        claim: 記事を確保し、確保できた記事IDを返す関数
+            （ArticleRepository.claim_for_generation。省略時はすべてエンキュー）
+        expires: ジョブがキューで開始を待つ上限（秒。省略時は無制限）
+
+    Returns:
+        ジョブID・エンキューした記事数・確保できずスキップした記事数・
+        残りの有無・最後の記事のキー
+    """
+    selection = Selection()
+    read = 0
+    async for keys in chunks:
+        remaining = limit - read
+        if len(keys) > remaining:
+            selection.has_more = True
+            keys = keys[:remaining]
+        if not keys:
+            break
+        read += len(keys)
+        selection.last_key = keys[-1]
+
+        article_ids = [article_id for _, article_id in keys]
+        if claim is not None:
+            article_ids = await claim(article_ids)
+            selection.skipped += len(keys) - len(article_ids)
+        if not article_ids:
+            continue
+
+        job_id = str(uuid4())
+        await pool.enqueue_job(
+            "batch_generate_task",
+            [str(article_id) for article_id in article_ids],
+            options,
+            _job_id=job_id,
+            _expires=expires,
+        )
+        selection.job_ids.append(job_id)
+        selection.total += len(article_ids)
+    return selection
@@ -3,11 +3,14 @@
 This module defines request and response schemas for
 batch job processing endpoints.
 """
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.shared.domain.enums import ArticleStatus
+
 
 class BatchGenerateRequest(BaseModel):
     """Batch article generation request.
@@ -29,6 +32,84 @@ class BatchGenerateRequest(BaseModel):
     )
 
 
+class BatchSelector(BaseModel):
+    """Article selector for server-side batches.
+
+    Attributes:
+        category_id: Only articles in this category
+        status: Only articles with this status (default: pending)
+        created_before: Only articles created before this time
+        after: Continuation cursor from a previous response's next_cursor
+        limit: Maximum number of articles (capped by the server quota)
+    """
+
+    category_id: Optional[UUID] = Field(None, description="カテゴリID")
+    status: ArticleStatus = Field(ArticleStatus.PENDING, description="ステータス")
+    created_before: Optional[datetime] = Field(None, description="この日時より前に作成された記事")
+    after: Optional[str] = Field(None, description="続きのカーソル（前回の next_cursor）")
+    limit: Optional[int] = Field(None, ge=1, description="最大件数（省略時はサーバーの上限まで）")
+
+
+class BatchSelectRequest(BaseModel):
+    """Batch article generation request by selector.
+
+    Attributes:
+        selector: Conditions the articles must match
+        options: Optional generation options applied to all articles
+    """
+
+    selector: BatchSelector = Field(..., description="対象記事の条件")
+    options: Optional[dict] = Field(
+        None,
+        description="生成オプション（全記事に適用）"
+    )
+
+
+class BatchSelectResponse(BaseModel):
+    """Selector batch creation response.
+
+    Attributes:
+        job_ids: IDs of the enqueued batch jobs (one per chunk)
+        total: Total number of articles enqueued
+        skipped: Matching articles skipped because they were already
+            being generated (claimed by another request or job)
+        chunk_size: Maximum number of articles per job
+        has_more: Whether more articles match than were enqueued
+        next_cursor: Cursor to enqueue the rest (only when has_more)
+        message: Human-readable status message
+    """
+
+    job_ids: list[str] = Field(..., description="バッチジョブIDリスト（チャンクごと）")
+    total: int = Field(..., description="処理対象記事数")
+    skipped: int = Field(0, description="生成中のためエンキューしなかった記事数")
+    chunk_size: int = Field(..., description="1ジョブあたりの記事数")
+    has_more: bool = Field(..., description="上限により未エンキューの記事が残っているか")
+    next_cursor: Optional[str] = Field(None, description="続きのカーソル（selector.after に指定）")
+    message: str = Field(..., description="ステータスメッセージ")
+
+
+class BatchPublishRequest(BaseModel):
+    """Batch WordPress draft/publish request.
+
+    Attributes:
+        article_ids: List of article UUIDs to push (1-10000)
+        concurrency: Optional concurrent WordPress request limit
+    """
+
+    article_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="記事IDリスト（最大10000件）"
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=20,
+        description="同時実行数（省略時は設定値）"
+    )
+
+
 class BatchResponse(BaseModel):
     """Batch job creation response.
 
@@ -91,3 +172,43 @@ class BatchJobResult(BaseModel):
     success: int = Field(..., description="成功件数")
     failed: int = Field(..., description="失敗件数")
     results: list[BatchResultDetail] = Field(..., description="個別結果")
+
+
+# Progress event types published by workers.
+# Per article: started -> generated -> validated | failed; per job: completed
+ProgressEventType = Literal["started", "generated", "validated", "failed", "completed"]
+
+
+class BatchProgressEvent(BaseModel):
+    """Batch job progress event (SSE / WebSocket payload).
+
+    Per-article events carry article_id and index; the final ``completed``
+    event carries the success/failed counts.
+
+    Attributes:
+        id: Redis stream entry ID (resume point for Last-Event-ID)
+        event: Event type
+        job_id: Batch job ID
+        total: Total number of articles in the job
+        article_id: Article UUID (per-article events)
+        index: Position of the article in the job, 0-based (per-article events)
+        duration_ms: Elapsed milliseconds (LLM call for generated, whole article otherwise)
+        title: Generated title (validated)
+        char_count: Character count (validated / failed)
+        errors: Error messages (failed)
+        success: Number of successful articles (completed)
+        failed: Number of failed articles (completed)
+    """
+
+    id: str = Field("", description="イベントID（ストリームのエントリID）")
+    event: ProgressEventType = Field(..., description="イベント種別")
+    job_id: str = Field(..., description="バッチジョブID")
+    total: int = Field(..., description="処理対象記事数")
+    article_id: Optional[str] = Field(None, description="記事ID")
+    index: Optional[int] = Field(None, description="ジョブ内の記事の位置（0始まり）")
+    duration_ms: Optional[int] = Field(None, description="経過時間（ミリ秒）")
+    title: Optional[str] = Field(None, description="生成されたタイトル")
+    char_count: Optional[int] = Field(None, description="文字数")
+    errors: Optional[list[str]] = Field(None, description="エラーメッセージ")
+    success: Optional[int] = Field(None, description="成功件数")
+    failed: Optional[int] = Field(None, description="失敗件数")
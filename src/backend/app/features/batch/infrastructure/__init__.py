@@ -0,0 +1 @@
+"""Batch infrastructure layer."""
@@ -0,0 +1,238 @@
+"""バッチジョブの進捗イベント（Redis Streams）
+
+ワーカーは記事ごとの進捗（started → generated → validated / failed）と
+ジョブの終了（completed）をジョブごとのストリーム batch:events:{job_id} に
+XADD し、API は XREAD（BLOCK）で読み取ったイベントを SSE・WebSocket で
+配信します。ストリームのエントリIDをイベントIDとして使うため、
+クライアントは最後に受信したIDから再開できます（Last-Event-ID）。
+
+- ストリームは batch_events_maxlen 件（概算）で切り詰め、最後の書き込みから
+  batch_events_ttl 秒で削除します
+- 発行の失敗（Redis の障害など）はジョブの処理に影響させません
+- ブロッキング読み取りは読み取り中の接続を占有するため、ジョブ投入用とは
+  別の接続プール（上限 batch_events_max_streams）を使います
+"""
+
+import re
+from collections.abc import AsyncIterator
+from functools import partial
+from typing import Any, Callable, Optional
+
+from arq.constants import job_key_prefix, result_key_prefix
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.features.batch.domain.schemas import BatchProgressEvent, ProgressEventType
+from app.shared.infrastructure.queue import QueuePool
+
+settings = get_settings()
+
+STREAM_KEY_PREFIX = "batch:events:"
+
+# 購読を終了するイベント
+TERMINAL_EVENTS = frozenset({"completed"})
+
+# Last-Event-ID として受け付ける形式（"0" は先頭から）
+_EVENT_ID = re.compile(r"^\d+(-\d+)?$")
+
+
+def stream_key(job_id: str) -> str:
+    """ジョブの進捗イベントのストリームキー"""
+    return STREAM_KEY_PREFIX + job_id
+
+
+def is_valid_event_id(event_id: str) -> bool:
+    """Last-Event-ID として有効な形式か"""
+    return bool(_EVENT_ID.match(event_id))
+
+
+def _str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class BatchProgress:
+    """ジョブの進捗イベントの発行（ワーカー）
+
+    redis・job_id のどちらかがない場合（ジョブ外での実行）は何もしません。
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        job_id: Optional[str],
+        total: int,
+        maxlen: int = 10000,
+        ttl: int = 86400,
+    ):
+        self.redis = redis
+        self.job_id = job_id
+        self.total = total
+        self.maxlen = maxlen
+        self.ttl = ttl
+
+    @classmethod
+    def from_context(cls, ctx: dict, total: int) -> "BatchProgress":
+        """ARQ のジョブコンテキストから生成"""
+        return cls(
+            ctx.get("redis"),
+            ctx.get("job_id"),
+            total,
+            maxlen=settings.batch_events_maxlen,
+            ttl=settings.batch_events_ttl,
+        )
+
+    async def publish(self, event: ProgressEventType, **fields: Any) -> Optional[str]:
+        """イベントを発行
+
+        Args:
+            event: イベント種別
+            fields: BatchProgressEvent のフィールド
+
+        Returns:
+            イベントID（発行しなかった・失敗した場合は None）
+        """
+        if self.redis is None or self.job_id is None:
+            return None
+        payload = BatchProgressEvent(
+            event=event, job_id=self.job_id, total=self.total, **fields
+        ).model_dump_json(exclude={"id"}, exclude_none=True)
+
+        key = stream_key(self.job_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.xadd(key, {"data": payload}, maxlen=self.maxlen, approximate=True)
+                pipe.expire(key, self.ttl)
+                event_id, _ = await pipe.execute()
+        except (RedisError, OSError):
+            return None
+        return _str(event_id)
+
+    def for_article(self, article_id: str, index: int) -> Callable:
+        """記事ごとのイベントを発行するコールバック（ArticleGenerator 用）"""
+        return partial(self.publish, article_id=article_id, index=index)
+
+
+def parse_entries(entries: list) -> list[BatchProgressEvent]:
+    """XREAD / XRANGE のエントリをイベントに変換"""
+    events = []
+    for entry_id, fields in entries:
+        data = fields.get(b"data", fields.get("data"))
+        if data is None:
+            continue
+        event = BatchProgressEvent.model_validate_json(data)
+        event.id = _str(entry_id)
+        events.append(event)
+    return events
+
+
+async def read_events(
+    redis: Redis,
+    job_id: str,
+    last_id: str = "0",
+    block_ms: Optional[int] = None,
+    count: int = 100,
+) -> list[BatchProgressEvent]:
+    """last_id より後のイベントを読み取り
+
+    Args:
+        redis: Redis クライアント
+        job_id: バッチジョブID
+        last_id: 最後に受信したイベントID（"0" は先頭から）
+        block_ms: 新しいイベントを待つ最大時間（None は待たない）
+        count: 一度に読み取る最大件数
+
+    Returns:
+        イベント（待ち時間内になければ空）
+    """
+    response = await redis.xread({stream_key(job_id): last_id}, count=count, block=block_ms)
+    if not response:
+        return []
+    _, entries = response[0]
+    return parse_entries(entries)
+
+
+async def job_exists(redis: Redis, job_id: str) -> bool:
+    """ジョブ（待機中・実行中・結果）またはそのイベントが存在するか"""
+    return bool(
+        await redis.exists(
+            stream_key(job_id), job_key_prefix + job_id, result_key_prefix + job_id
+        )
+    )
+
+
+async def job_finished(redis: Redis, job_id: str) -> bool:
+    """ジョブの結果（arq:result:{job_id}）が保存されているか"""
+    return bool(await redis.exists(result_key_prefix + job_id))
+
+
+class BatchEventSubscriber:
+    """進捗イベントの購読（SSE・WebSocket 共通）"""
+
+    def __init__(self, pool: QueuePool, max_streams: int = 100, heartbeat: float = 15.0):
+        self.pool = pool
+        self.max_streams = max_streams
+        self.heartbeat = heartbeat
+        self.active = 0
+
+    def available(self) -> bool:
+        """新しい購読を受け付けられるか"""
+        return self.active < self.max_streams
+
+    async def subscribe(
+        self, job_id: str, last_id: str = "0"
+    ) -> AsyncIterator[Optional[BatchProgressEvent]]:
+        """last_id より後のイベントを順に返す
+
+        新しいイベントが heartbeat 秒ない場合は None を返します（keep-alive 用）。
+        次の場合に終了します。
+
+        - ジョブが終了した（completed を返した）場合
+        - completed がなくてもジョブの結果が保存されている場合（タイムアウト・
+          ワーカー停止などで completed を発行できなかったジョブ）。残りの
+          イベントを返してから終了します
+        - ジョブとストリームが期限切れなどで存在しない場合
+        """
+        self.active += 1
+        try:
+            redis = self.pool.get()
+            block_ms = max(1, int(self.heartbeat * 1000))
+            while True:
+                events = await read_events(redis, job_id, last_id, block_ms=block_ms)
+                if not events:
+                    if await job_finished(redis, job_id):
+                        # 結果の保存前に発行されたイベントを読み残さないよう最後に1回読む
+                        for event in await read_events(redis, job_id, last_id):
+                            yield event
+                        return
+                    if not await job_exists(redis, job_id):
+                        return
+                    yield None
+                    continue
+                for event in events:
+                    last_id = event.id
+                    yield event
+                    if event.event in TERMINAL_EVENTS:
+                        return
+        finally:
+            self.active -= 1
+
+    async def shutdown(self) -> None:
+        """接続プールをクローズ"""
+        await self.pool.shutdown()
+
+    def stats(self) -> dict[str, Any]:
+        """購読数と接続プールの使用状況"""
+        return {"active": self.active, "max_streams": self.max_streams, **self.pool.stats()}
+
+
+# シングルトンインスタンス
+batch_events = BatchEventSubscriber(
+    QueuePool(
+        str(settings.redis_url),
+        max_connections=settings.batch_events_max_streams,
+        health_check_interval=settings.redis_health_check_interval,
+    ),
+    max_streams=settings.batch_events_max_streams,
+    heartbeat=settings.batch_events_heartbeat,
+)
@@ -2,25 +2,60 @@
 
 This module provides endpoints for batch article generation
 and job status monitoring using ARQ background workers.
+Live progress is pushed over SSE / WebSocket from the job's
+Redis event stream.
 """
-from uuid import uuid4
-
-from fastapi import APIRouter, HTTPException, status
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from arq.connections import ArqRedis
+from arq.jobs import Job, JobStatus
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from app.core.config import get_settings
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.features.batch.application.selection import (
+    effective_limit,
+    enqueue_selection,
+    queue_capacity,
+)
 from app.features.batch.domain.schemas import (
     BatchGenerateRequest,
+    BatchPublishRequest,
     BatchResponse,
+    BatchSelectRequest,
+    BatchSelectResponse,
+    BatchProgressEvent,
     JobStatusResponse,
 )
-from app.workers.tasks import get_redis_pool
+from app.features.batch.infrastructure.events import (
+    batch_events,
+    is_valid_event_id,
+    job_exists,
+)
+from app.shared.domain.exceptions import NotFoundError, ValidationError
+from app.shared.infrastructure.database import async_session_maker
+from app.shared.infrastructure.dependencies import DbSession, Queue
+from app.shared.infrastructure.pagination import decode_cursor, encode_cursor
 
 settings = get_settings()
 router = APIRouter(prefix="/batch", tags=["Batch"])
 
 
 @router.post("/generate", response_model=BatchResponse, status_code=status.HTTP_202_ACCEPTED)
-async def batch_generate(data: BatchGenerateRequest):
+async def batch_generate(data: BatchGenerateRequest, pool: Queue):
     """
     バッチ記事生成を開始
 
@@ -58,7 +93,6 @@ async def batch_generate(data: BatchGenerateRequest):
         }
     """
     try:
-        pool = await get_redis_pool()
         job_id = str(uuid4())
 
         # Enqueue batch job
@@ -68,7 +102,6 @@ async def batch_generate(data: BatchGenerateRequest):
             data.options,
             _job_id=job_id
         )
-        await pool.close()
 
         return BatchResponse(
             job_id=job_id,
@@ -83,8 +116,132 @@ async def batch_generate(data: BatchGenerateRequest):
         )
 
 
+@router.post(
+    "/generate/select",
+    response_model=BatchSelectResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def batch_generate_select(data: BatchSelectRequest, db: DbSession, pool: Queue):
+    """
+    条件に一致する記事のバッチ生成を開始
+
+    記事IDを列挙する代わりに条件（カテゴリ・ステータス・作成日時・件数）を
+    指定します。一致する記事を古い順にサーバーサイドカーソルで読み進め、
+    batch_select_chunk_size 件ごとに1つのバッチジョブとしてエンキューします。
+    エンキューする記事はチャンクごとに生成中（generating）に変更してコミット
+    してからエンキューし、既に生成中の記事はスキップします（skipped）。
+    各ジョブの進捗は GET /api/batch/{job_id}/events で取得できます。
+
+    1リクエストの件数は batch_select_max_articles まで、ジョブキューの
+    待機中ジョブ数は batch_queue_max_depth までに制限します。上限で
+    打ち切った場合は has_more が true になるため、next_cursor を
+    selector.after に指定して同じ条件で再度リクエストしてください。
+
+    Args:
+        data: 条件と生成オプション
+
+    Returns:
+        ジョブIDリスト、記事数、残りの有無
+
+    Raises:
+        ValidationError: カーソルが不正な場合
+        HTTPException: ジョブキューが上限に達している場合（429）
+
+    Example:
+        POST /api/batch/generate/select
+        {
+            "selector": {
+                "category_id": "123e4567-...",
+                "status": "pending",
+                "limit": 5000
+            },
+            "options": {"char_count_min": 2000}
+        }
+
+        Response:
+        {
+            "job_ids": ["abc123...", "def456..."],
+            "total": 5000,
+            "skipped": 0,
+            "chunk_size": 10,
+            "has_more": false,
+            "next_cursor": null,
+            "message": "Batch generation started for 5000 articles in 500 jobs"
+        }
+    """
+    chunk_size = settings.batch_select_chunk_size
+    selector = data.selector
+    after = decode_cursor(selector.after)
+    try:
+        capacity = await queue_capacity(pool, settings.batch_queue_max_depth)
+        if capacity == 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Job queue is full, retry later"
+            )
+        limit = effective_limit(
+            selector.limit, settings.batch_select_max_articles, chunk_size, capacity
+        )
+
+        # 上限を1件超えて読み、打ち切ったかどうかを判定
+        repository = ArticleRepository(db)
+        chunks = repository.stream_keys(
+            category_id=selector.category_id,
+            status=selector.status,
+            created_before=selector.created_before,
+            after=after,
+            limit=limit + 1,
+            chunk_size=chunk_size,
+        )
+        # チャンクごとに記事を確保してコミット（生成中の記事はスキップ）
+        selection = await enqueue_selection(
+            pool, chunks, limit, data.options,
+            claim=_claim_for_generation, expires=settings.batch_job_expires,
+        )
+
+        return BatchSelectResponse(
+            job_ids=selection.job_ids,
+            total=selection.total,
+            skipped=selection.skipped,
+            chunk_size=chunk_size,
+            has_more=selection.has_more,
+            next_cursor=(
+                encode_cursor(*selection.last_key)
+                if selection.has_more and selection.last_key else None
+            ),
+            message=(
+                f"Batch generation started for {selection.total} articles "
+                f"in {len(selection.job_ids)} jobs"
+            )
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to enqueue batch job: {str(e)}"
+        )
+
+
+async def _claim_for_generation(article_ids: list[UUID]) -> list[UUID]:
+    """記事を生成中として確保し、エンキューの前にコミット
+
+    カーソルのトランザクション（リクエストの終了までコミットされない）とは
+    別のトランザクションで確保するため、ワーカーがジョブを開始した時点で
+    確保は確定しています。エンキューに失敗した記事は確保の期限
+    （batch_claim_lease）を過ぎると再確保できます。
+    """
+    async with async_session_maker() as session:
+        claimed = await ArticleRepository(session).claim_for_generation(
+            article_ids, lease=timedelta(seconds=settings.batch_claim_lease)
+        )
+        await session.commit()
+    return claimed
+
+
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
-async def get_batch_status(job_id: str):
+async def get_batch_status(job_id: str, pool: Queue):
     """
     バッチジョブのステータスを取得
 
@@ -92,7 +249,8 @@ async def get_batch_status(job_id: str):
         job_id: ジョブID（batch_generateのレスポンスから取得）
 
     Returns:
-        ジョブステータス（queued/in_progress/complete/not_found）と結果
+        ジョブステータス（queued/in_progress/complete/failed/not_found）と結果
+        （failed の場合は {"error": ...}）
 
     Example:
         GET /api/batch/status/abc123...
@@ -117,46 +275,29 @@ async def get_batch_status(job_id: str):
         }
     """
     try:
-        from arq.jobs import Job
-        from arq.constants import job_key_prefix
-
-        pool = await get_redis_pool()
-
-        # Get job info from Redis
-        job_key = job_key_prefix + job_id
-        job_exists = await pool.exists(job_key)
-
-        if not job_exists:
-            await pool.close()
-            return JobStatusResponse(
-                job_id=job_id,
-                status="not_found",
-                result=None
-            )
-
-        # Create job instance
+        # 終了したジョブはジョブキーが削除され結果キーのみが残るため、
+        # キュー・実行中キー・結果キーから判定する
         job = Job(job_id=job_id, redis=pool)
-        info = await job.info()
-
-        job_status = "unknown"
+        arq_status = await job.status()
         result = None
 
-        if info:
-            # Map ARQ job status to our status
-            if info.success is True:
+        if arq_status == JobStatus.complete:
+            info = await job.result_info()
+            if info is None:
+                # 状態の確認後に結果が期限切れになった場合
+                job_status = "not_found"
+            elif info.success:
                 job_status = "complete"
-                try:
-                    result = await job.result()
-                except Exception:
-                    pass
-            elif info.success is False:
-                job_status = "failed"
-            elif info.job_try and info.job_try > 0:
-                job_status = "in_progress"
+                result = info.result if isinstance(info.result, dict) else {"result": info.result}
             else:
-                job_status = "queued"
-
-        await pool.close()
+                job_status = "failed"
+                result = {"error": str(info.result)}
+        elif arq_status == JobStatus.in_progress:
+            job_status = "in_progress"
+        elif arq_status in (JobStatus.queued, JobStatus.deferred):
+            job_status = "queued"
+        else:
+            job_status = "not_found"
 
         return JobStatusResponse(
             job_id=job_id,
@@ -171,8 +312,90 @@ async def get_batch_status(job_id: str):
         )
 
 
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_batch_events(
+    job_id: str,
+    pool: Queue,
+    last_event_id: str = Query("0", description="このIDより後のイベントから配信（0 は先頭から）"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    バッチジョブの進捗をSSE（Server-Sent Events）で配信
+
+    記事ごとに started → generated → validated / failed を、ジョブの終了時に
+    completed を配信し、completed の後に接続を終了します。各イベントの id は
+    ストリームのエントリIDで、再接続時は Last-Event-ID ヘッダー（または
+    last_event_id パラメータ）で指定したIDより後のイベントから再開します。
+    新しいイベントがない間は keep-alive のコメントを送信します。
+
+    Args:
+        job_id: ジョブID（batch_generate のレスポンスから取得）
+        last_event_id: このIDより後のイベントから配信
+        last_event_id_header: EventSource が再接続時に送信する Last-Event-ID
+
+    Example:
+        GET /api/batch/abc123.../events
+
+        id: 1718000000000-0
+        event: started
+        data: {"event": "started", "job_id": "abc123...", "total": 3, "article_id": "...", "index": 0}
+
+    Raises:
+        NotFoundError: ジョブが存在しない（期限切れを含む）場合
+    """
+    last_id = last_event_id_header or last_event_id
+    await _check_subscription(pool, job_id, last_id)
+
+    return StreamingResponse(
+        _sse_stream(job_id, last_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{job_id}/events/ws")
+async def batch_events_websocket(
+    websocket: WebSocket,
+    job_id: str,
+    pool: Queue,
+    last_event_id: str = "0",
+):
+    """
+    バッチジョブの進捗をWebSocketで配信
+
+    SSE と同じイベントをJSONで送信し、completed の後に接続を終了します。
+    新しいイベントがない間は {"event": "keep-alive"} を送信します。
+    ジョブが存在しない場合は 4404、購読数が上限の場合は 1013 で切断します。
+    """
+    await websocket.accept()
+    try:
+        await _check_subscription(pool, job_id, last_event_id)
+    except HTTPException as e:
+        code = {
+            status.HTTP_404_NOT_FOUND: 4404,
+            status.HTTP_503_SERVICE_UNAVAILABLE: 1013,
+        }.get(e.status_code, status.WS_1008_POLICY_VIOLATION)
+        await websocket.close(code=code, reason=str(e.detail))
+        return
+
+    try:
+        async with aclosing(batch_events.subscribe(job_id, last_event_id)) as events:
+            async for event in events:
+                if event is None:
+                    await websocket.send_json({"event": "keep-alive"})
+                else:
+                    await websocket.send_text(event.model_dump_json(exclude_none=True))
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+
 @router.post("/generate/single/{article_id}", response_model=BatchResponse, status_code=status.HTTP_202_ACCEPTED)
-async def enqueue_single_generation(article_id: str):
+async def enqueue_single_generation(article_id: str, pool: Queue):
     """
     単一記事の非同期生成をエンキュー
 
@@ -189,7 +412,6 @@ async def enqueue_single_generation(article_id: str):
         POST /api/batch/generate/single/123e4567-e89b-12d3-a456-426614174000
     """
     try:
-        pool = await get_redis_pool()
         job_id = str(uuid4())
 
         await pool.enqueue_job(
@@ -198,7 +420,6 @@ async def enqueue_single_generation(article_id: str):
             None,  # No options
             _job_id=job_id
         )
-        await pool.close()
 
         return BatchResponse(
             job_id=job_id,
@@ -211,3 +432,116 @@ async def enqueue_single_generation(article_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to enqueue job: {str(e)}"
         )
+
+
+@router.post("/wordpress/draft", response_model=BatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def batch_create_drafts(data: BatchPublishRequest, pool: Queue):
+    """
+    WordPress下書き一括作成をバックグラウンドで開始
+
+    大量の記事をARQワーカーでWordPressに下書き投稿します。
+    ジョブIDが返却されるので、/batch/status/{job_id}で進捗を確認できます。
+
+    Args:
+        data: 一括投稿リクエスト
+
+    Returns:
+        ジョブID、記事数、メッセージ
+    """
+    return await _enqueue_publish_job(pool, "bulk_create_drafts_task", data)
+
+
+@router.post("/wordpress/publish", response_model=BatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def batch_publish(data: BatchPublishRequest, pool: Queue):
+    """
+    WordPress記事一括公開をバックグラウンドで開始
+
+    WordPress下書き済みの記事をARQワーカーで一括公開します。
+    ジョブIDが返却されるので、/batch/status/{job_id}で進捗を確認できます。
+
+    Args:
+        data: 一括投稿リクエスト
+
+    Returns:
+        ジョブID、記事数、メッセージ
+    """
+    return await _enqueue_publish_job(pool, "bulk_publish_task", data)
+
+
+@router.post("/wordpress/sync", response_model=BatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def batch_sync_posts(data: BatchPublishRequest, pool: Queue):
+    """
+    WordPress投稿の一括差分同期をバックグラウンドで開始
+
+    変更のあった記事だけをARQワーカーで既存のWordPress投稿に反映します。
+    ジョブIDが返却されるので、/batch/status/{job_id}で進捗を確認できます。
+
+    Args:
+        data: 一括投稿リクエスト
+
+    Returns:
+        ジョブID、記事数、メッセージ
+    """
+    return await _enqueue_publish_job(pool, "bulk_sync_posts_task", data)
+
+
+async def _enqueue_publish_job(
+    pool: ArqRedis, task_name: str, data: BatchPublishRequest
+) -> BatchResponse:
+    """WordPress一括投稿ジョブをエンキュー"""
+    try:
+        job_id = str(uuid4())
+
+        await pool.enqueue_job(
+            task_name,
+            [str(aid) for aid in data.article_ids],
+            data.concurrency,
+            _job_id=job_id
+        )
+
+        return BatchResponse(
+            job_id=job_id,
+            total=len(data.article_ids),
+            message=f"WordPress job started for {len(data.article_ids)} articles"
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to enqueue WordPress job: {str(e)}"
+        )
+
+
+async def _check_subscription(pool: ArqRedis, job_id: str, last_id: str) -> None:
+    """進捗イベントの購読を開始できるか確認
+
+    Raises:
+        ValidationError: イベントIDの形式が不正な場合
+        NotFoundError: ジョブが存在しない場合
+        HTTPException: 購読数が上限に達している場合（503）
+    """
+    if not is_valid_event_id(last_id):
+        raise ValidationError(f"Invalid event id: {last_id}")
+    if not batch_events.available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many event subscriptions"
+        )
+    if not await job_exists(pool, job_id):
+        raise NotFoundError("Job", job_id)
+
+
+async def _sse_stream(job_id: str, last_id: str) -> AsyncIterator[str]:
+    """進捗イベントをSSE形式で返す"""
+    async with aclosing(batch_events.subscribe(job_id, last_id)) as events:
+        async for event in events:
+            yield ": keep-alive\n\n" if event is None else format_sse(event)
+
+
+def format_sse(event: BatchProgressEvent) -> str:
+    """イベントをSSEのメッセージに変換"""
+    return (
+        f"id: {event.id}\n"
+        f"event: {event.event}\n"
+        f"data: {event.model_dump_json(exclude_none=True)}\n\n"
+    )
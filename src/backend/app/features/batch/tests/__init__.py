@@ -0,0 +1 @@
+"""バッチテスト"""
@@ -0,0 +1,263 @@
+"""バッチ進捗イベントのテスト"""
+
+import asyncio
+
+import pytest
+from arq.constants import job_key_prefix, result_key_prefix
+
+from app.features.batch.infrastructure.events import (
+    BatchEventSubscriber,
+    BatchProgress,
+    is_valid_event_id,
+    read_events,
+    stream_key,
+)
+from app.features.batch.presentation.routes import format_sse
+from app.workers import tasks
+
+
+class FakeRedis:
+    """XADD / XREAD / EXISTS のみを実装した Redis（値は bytes で返す）"""
+
+    def __init__(self):
+        self.streams: dict[str, list] = {}
+        self.keys: set[str] = set()
+        self.expires: dict[str, int] = {}
+        self.blocked: list = []
+        self._seq = 0
+        self._pending: list = []
+        self.xread_empty = False
+
+    def pipeline(self, transaction: bool = True):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._pending.append(("xadd", key, fields, maxlen))
+
+    def expire(self, key, seconds):
+        self._pending.append(("expire", key, seconds))
+
+    async def execute(self):
+        results = []
+        for command, key, *args in self._pending:
+            if command == "xadd":
+                self._seq += 1
+                entry_id = f"1000-{self._seq}".encode()
+                fields = {k.encode(): v.encode() for k, v in args[0].items()}
+                self.streams.setdefault(key, []).append((entry_id, fields))
+                results.append(entry_id)
+            else:
+                self.expires[key] = args[0]
+                results.append(True)
+        self._pending = []
+        return results
+
+    async def xread(self, streams, count=None, block=None):
+        self.blocked.append(block)
+        if block is not None and self.xread_empty:
+            # ブロッキング読み取りの後にイベントが追加された状況を再現
+            self.xread_empty = False
+            return []
+        (key, last_id), = streams.items()
+        last = tuple(map(int, last_id.split("-"))) if "-" in last_id else (int(last_id), -1)
+        entries = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams.get(key, [])
+            if tuple(map(int, entry_id.decode().split("-"))) > last
+        ][:count]
+        return [[key.encode(), entries]] if entries else []
+
+    async def exists(self, *keys):
+        return sum(1 for key in keys if key in self.streams or key in self.keys)
+
+
+class FakePool:
+    """QueuePool の代わりに FakeRedis を返す"""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    def get(self):
+        return self.redis
+
+    async def shutdown(self):
+        pass
+
+    def stats(self):
+        return {"open": True}
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+async def _publish_batch(redis, job_id="job-1"):
+    progress = BatchProgress(redis, job_id, total=2)
+    await progress.publish("started", article_id="a1", index=0)
+    await progress.for_article("a1", 0)("generated", duration_ms=1200)
+    await progress.publish("validated", article_id="a1", index=0, duration_ms=1500)
+    await progress.publish("failed", article_id="a2", index=1, errors=["timeout"])
+    await progress.publish("completed", success=1, failed=1)
+    return progress
+
+
+class TestBatchProgress:
+    """BatchProgressのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_publish_appends_to_stream(self, redis):
+        """イベントがジョブのストリームに追加されることをテスト"""
+        progress = BatchProgress(redis, "job-1", total=2, maxlen=500, ttl=600)
+        event_id = await progress.publish("started", article_id="a1", index=0)
+
+        assert event_id == "1000-1"
+        assert redis.expires[stream_key("job-1")] == 600
+
+        events = await read_events(redis, "job-1")
+        assert len(events) == 1
+        assert events[0].id == "1000-1"
+        assert events[0].event == "started"
+        assert events[0].total == 2
+        assert events[0].article_id == "a1"
+        assert events[0].duration_ms is None
+
+    @pytest.mark.asyncio
+    async def test_publish_without_job_is_noop(self):
+        """ジョブ外（ctx に redis・job_id がない）では発行しないことをテスト"""
+        progress = BatchProgress.from_context({}, total=1)
+        assert await progress.publish("started", article_id="a1", index=0) is None
+
+    @pytest.mark.asyncio
+    async def test_publish_ignores_redis_errors(self, redis):
+        """Redis の障害でジョブが失敗しないことをテスト"""
+
+        async def fail():
+            raise ConnectionError("down")
+
+        redis.execute = fail
+        progress = BatchProgress(redis, "job-1", total=1)
+        assert await progress.publish("completed", success=1, failed=0) is None
+
+
+class TestBatchEventSubscriber:
+    """BatchEventSubscriberのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_replays_until_completed(self, redis):
+        """先頭から completed まで配信して終了することをテスト"""
+        await _publish_batch(redis)
+        subscriber = BatchEventSubscriber(FakePool(redis), heartbeat=0.5)
+
+        events = [event async for event in subscriber.subscribe("job-1")]
+
+        assert [e.event for e in events] == [
+            "started", "generated", "validated", "failed", "completed",
+        ]
+        assert events[1].duration_ms == 1200
+        assert events[3].errors == ["timeout"]
+        assert (events[4].success, events[4].failed) == (1, 1)
+        assert redis.blocked == [500]
+        assert subscriber.active == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_resumes_after_last_event_id(self, redis):
+        """Last-Event-ID より後のイベントから再開することをテスト"""
+        await _publish_batch(redis)
+        subscriber = BatchEventSubscriber(FakePool(redis))
+
+        events = [event async for event in subscriber.subscribe("job-1", "1000-3")]
+
+        assert [e.id for e in events] == ["1000-4", "1000-5"]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_heartbeat_and_expiry(self, redis):
+        """イベントがない間は None を返し、ジョブが消えたら終了することをテスト"""
+        redis.keys.add(job_key_prefix + "job-2")
+        subscriber = BatchEventSubscriber(FakePool(redis))
+        stream = subscriber.subscribe("job-2")
+
+        assert await stream.__anext__() is None
+        assert subscriber.active == 1
+
+        redis.keys.clear()
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert subscriber.active == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_ends_when_result_saved(self, redis):
+        """completed がなくてもジョブの結果が保存されたら残りを返して終了することをテスト"""
+        progress = BatchProgress(redis, "job-3", total=1)
+        await progress.publish("started", article_id="a1", index=0)
+        subscriber = BatchEventSubscriber(FakePool(redis))
+        stream = subscriber.subscribe("job-3")
+
+        assert (await stream.__anext__()).event == "started"
+        assert await stream.__anext__() is None
+
+        # 結果の保存直前に発行されたイベントも配信する
+        await progress.publish("failed", article_id="a1", index=0)
+        redis.keys.add(result_key_prefix + "job-3")
+        redis.xread_empty = True
+
+        assert (await stream.__anext__()).event == "failed"
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert subscriber.active == 0
+
+    def test_available_respects_max_streams(self, redis):
+        """購読数の上限をテスト"""
+        subscriber = BatchEventSubscriber(FakePool(redis), max_streams=1)
+        assert subscriber.available()
+        subscriber.active = 1
+        assert not subscriber.available()
+
+
+@pytest.mark.asyncio
+async def test_batch_task_publishes_completed_when_cancelled(redis, monkeypatch):
+    """タイムアウト（キャンセル）されたバッチでも completed を発行することをテスト"""
+
+    async def generate(progress, index, article_id, options):
+        if index == 1:
+            raise asyncio.CancelledError
+        return {"success": True, "article_id": article_id}
+
+    monkeypatch.setattr(tasks, "_generate_article", generate)
+
+    with pytest.raises(asyncio.CancelledError):
+        await tasks.batch_generate_task(
+            {"redis": redis, "job_id": "job-4"}, ["a1", "a2", "a3"]
+        )
+
+    events = await read_events(redis, "job-4")
+    assert [e.event for e in events] == ["completed"]
+    assert (events[0].success, events[0].failed, events[0].total) == (1, 2, 3)
+
+
+def test_is_valid_event_id():
+    """Last-Event-ID の形式チェックをテスト"""
+    assert is_valid_event_id("0")
+    assert is_valid_event_id("1718000000000-0")
+    assert not is_valid_event_id("$")
+    assert not is_valid_event_id("abc")
+
+
+@pytest.mark.asyncio
+async def test_format_sse(redis):
+    """SSE のメッセージ形式をテスト"""
+    await _publish_batch(redis)
+    event = (await read_events(redis, "job-1"))[0]
+
+    message = format_sse(event)
+
+    assert message.startswith("id: 1000-1\nevent: started\ndata: {")
+    assert message.endswith("}\n\n")
+    assert '"article_id":"a1"' in message
+    assert "duration_ms" not in message
@@ -0,0 +1,191 @@
+"""セレクター指定のバッチ生成のテスト"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.features.batch.application.selection import (
+    effective_limit,
+    enqueue_selection,
+    queue_capacity,
+)
+from app.shared.domain.enums import ArticleStatus
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakePool:
+    """エンキューしたジョブを記録する ArqRedis"""
+
+    def __init__(self, depth: int = 0):
+        self.jobs = []
+        self.depth = depth
+
+    async def enqueue_job(self, name, article_ids, options, _job_id, _expires=None):
+        self.jobs.append((name, article_ids, options, _job_id))
+        self.expires = _expires
+
+    async def zcard(self, key):
+        return self.depth
+
+
+def _keys(count: int) -> list:
+    return [(BASE + timedelta(minutes=i), uuid4()) for i in range(count)]
+
+
+async def _chunks(keys: list, size: int):
+    for start in range(0, len(keys), size):
+        yield keys[start:start + size]
+
+
+def test_effective_limit_applies_quotas():
+    """リクエストの limit・記事数の上限・キューの空きの最小値をテスト"""
+    assert effective_limit(None, 10000, 100) == 10000
+    assert effective_limit(250, 10000, 100) == 250
+    assert effective_limit(50000, 10000, 100) == 10000
+    assert effective_limit(None, 10000, 100, queue_capacity=3) == 300
+    assert effective_limit(None, 10000, 100, queue_capacity=0) == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_capacity():
+    """待機中ジョブ数の上限からの空きをテスト"""
+    assert await queue_capacity(FakePool(depth=990), 1000) == 10
+    assert await queue_capacity(FakePool(depth=1200), 1000) == 0
+    assert await queue_capacity(FakePool(depth=5000), 0) is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_selection_chunks_all_matches():
+    """一致する記事がチャンクごとに1ジョブとしてエンキューされることをテスト"""
+    pool = FakePool()
+    keys = _keys(250)
+
+    selection = await enqueue_selection(pool, _chunks(keys, 100), 1000, {"temperature": 0.5})
+
+    assert selection.total == 250
+    assert selection.has_more is False
+    assert [len(job[1]) for job in pool.jobs] == [100, 100, 50]
+    assert [job[3] for job in pool.jobs] == selection.job_ids
+    assert pool.jobs[0][0] == "batch_generate_task"
+    assert pool.jobs[0][1][0] == str(keys[0][1])
+    assert pool.jobs[0][2] == {"temperature": 0.5}
+    assert selection.last_key == keys[-1]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_selection_stops_at_limit():
+    """上限で打ち切り、has_more と最後のキーを返すことをテスト"""
+    pool = FakePool()
+    keys = _keys(151)  # limit + 1 件を読む
+
+    selection = await enqueue_selection(pool, _chunks(keys, 100), 150)
+
+    assert selection.total == 150
+    assert selection.has_more is True
+    assert [len(job[1]) for job in pool.jobs] == [100, 50]
+    assert selection.last_key == keys[149]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_selection_no_matches():
+    """一致する記事がない場合にエンキューしないことをテスト"""
+    pool = FakePool()
+
+    selection = await enqueue_selection(pool, _chunks([], 100), 100)
+
+    assert selection.total == 0
+    assert selection.job_ids == []
+    assert selection.last_key is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_selection_skips_unclaimed_articles():
+    """確保できなかった（生成中の）記事をエンキューしないことをテスト"""
+    pool = FakePool()
+    keys = _keys(5)
+    generating = {keys[1][1], keys[3][1], keys[4][1]}
+
+    async def claim(article_ids):
+        return [article_id for article_id in article_ids if article_id not in generating]
+
+    selection = await enqueue_selection(
+        pool, _chunks(keys, 2), 100, claim=claim, expires=3600
+    )
+
+    assert [job[1] for job in pool.jobs] == [[str(keys[0][1])], [str(keys[2][1])]]
+    assert selection.total == 2
+    assert selection.skipped == 3
+    assert pool.expires == 3600
+    # 全件スキップしたチャンクもカーソルは進める
+    assert selection.last_key == keys[-1]
+
+
+@pytest.mark.asyncio
+async def test_claim_for_generation_marks_generating():
+    """生成中でない記事だけを生成中に更新し、入力順で返すことをテスト"""
+    ids = [uuid4() for _ in range(3)]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [ids[2], ids[0]]
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+
+    claimed = await ArticleRepository(session).claim_for_generation(
+        ids, lease=timedelta(hours=1)
+    )
+
+    assert claimed == [ids[0], ids[2]]
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE articles SET status=")
+    assert "generation_started_at=now()" in sql
+    assert "articles.status !=" in sql
+    # 期限切れの確保は再確保できる
+    assert "articles.generation_started_at IS NULL" in sql
+    assert "articles.generation_started_at < now() -" in sql
+    assert "RETURNING articles.id" in sql
+    assert await ArticleRepository(session).claim_for_generation(
+        [], lease=timedelta(hours=1)
+    ) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_keys_uses_server_side_cursor():
+    """条件・順序・カーソルを適用してストリーミングで取得することをテスト"""
+    keys = _keys(3)
+    result = MagicMock()
+    result.close = AsyncMock()
+
+    async def partitions(size):
+        yield [MagicMock(created_at=created_at, id=row_id) for created_at, row_id in keys]
+
+    result.partitions = partitions
+    session = AsyncMock()
+    session.stream = AsyncMock(return_value=result)
+
+    chunks = [
+        chunk
+        async for chunk in ArticleRepository(session).stream_keys(
+            category_id=uuid4(),
+            status=ArticleStatus.PENDING,
+            created_before=BASE,
+            after=keys[0],
+            limit=101,
+            chunk_size=50,
+        )
+    ]
+
+    assert chunks == [keys]
+    result.close.assert_awaited_once()
+    statement = session.stream.await_args.args[0]
+    assert session.stream.await_args.kwargs["execution_options"] == {"yield_per": 50}
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "articles.category_id =" in sql
+    assert "articles.status =" in sql
+    assert "articles.created_at <" in sql
+    assert "(articles.created_at, articles.id) >" in sql
+    assert "ORDER BY articles.created_at, articles.id" in sql
+    assert "LIMIT" in sql
@@ -0,0 +1,108 @@
+"""バッチジョブステータスAPIのテスト"""
+
+import time
+
+import pytest
+from arq.constants import default_queue_name, in_progress_key_prefix, result_key_prefix
+from arq.jobs import serialize_result
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.features.batch.presentation.routes import router
+from app.shared.infrastructure.queue import get_queue
+
+
+class FakeRedis:
+    """Job.status() / result_info() が使うコマンドのみを実装した Redis"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.queue: dict[str, float] = {}
+        self._pending: list = []
+
+    def pipeline(self, transaction: bool = True):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def exists(self, key):
+        self._pending.append(int(key in self.values))
+
+    def zscore(self, name, job_id):
+        self._pending.append(self.queue.get(job_id))
+
+    async def execute(self):
+        results, self._pending = self._pending, []
+        return results
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+def _finish(redis: FakeRedis, job_id: str, success: bool, result) -> None:
+    """ARQ がジョブ終了時に行うように結果キーだけを残す"""
+    now = int(time.time() * 1000)
+    redis.values[result_key_prefix + job_id] = serialize_result(
+        "batch_generate_task", (), {}, 1, now, success, result, now, now, job_id,
+        default_queue_name,
+    )
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def client(redis):
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_queue] = lambda: redis
+    return TestClient(app)
+
+
+def _status(client, job_id):
+    response = client.get(f"/api/batch/status/{job_id}")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_queued(client, redis):
+    """キューで待機中のジョブをテスト"""
+    redis.queue["job-1"] = time.time() * 1000 - 1
+    assert _status(client, "job-1")["status"] == "queued"
+
+
+def test_in_progress(client, redis):
+    """実行中のジョブをテスト"""
+    redis.values[in_progress_key_prefix + "job-1"] = b"1"
+    assert _status(client, "job-1")["status"] == "in_progress"
+
+
+def test_complete(client, redis):
+    """終了したジョブ（ジョブキー削除済み・結果キーのみ）をテスト"""
+    _finish(redis, "job-1", True, {"total": 1, "success": 1, "failed": 0, "results": []})
+
+    body = _status(client, "job-1")
+
+    assert body["status"] == "complete"
+    assert body["result"]["success"] == 1
+
+
+def test_failed(client, redis):
+    """例外で終了したジョブをテスト"""
+    _finish(redis, "job-1", False, RuntimeError("boom"))
+
+    body = _status(client, "job-1")
+
+    assert body["status"] == "failed"
+    assert body["result"] == {"error": "boom"}
+
+
+def test_not_found(client):
+    """存在しない（結果も期限切れの）ジョブをテスト"""
+    assert _status(client, "missing")["status"] == "not_found"
@@ -8,7 +8,15 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.categories.domain.models import Category
+from app.features.categories.domain.schemas import CategoryResponse
 from app.shared.domain.exceptions import ConflictError, NotFoundError
+from app.shared.infrastructure.cache import cache
+
+# カテゴリのキャッシュタグ（カテゴリの作成・更新・削除のコミット後に無効化）
+# *_cached の読み込み結果は共有キャッシュに保存されるため、遅延のあるレプリカの
+# 古い行をキャッシュしないよう、プライマリのセッション（DbSession）で呼び出します。
+CATEGORIES_TAG = "categories"
+cache.invalidate_on_change(Category, CATEGORIES_TAG)
 
 
 class CategoryRepository:
@@ -29,6 +37,28 @@ class CategoryRepository:
         )
         return result.scalar_one_or_none()
 
+    @cache.cached(
+        key=lambda self: "categories:all",
+        tags=lambda self: [CATEGORIES_TAG],
+        type_=list[CategoryResponse],
+    )
+    async def find_all_cached(self) -> list[CategoryResponse]:
+        """全カテゴリ取得（キャッシュ経由・読み取り専用）"""
+        return [CategoryResponse.model_validate(c) for c in await self.find_all()]
+
+    @cache.cached(
+        key=lambda self, category_id: f"categories:{category_id}",
+        tags=lambda self, category_id: [CATEGORIES_TAG],
+        type_=Optional[CategoryResponse],
+    )
+    async def find_by_id_cached(self, category_id: UUID) -> Optional[CategoryResponse]:
+        """IDでカテゴリ取得（キャッシュ経由・読み取り専用）
+
+        存在確認や参照のみの用途で使用します。更新する場合は find_by_id を使用してください。
+        """
+        category = await self.find_by_id(category_id)
+        return CategoryResponse.model_validate(category) if category else None
+
     async def find_by_slug(self, slug: str) -> Optional[Category]:
         """スラッグでカテゴリ取得"""
         result = await self.session.execute(
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
 from app.features.categories.domain.models import Category
 from app.features.categories.domain.schemas import (
@@ -12,16 +12,29 @@ from app.features.categories.domain.schemas import (
 )
 from app.features.categories.infrastructure.repository import CategoryRepository
 from app.shared.domain.exceptions import NotFoundError
-from app.shared.infrastructure.dependencies import DbSession
+from app.shared.infrastructure.conditional import row_etag, rows_etag, validator_headers
+from app.shared.infrastructure.dependencies import Conditional, DbSession
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
 
 @router.get("", response_model=list[CategoryResponse])
-async def list_categories(db: DbSession):
-    """カテゴリ一覧取得"""
+async def list_categories(db: DbSession, conditional: Conditional, response: Response):
+    """カテゴリ一覧取得
+
+    ETag は全カテゴリの id・updated_at から生成し、If-None-Match が一致する
+    場合は 304 を返却します。キャッシュミス時の読み込み結果は共有キャッシュに
+    保存するため、レプリカではなくプライマリから読み込みます。
+    """
     repo = CategoryRepository(db)
-    categories = await repo.find_all()
+    categories = await repo.find_all_cached()
+
+    etag = rows_etag((category.id, category.updated_at) for category in categories)
+    not_modified = conditional.not_modified(etag)
+    if not_modified:
+        return not_modified
+
+    response.headers.update(validator_headers(etag))
     return categories
 
 
@@ -35,12 +48,26 @@ async def create_category(data: CategoryCreate, db: DbSession):
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-async def get_category(category_id: UUID, db: DbSession):
-    """カテゴリ取得"""
+async def get_category(
+    category_id: UUID, db: DbSession, conditional: Conditional, response: Response
+):
+    """カテゴリ取得
+
+    ETag・Last-Modified はカテゴリの更新日時から生成し、If-None-Match /
+    If-Modified-Since が一致する場合は 304 を返却します。キャッシュミス時は
+    プライマリから読み込みます（list_categories と同様）。
+    """
     repo = CategoryRepository(db)
-    category = await repo.find_by_id(category_id)
+    category = await repo.find_by_id_cached(category_id)
     if not category:
         raise NotFoundError("Category", str(category_id))
+
+    etag = row_etag(category.id, category.updated_at)
+    not_modified = conditional.not_modified(etag, category.updated_at)
+    if not_modified:
+        return not_modified
+
+    response.headers.update(validator_headers(etag, category.updated_at))
     return category
 
 
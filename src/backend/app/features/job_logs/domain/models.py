@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,10 +16,21 @@ if TYPE_CHECKING:
 
 
 class JobLog(Base):
-    """ジョブログモデル"""
+    """ジョブログモデル
+
+    created_at で月ごとにパーティション分割しています（パーティションの作成・
+    削除は job_logs.infrastructure.partitions）。期間で絞り込むクエリは
+    created_at の条件を付けると対象の月のパーティションのみを走査します。
+    """
 
     __tablename__ = "job_logs"
+    __table_args__ = (
+        # 記事ごとのログ取得・記事削除時のカスケード
+        Index("ix_job_logs_article_id_created_at", "article_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    # パーティションキーを含む複合主キー
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
     )
@@ -32,8 +43,17 @@ class JobLog(Base):
     status: Mapped[JobStatus] = mapped_column(Enum(JobStatus), nullable=False)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # 生成ジョブの集計用（テンプレート削除後もログは残すため外部キーは設定しない）
+    prompt_template_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    # 生成時点のテンプレートのバージョン（その後の編集の影響を受けない）
+    template_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    input_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    output_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
 
     # リレーション
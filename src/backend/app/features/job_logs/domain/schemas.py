@@ -17,6 +17,10 @@ class JobLogCreate(BaseModel):
     status: JobStatus
     error_message: Optional[str] = None
     duration_ms: Optional[int] = None
+    prompt_template_id: Optional[UUID] = None
+    model: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
 
 
 class JobLogResponse(BaseModel):
@@ -30,4 +34,8 @@ class JobLogResponse(BaseModel):
     status: JobStatus
     error_message: Optional[str] = None
     duration_ms: Optional[int] = None
+    prompt_template_id: Optional[UUID] = None
+    model: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
     created_at: datetime
@@ -0,0 +1 @@
+"""ジョブログインフラストラクチャ層"""
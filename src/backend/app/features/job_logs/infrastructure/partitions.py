@@ -0,0 +1,199 @@
+"""job_logs の月次パーティション管理
+
+job_logs は created_at の範囲で月ごとにパーティション分割しています
+（パーティション名は job_logs_YYYY_MM、境界は UTC の月初）。ARQ の定期タスクから
+manage_partitions() を呼び出し、次のことを行います。
+
+- 当月から partitions_ahead か月先までのパーティションを作成
+  （パーティションのない月の行は INSERT できないため）
+- 保持期間（retention_months か月）より前のパーティションを切り離して削除
+
+切り離しは DETACH PARTITION ... CONCURRENTLY（PostgreSQL 14以降）で行うため、
+AUTOCOMMIT の接続で実行してください。前回の実行が途中で失敗した場合も
+次の実行で回復します。
+
+- 中断した CONCURRENTLY の切り離し（pg_inherits.inhdetachpending）は
+  DETACH PARTITION ... FINALIZE で完了させてから削除
+- 切り離し後の DROP TABLE に失敗して残ったテーブル（job_logs_YYYY_MM）は
+  pg_class から見つけて削除
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+PARENT_TABLE = "job_logs"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})_(\d{{2}})$")
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """1か月分のパーティション"""
+
+    start: date
+
+    @property
+    def name(self) -> str:
+        return f"{PARENT_TABLE}_{self.start:%Y_%m}"
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional["MonthPartition"]:
+        """パーティション名から生成（命名規則に従わない場合は None）"""
+        match = _PARTITION_NAME.match(name)
+        if not match:
+            return None
+        return cls(date(int(match.group(1)), int(match.group(2)), 1))
+
+
+def month_start(value: datetime) -> date:
+    """UTC の月初日"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """月初日に月数を加算"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partitions_to_create(now: datetime, ahead: int) -> list[MonthPartition]:
+    """当月から ahead か月先までのパーティション"""
+    current = month_start(now)
+    return [MonthPartition(add_months(current, i)) for i in range(ahead + 1)]
+
+
+def expired_partitions(
+    names: list[str], now: datetime, retention_months: int
+) -> list[MonthPartition]:
+    """保持期間を過ぎたパーティション
+
+    当月を含む直近 retention_months か月より前に終了するパーティションを返却します。
+    """
+    cutoff = add_months(month_start(now), -(retention_months - 1))
+    partitions = [MonthPartition.from_name(name) for name in names]
+    return sorted(
+        (p for p in partitions if p is not None and p.end <= cutoff),
+        key=lambda p: p.start,
+    )
+
+
+async def list_partitions(conn: AsyncConnection) -> dict[str, bool]:
+    """job_logs のパーティション名と、切り離しが保留中かどうか
+
+    保留中は DETACH ... CONCURRENTLY が途中で中断したパーティションです。
+    """
+    result = await conn.execute(
+        text(
+            "SELECT c.relname, i.inhdetachpending FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return {name: pending for name, pending in result.all()}
+
+
+async def list_detached_tables(conn: AsyncConnection) -> list[str]:
+    """切り離し済みで削除されずに残っている job_logs_YYYY_MM テーブルの一覧"""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND c.relkind = 'r' "
+            "AND NOT c.relispartition AND c.relname ~ :pattern"
+        ),
+        {"pattern": _PARTITION_NAME.pattern},
+    )
+    return list(result.scalars().all())
+
+
+async def create_partitions(
+    conn: AsyncConnection, partitions: list[MonthPartition]
+) -> None:
+    """パーティションを作成（作成済みの場合は何もしない）"""
+    for partition in partitions:
+        await conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                f"PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{partition.start} 00:00:00+00') "
+                f"TO ('{partition.end} 00:00:00+00')"
+            )
+        )
+
+
+async def drop_partitions(
+    conn: AsyncConnection,
+    partitions: list[MonthPartition],
+    pending: frozenset[str] = frozenset(),
+) -> None:
+    """パーティションを切り離して削除（AUTOCOMMIT の接続で実行）
+
+    Args:
+        conn: AUTOCOMMIT の接続
+        partitions: 削除するパーティション
+        pending: 切り離しが保留中のパーティション名（FINALIZE で完了させる）
+    """
+    for partition in partitions:
+        mode = "FINALIZE" if partition.name in pending else "CONCURRENTLY"
+        await conn.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} "
+                f"DETACH PARTITION {partition.name} {mode}"
+            )
+        )
+        await conn.execute(text(f"DROP TABLE {partition.name}"))
+
+
+async def drop_tables(conn: AsyncConnection, partitions: list[MonthPartition]) -> None:
+    """切り離し済みのテーブルを削除"""
+    for partition in partitions:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {partition.name}"))
+
+
+async def manage_partitions(
+    conn: AsyncConnection,
+    retention_months: int,
+    ahead: int,
+    now: Optional[datetime] = None,
+) -> dict[str, list[str]]:
+    """先の月のパーティションを作成し、保持期間を過ぎたものを削除
+
+    Args:
+        conn: AUTOCOMMIT の接続
+        retention_months: 保持する月数（当月を含む）
+        ahead: 事前に作成する月数
+        now: 基準日時（省略時は現在時刻）
+
+    Returns:
+        作成したパーティション名（created）と削除したパーティション・
+        テーブル名（dropped）
+    """
+    now = now or datetime.now(timezone.utc)
+    existing = await list_partitions(conn)
+
+    missing = [p for p in partitions_to_create(now, ahead) if p.name not in existing]
+    await create_partitions(conn, missing)
+
+    pending = frozenset(name for name, detaching in existing.items() if detaching)
+    expired = expired_partitions(sorted(existing), now, retention_months)
+    await drop_partitions(conn, expired, pending)
+
+    # 以前の実行で切り離した後に削除できなかったテーブル（保持期間外のみ）
+    leftovers = expired_partitions(await list_detached_tables(conn), now, retention_months)
+    await drop_tables(conn, leftovers)
+
+    return {
+        "created": [p.name for p in missing],
+        "dropped": [p.name for p in expired + leftovers],
+    }
@@ -0,0 +1,128 @@
+"""ジョブログの一括書き込み
+
+生成・投稿のたびに JobLog を1行ずつ INSERT する代わりに、ジョブの
+セッションにログをためておき、コミットの直前に複数行の INSERT（Core）で
+まとめて書き込みます。
+
+- 書き込みはジョブと同じトランザクションで行うため、ジョブがコミット
+  されればログも必ず残り、ロールバックされればログも残りません
+- ロールバック・クローズしたセッションにたまっていたログは破棄します
+- ログの書き込みに失敗した場合はコミット自体が失敗します
+- 1回の INSERT は batch_size 行までに分割します
+
+まとめるのは1つのセッション（トランザクション）内のログだけです。記事1件の
+ジョブはコミットごとに1回の INSERT になり、セッションをまたいだ集約や、
+件数・時間による書き込み、終了時の書き込みは行いません。イベントは
+アプリケーションのセッション（AppSession）にのみ登録します。
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.features.job_logs.domain.models import JobLog
+from app.shared.domain.enums import JobStatus, JobType
+from app.shared.infrastructure.database import AppSession
+
+settings = get_settings()
+
+# 未書き込みのログを保持する Session.info のキー
+_PENDING = "job_logs_pending"
+
+
+class JobLogWriter:
+    """ジョブログのトランザクション内一括書き込み"""
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+
+    def add(
+        self,
+        db: AsyncSession,
+        article_id: UUID,
+        job_type: JobType,
+        status: JobStatus,
+        error_message: Optional[str] = None,
+        duration_ms: Optional[int] = None,
+        prompt_template_id: Optional[UUID] = None,
+        template_version: Optional[int] = None,
+        model: Optional[str] = None,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        """ジョブログを追加（db のコミット時に書き込み）
+
+        Args:
+            db: ジョブのセッション
+            article_id: 記事ID
+            job_type: ジョブ種別
+            status: ジョブステータス
+            error_message: エラーメッセージ
+            duration_ms: 処理時間（ミリ秒）
+            prompt_template_id: 生成に使ったプロンプトテンプレートID
+            template_version: 生成に使ったプロンプトテンプレートのバージョン
+            model: 生成に使ったモデル名
+            input_tokens: 入力トークン数
+            output_tokens: 出力トークン数
+        """
+        # 複数行 INSERT は全行で同じ列が必要なため、既定値もここで設定する
+        pending_rows(db).append({
+            "id": uuid4(),
+            "article_id": article_id,
+            "job_type": job_type,
+            "status": status,
+            "error_message": error_message,
+            "duration_ms": duration_ms,
+            "prompt_template_id": prompt_template_id,
+            "template_version": template_version,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "created_at": datetime.now(timezone.utc),
+        })
+
+    def write(self, session: Session) -> int:
+        """たまっているログを複数行の INSERT で書き込む
+
+        Args:
+            session: ジョブのセッション（同期。AsyncSession.sync_session）
+
+        Returns:
+            書き込んだ行数
+        """
+        rows = session.info.pop(_PENDING, None)
+        if not rows:
+            return 0
+        for start in range(0, len(rows), self.batch_size):
+            session.execute(insert(JobLog).values(rows[start:start + self.batch_size]))
+        return len(rows)
+
+
+def pending_rows(db: AsyncSession | Session) -> list[dict[str, Any]]:
+    """セッションにたまっている未書き込みのログ"""
+    return db.info.setdefault(_PENDING, [])
+
+
+# シングルトンインスタンス
+job_log_writer = JobLogWriter(batch_size=settings.job_log_batch_size)
+
+
+@event.listens_for(AppSession, "before_commit")
+def _write_before_commit(session: Session) -> None:
+    """コミットの直前に、同じトランザクションでログを書き込む"""
+    job_log_writer.write(session)
+
+
+@event.listens_for(AppSession, "after_transaction_end")
+def _discard_after_transaction(session: Session, transaction) -> None:
+    """コミットされなかった（ロールバック・クローズ）ジョブのログを破棄
+
+    SAVEPOINT の終了では破棄しません。
+    """
+    if transaction.parent is None:
+        session.info.pop(_PENDING, None)
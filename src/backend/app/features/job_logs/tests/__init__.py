@@ -0,0 +1 @@
+"""ジョブログテスト"""
@@ -0,0 +1,125 @@
+"""job_logs パーティション管理のテスト"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from app.features.job_logs.infrastructure.partitions import (
+    MonthPartition,
+    add_months,
+    expired_partitions,
+    manage_partitions,
+    partitions_to_create,
+)
+
+NOW = datetime(2026, 2, 16, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return FakeResult([row[0] for row in self.rows])
+
+    def all(self):
+        return self.rows
+
+
+class FakeConnection:
+    """実行したSQLを記録する接続
+
+    partitions はパーティション名と切り離し保留中かどうか、
+    detached は切り離し済みで残っているテーブル名
+    """
+
+    def __init__(self, partitions, detached=()):
+        self.partitions = partitions
+        self.detached = list(detached)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SELECT"):
+            if "pg_inherits" in sql:
+                return FakeResult(list(self.partitions.items()))
+            return FakeResult([(name,) for name in self.detached])
+        self.statements.append(sql)
+
+
+class TestMonthPartition:
+    """月次パーティションの計算のテスト"""
+
+    def test_name_and_bounds(self):
+        """パーティション名と範囲が月単位になることをテスト"""
+        partition = MonthPartition(date(2026, 12, 1))
+
+        assert partition.name == "job_logs_2026_12"
+        assert partition.end == date(2027, 1, 1)
+        assert MonthPartition.from_name("job_logs_2026_12") == partition
+        assert MonthPartition.from_name("job_logs_default") is None
+
+    def test_add_months_crosses_years(self):
+        """年をまたぐ月の加減算をテスト"""
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+        assert add_months(date(2026, 11, 1), 14) == date(2028, 1, 1)
+
+    def test_partitions_to_create_uses_utc_month(self):
+        """当月（UTC）から指定月数先までのパーティションをテスト"""
+        jst = timezone(timedelta(hours=9))
+        now = datetime(2026, 3, 1, 5, 0, tzinfo=jst)  # UTC では 2月28日
+
+        names = [p.name for p in partitions_to_create(now, ahead=2)]
+
+        assert names == ["job_logs_2026_02", "job_logs_2026_03", "job_logs_2026_04"]
+
+    def test_expired_partitions_keep_retention_window(self):
+        """当月を含む保持月数より前のパーティションのみが対象になることをテスト"""
+        names = [
+            "job_logs_2025_07",
+            "job_logs_2025_08",
+            "job_logs_2025_09",
+            "job_logs_2026_02",
+            "job_logs_other",
+        ]
+
+        expired = expired_partitions(names, NOW, retention_months=6)
+
+        # 保持対象は 2025年9月〜2026年2月
+        assert [p.name for p in expired] == ["job_logs_2025_07", "job_logs_2025_08"]
+
+
+class TestManagePartitions:
+    """manage_partitions のテスト"""
+
+    async def test_creates_missing_and_drops_expired(self):
+        """不足分の作成と保持期間外の切り離し・削除をテスト"""
+        conn = FakeConnection({"job_logs_2025_01": False, "job_logs_2026_02": False})
+
+        result = await manage_partitions(conn, retention_months=3, ahead=1, now=NOW)
+
+        assert result == {"created": ["job_logs_2026_03"], "dropped": ["job_logs_2025_01"]}
+        assert conn.statements == [
+            "CREATE TABLE IF NOT EXISTS job_logs_2026_03 PARTITION OF job_logs "
+            "FOR VALUES FROM ('2026-03-01 00:00:00+00') TO ('2026-04-01 00:00:00+00')",
+            "ALTER TABLE job_logs DETACH PARTITION job_logs_2025_01 CONCURRENTLY",
+            "DROP TABLE job_logs_2025_01",
+        ]
+
+    async def test_recovers_interrupted_detach_and_leftover_tables(self):
+        """中断した切り離しの完了と、削除されずに残ったテーブルの削除をテスト"""
+        conn = FakeConnection(
+            {"job_logs_2025_10": True, "job_logs_2026_02": False, "job_logs_2026_03": False},
+            detached=["job_logs_2025_09", "job_logs_2026_01"],
+        )
+
+        result = await manage_partitions(conn, retention_months=3, ahead=1, now=NOW)
+
+        assert result == {
+            "created": [],
+            "dropped": ["job_logs_2025_10", "job_logs_2025_09"],
+        }
+        assert conn.statements == [
+            "ALTER TABLE job_logs DETACH PARTITION job_logs_2025_10 FINALIZE",
+            "DROP TABLE job_logs_2025_10",
+            # 保持期間内のテーブルは残す
+            "DROP TABLE IF EXISTS job_logs_2025_09",
+        ]
@@ -0,0 +1,137 @@
+"""ジョブログ一括書き込みのテスト"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.features.job_logs.domain.models import JobLog
+from app.features.job_logs.infrastructure.writer import (
+    JobLogWriter,
+    job_log_writer,
+    pending_rows,
+)
+from app.shared.domain import models  # noqa
+from app.shared.domain.enums import JobStatus, JobType
+from app.shared.infrastructure.database import AppSession
+
+
+class FakeSession:
+    """実行した文を記録する同期セッション"""
+
+    def __init__(self):
+        self.info = {}
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def engine():
+    """job_logs と同じ列を持つテーブルの SQLite（型・パーティションは対象外）"""
+    engine = create_engine("sqlite://")
+    columns = ", ".join(column.name for column in JobLog.__table__.columns)
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE TABLE job_logs ({columns})"))
+
+    inserts = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(statement)
+
+    engine.inserts = inserts
+    return engine
+
+
+def _add(writer, db, count=1, status=JobStatus.SUCCESS):
+    for _ in range(count):
+        writer.add(
+            db,
+            article_id=uuid4(),
+            job_type=JobType.GENERATE,
+            status=status,
+            duration_ms=10,
+        )
+
+
+def _count(session: Session) -> int:
+    return session.scalar(text("SELECT count(*) FROM job_logs"))
+
+
+class TestJobLogWriter:
+    """JobLogWriterのテスト"""
+
+    def test_add_keeps_rows_on_session(self):
+        """コミットまではセッションにたまることをテスト"""
+        db = FakeSession()
+
+        _add(JobLogWriter(), db, count=2)
+
+        rows = pending_rows(db)
+        assert len(rows) == 2
+        assert rows[0]["job_type"] == JobType.GENERATE
+        assert rows[0]["id"] != rows[1]["id"]
+        assert rows[0]["created_at"] is not None
+        assert db.statements == []
+
+    def test_write_uses_multi_row_inserts(self):
+        """batch_size 件ごとの複数行 INSERT で書き込まれることをテスト"""
+        db = FakeSession()
+        writer = JobLogWriter(batch_size=3)
+        _add(writer, db, count=7)
+
+        assert writer.write(db) == 7
+        assert writer.write(db) == 0
+
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO job_logs")
+        assert sql.count("VALUES") == 1
+        assert [len(s.compile().params) // 12 for s in db.statements] == [3, 3, 1]
+
+    def test_commit_writes_in_same_transaction(self, engine):
+        """コミットの直前に1回の INSERT で書き込まれることをテスト"""
+        with AppSession(engine) as session:
+            _add(job_log_writer, session, count=3)
+            assert _count(session) == 0
+
+            session.commit()
+
+            assert _count(session) == 3
+            assert len(engine.inserts) == 1
+            assert pending_rows(session) == []
+
+    def test_rollback_discards_rows(self, engine):
+        """ロールバックしたジョブのログが書き込まれないことをテスト"""
+        with AppSession(engine) as session:
+            session.execute(text("SELECT 1"))
+            _add(job_log_writer, session, count=2)
+            session.rollback()
+            session.commit()
+
+            assert _count(session) == 0
+            assert engine.inserts == []
+
+    def test_other_sessions_are_not_affected(self, engine):
+        """AppSession 以外のセッションのコミットでは書き込まないことをテスト"""
+        with Session(engine) as session:
+            _add(job_log_writer, session, count=2)
+            session.commit()
+
+            assert engine.inserts == []
+            assert len(pending_rows(session)) == 2
+
+    def test_close_without_commit_discards_rows(self, engine):
+        """コミットせずにクローズしたセッションのログが破棄されることをテスト"""
+        session = AppSession(engine)
+        session.execute(text("SELECT 1"))
+        _add(job_log_writer, session)
+        session.close()
+
+        assert pending_rows(session) == []
+        with AppSession(engine) as check:
+            assert _count(check) == 0
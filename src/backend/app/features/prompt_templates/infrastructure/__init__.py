@@ -0,0 +1 @@
+"""プロンプトテンプレートインフラストラクチャ層"""
@@ -0,0 +1,64 @@
+"""プロンプトテンプレートリポジトリ"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.prompt_templates.domain.models import PromptTemplate
+from app.features.prompt_templates.domain.schemas import PromptTemplateResponse
+from app.shared.infrastructure.cache import cache
+
+# テンプレートのキャッシュタグ（テンプレートの作成・更新・削除のコミット後に無効化）
+PROMPT_TEMPLATES_TAG = "prompt_templates"
+cache.invalidate_on_change(PromptTemplate, PROMPT_TEMPLATES_TAG)
+
+
+class PromptTemplateRepository:
+    """プロンプトテンプレートリポジトリ"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_by_id(self, template_id: UUID) -> Optional[PromptTemplate]:
+        """IDでテンプレート取得"""
+        result = await self.session.execute(
+            select(PromptTemplate).where(PromptTemplate.id == template_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def find_active_by_category(
+        self, category_id: UUID
+    ) -> Optional[PromptTemplate]:
+        """カテゴリの有効なテンプレート取得"""
+        result = await self.session.execute(
+            select(PromptTemplate)
+            .where(PromptTemplate.category_id == category_id)
+            .where(PromptTemplate.is_active == True)  # noqa: E712
+        )
+        return result.scalar_one_or_none()
+
+    @cache.cached(
+        key=lambda self, template_id: f"prompt_templates:{template_id}",
+        tags=lambda self, template_id: [PROMPT_TEMPLATES_TAG],
+        type_=Optional[PromptTemplateResponse],
+    )
+    async def find_by_id_cached(
+        self, template_id: UUID
+    ) -> Optional[PromptTemplateResponse]:
+        """IDでテンプレート取得（キャッシュ経由・読み取り専用）"""
+        template = await self.find_by_id(template_id)
+        return PromptTemplateResponse.model_validate(template) if template else None
+
+    @cache.cached(
+        key=lambda self, category_id: f"prompt_templates:active:{category_id}",
+        tags=lambda self, category_id: [PROMPT_TEMPLATES_TAG],
+        type_=Optional[PromptTemplateResponse],
+    )
+    async def find_active_by_category_cached(
+        self, category_id: UUID
+    ) -> Optional[PromptTemplateResponse]:
+        """カテゴリの有効なテンプレート取得（キャッシュ経由・読み取り専用）"""
+        template = await self.find_active_by_category(category_id)
+        return PromptTemplateResponse.model_validate(template) if template else None
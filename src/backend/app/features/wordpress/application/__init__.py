@@ -0,0 +1,4 @@
+"""WordPressアプリケーション層"""
+from .bulk_publisher import WordPressBulkPublisher, get_bulk_publisher
+
+__all__ = ["WordPressBulkPublisher", "get_bulk_publisher"]
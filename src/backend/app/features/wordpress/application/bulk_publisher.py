@@ -0,0 +1,403 @@
+"""WordPress一括投稿サービス
+
+複数記事のWordPress下書き作成・公開・差分同期を処理します。
+記事は1クエリで一括取得し、WordPressへのHTTPリクエストは
+共有の httpx.AsyncClient 上で同時実行数を制限して並列に送信します。
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from tenacity import RetryError
+
+from app.core.config import get_settings
+from app.features.articles.application.html_renderer import refresh_rendered_html
+from app.features.articles.domain.models import Article
+from app.features.categories.domain.models import Category
+from app.features.job_logs.infrastructure.writer import job_log_writer
+from app.features.sheets.infrastructure.google_sheets_service import sheets_service
+from app.features.wordpress.application.post_sync import (
+    changed_post_fields,
+    record_pushed_content,
+)
+from app.features.wordpress.domain.schemas import (
+    BulkPublishItemResult,
+    BulkPublishResponse,
+)
+from app.shared.domain.enums import ArticleStatus, JobStatus, JobType
+from app.shared.infrastructure.services.wordpress_service import (
+    PostStatus,
+    WordPressPost,
+    WordPressService,
+    wordpress_service,
+)
+
+settings = get_settings()
+
+
+@dataclass
+class _PushOutcome:
+    """WordPressへの1件分のリクエスト結果"""
+
+    post: Optional[WordPressPost]
+    error: Optional[str]
+    duration_ms: int
+
+
+class WordPressBulkPublisher:
+    """WordPress一括投稿サービス"""
+
+    def __init__(self, service: WordPressService = wordpress_service):
+        self.service = service
+
+    async def create_drafts(
+        self,
+        db: AsyncSession,
+        article_ids: Sequence[UUID],
+        concurrency: Optional[int] = None,
+    ) -> BulkPublishResponse:
+        """複数記事をWordPressに下書きとして投稿
+
+        Args:
+            db: データベースセッション
+            article_ids: 対象記事IDリスト（重複は除外）
+            concurrency: 同時実行数（省略時は設定値）
+
+        Returns:
+            記事ごとの結果を含むレスポンス
+        """
+        ids = list(dict.fromkeys(article_ids))
+        articles = await self._fetch_articles(db, ids)
+
+        results: dict[UUID, BulkPublishItemResult] = {}
+        targets: list[Article] = []
+        for article_id in ids:
+            article = articles.get(article_id)
+            if article is None:
+                results[article_id] = _failure(article_id, "Article not found")
+            elif not article.content:
+                results[article_id] = _failure(article_id, "Article has no content")
+            elif article.wp_post_id:
+                results[article_id] = _failure(
+                    article_id, "Article already has WordPress post"
+                )
+            else:
+                targets.append(article)
+
+        pushed: dict[UUID, tuple[str, str]] = {}
+
+        async def push(article: Article) -> WordPressPost:
+            # 保存済みのHTMLを利用（未生成・古い場合のみ変換）
+            title = article.title or article.keyword
+            html_content = refresh_rendered_html(article)
+            pushed[article.id] = (title, html_content)
+            return await self.service.create_post(
+                title=title,
+                content=html_content,
+                status=PostStatus.DRAFT,
+            )
+
+        outcomes = await self._run_concurrently(targets, push, concurrency)
+
+        for article, outcome in zip(targets, outcomes):
+            if outcome.post is not None:
+                article.wp_post_id = outcome.post.id
+                article.wp_url = outcome.post.link
+                record_pushed_content(article, *pushed[article.id])
+            results[article.id] = self._record(db, article, outcome)
+
+        await db.flush()
+        await self._sync_to_sheets(db, targets, results)
+
+        return _build_response(ids, results)
+
+    async def publish(
+        self,
+        db: AsyncSession,
+        article_ids: Sequence[UUID],
+        concurrency: Optional[int] = None,
+    ) -> BulkPublishResponse:
+        """WordPress下書きを一括で公開
+
+        Args:
+            db: データベースセッション
+            article_ids: 対象記事IDリスト（重複は除外）
+            concurrency: 同時実行数（省略時は設定値）
+
+        Returns:
+            記事ごとの結果を含むレスポンス
+        """
+        ids = list(dict.fromkeys(article_ids))
+        articles = await self._fetch_articles(db, ids, with_content=False)
+
+        results: dict[UUID, BulkPublishItemResult] = {}
+        targets: list[Article] = []
+        for article_id in ids:
+            article = articles.get(article_id)
+            if article is None:
+                results[article_id] = _failure(article_id, "Article not found")
+            elif not article.wp_post_id:
+                results[article_id] = _failure(article_id, "Create draft first")
+            else:
+                targets.append(article)
+
+        async def push(article: Article) -> WordPressPost:
+            return await self.service.publish_post(article.wp_post_id)
+
+        outcomes = await self._run_concurrently(targets, push, concurrency)
+
+        for article, outcome in zip(targets, outcomes):
+            if outcome.post is not None:
+                article.status = ArticleStatus.PUBLISHED
+                article.wp_url = outcome.post.link
+                article.wp_published_at = datetime.utcnow()
+            results[article.id] = self._record(db, article, outcome)
+
+        await db.flush()
+        await self._sync_to_sheets(db, targets, results)
+
+        return _build_response(ids, results)
+
+    async def sync_posts(
+        self,
+        db: AsyncSession,
+        article_ids: Sequence[UUID],
+        concurrency: Optional[int] = None,
+    ) -> BulkPublishResponse:
+        """既存のWordPress投稿に記事の最新内容を差分同期
+
+        前回送信時のハッシュと比較し、変更のあったフィールドだけを送信します。
+        変更がない記事はHTTPリクエストを行わずにスキップします。
+
+        Args:
+            db: データベースセッション
+            article_ids: 対象記事IDリスト（重複は除外）
+            concurrency: 同時実行数（省略時は設定値）
+
+        Returns:
+            記事ごとの結果を含むレスポンス
+        """
+        ids = list(dict.fromkeys(article_ids))
+        articles = await self._fetch_articles(db, ids)
+
+        results: dict[UUID, BulkPublishItemResult] = {}
+        targets: list[Article] = []
+        pending: dict[UUID, tuple[str, str, dict[str, str]]] = {}
+        for article_id in ids:
+            article = articles.get(article_id)
+            if article is None:
+                results[article_id] = _failure(article_id, "Article not found")
+                continue
+            if not article.wp_post_id:
+                results[article_id] = _failure(article_id, "Create draft first")
+                continue
+            if not article.content:
+                results[article_id] = _failure(article_id, "Article has no content")
+                continue
+
+            title = article.title or article.keyword
+            html_content = refresh_rendered_html(article)
+            fields = changed_post_fields(article, title, html_content)
+            if not fields:
+                results[article_id] = BulkPublishItemResult(
+                    article_id=article_id,
+                    success=True,
+                    wp_post_id=article.wp_post_id,
+                    wp_url=article.wp_url,
+                    updated_fields=[],
+                )
+                continue
+
+            pending[article_id] = (title, html_content, fields)
+            targets.append(article)
+
+        async def push(article: Article) -> WordPressPost:
+            fields = pending[article.id][2]
+            return await self.service.update_post(article.wp_post_id, **fields)
+
+        outcomes = await self._run_concurrently(targets, push, concurrency)
+
+        for article, outcome in zip(targets, outcomes):
+            title, html_content, fields = pending[article.id]
+            if outcome.post is not None:
+                article.wp_url = outcome.post.link
+                record_pushed_content(article, title, html_content)
+            result = self._record(db, article, outcome)
+            if result.success:
+                result.updated_fields = sorted(fields)
+            results[article.id] = result
+
+        if targets:
+            await db.flush()
+
+        return _build_response(ids, results)
+
+    async def _fetch_articles(
+        self, db: AsyncSession, article_ids: list[UUID], with_content: bool = True
+    ) -> dict[UUID, Article]:
+        """対象記事を1クエリで取得（with_content が True の場合は本文も読み込む）"""
+        if not article_ids:
+            return {}
+        query = select(Article).where(Article.id.in_(article_ids))
+        if with_content:
+            query = query.options(joinedload(Article.current_content))
+        result = await db.execute(query)
+        return {article.id: article for article in result.unique().scalars().all()}
+
+    async def _run_concurrently(
+        self,
+        articles: list[Article],
+        operation: Callable[[Article], Awaitable[WordPressPost]],
+        concurrency: Optional[int],
+    ) -> list[_PushOutcome]:
+        """同時実行数を制限してWordPressリクエストを実行
+
+        DBセッションは並列に使用できないため、ここではHTTPリクエストのみを
+        並列化し、記事の更新は呼び出し側で順番に適用します。
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.wordpress_bulk_concurrency)
+
+        async def run(article: Article) -> _PushOutcome:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    post = await operation(article)
+                    error = None
+                except Exception as e:
+                    post = None
+                    error = _error_message(e)
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                return _PushOutcome(post=post, error=error, duration_ms=duration_ms)
+
+        return list(await asyncio.gather(*(run(article) for article in articles)))
+
+    def _record(
+        self, db: AsyncSession, article: Article, outcome: _PushOutcome
+    ) -> BulkPublishItemResult:
+        """ジョブログを追加し、個別結果を生成"""
+        job_log_writer.add(
+            db,
+            article_id=article.id,
+            job_type=JobType.PUBLISH,
+            status=JobStatus.SUCCESS if outcome.post else JobStatus.FAILED,
+            error_message=outcome.error,
+            duration_ms=outcome.duration_ms,
+        )
+
+        if outcome.post is None:
+            return _failure(article.id, outcome.error)
+
+        return BulkPublishItemResult(
+            article_id=article.id,
+            success=True,
+            wp_post_id=outcome.post.id,
+            wp_url=outcome.post.link,
+            status=outcome.post.status,
+        )
+
+    async def _sync_to_sheets(
+        self,
+        db: AsyncSession,
+        articles: list[Article],
+        results: dict[UUID, BulkPublishItemResult],
+    ) -> None:
+        """成功した記事のステータスをGoogle Sheetsに同期
+
+        Note:
+            カテゴリは1クエリで取得し、Sheetsの更新はまとめて別スレッドで実行
+            （Sheetsのエラーは無視して処理を継続）
+        """
+        synced = [a for a in articles if results[a.id].success]
+        if not synced:
+            return
+
+        try:
+            category_ids = {a.category_id for a in synced}
+            result = await db.execute(
+                select(Category).where(Category.id.in_(category_ids))
+            )
+            categories = {c.id: c for c in result.scalars().all()}
+        except Exception:
+            return
+
+        rows = [
+            (
+                category.sheet_id,
+                article.keyword,
+                article.status,
+                article.title,
+                article.wp_url,
+                article.wp_post_id,
+            )
+            for article in synced
+            if (category := categories.get(article.category_id)) and category.sheet_id
+        ]
+        if rows:
+            # gspread は同期APIのため、イベントループを止めないよう別スレッドで実行
+            await asyncio.to_thread(_update_sheets, rows)
+
+
+def _update_sheets(rows: list[tuple]) -> None:
+    """Google Sheetsの記事ステータスを順に更新（Sheetsのエラーは無視して継続）"""
+    for row in rows:
+        try:
+            sheets_service.update_article_status(*row)
+        except Exception:
+            pass
+
+
+def _failure(article_id: UUID, error: Optional[str]) -> BulkPublishItemResult:
+    """失敗結果を生成"""
+    return BulkPublishItemResult(article_id=article_id, success=False, error=error)
+
+
+def _error_message(error: Exception) -> str:
+    """例外からエラーメッセージを取得（tenacityのRetryErrorは元の例外を展開）"""
+    if isinstance(error, RetryError):
+        cause = error.last_attempt.exception()
+        if cause is not None:
+            error = cause
+    detail = getattr(error, "detail", None)
+    return str(detail) if detail else str(error)
+
+
+def _build_response(
+    article_ids: list[UUID], results: dict[UUID, BulkPublishItemResult]
+) -> BulkPublishResponse:
+    """リクエスト順に個別結果を並べたレスポンスを生成"""
+    ordered = [results[article_id] for article_id in article_ids]
+    success_count = sum(1 for r in ordered if r.success)
+    skipped_count = sum(1 for r in ordered if r.success and r.updated_fields == [])
+    return BulkPublishResponse(
+        total=len(ordered),
+        success=success_count,
+        failed=len(ordered) - success_count,
+        skipped=skipped_count,
+        results=ordered,
+    )
+
+
+def merge_responses(responses: Sequence[BulkPublishResponse]) -> BulkPublishResponse:
+    """チャンクごとのレスポンスを1つにまとめる"""
+    return BulkPublishResponse(
+        total=sum(r.total for r in responses),
+        success=sum(r.success for r in responses),
+        failed=sum(r.failed for r in responses),
+        skipped=sum(r.skipped for r in responses),
+        results=[item for r in responses for item in r.results],
+    )
+
+
+@lru_cache
+def get_bulk_publisher() -> WordPressBulkPublisher:
+    """WordPressBulkPublisherのシングルトンインスタンスを取得"""
+    return WordPressBulkPublisher()
@@ -0,0 +1,60 @@
+"""WordPress投稿の差分同期ユーティリティ
+
+最後にWordPressへ送信したタイトル・本文HTMLのハッシュを
+Article.metadata_ に保存し、次回の同期で変更のあったフィールドだけを
+送信できるようにします。
+"""
+
+from datetime import datetime
+
+from app.features.articles.domain.models import Article
+from app.shared.domain.hashing import sha256_hex
+
+# Article.metadata_ 内の保存キー
+WP_METADATA_KEY = "wordpress"
+# 送信した本文HTMLのハッシュのキー（LEGACY_HTML_HASH_KEY は以前のキー）
+HTML_HASH_KEY = "html_hash"
+LEGACY_HTML_HASH_KEY = "content_hash"
+
+
+def changed_post_fields(article: Article, title: str, html: str) -> dict[str, str]:
+    """前回の送信内容から変更されたフィールドを取得
+
+    Args:
+        article: 対象記事
+        title: 送信予定のタイトル
+        html: 送信予定の本文HTML
+
+    Returns:
+        変更のあったフィールド（WordPress REST APIのキー → 値）。
+        変更がない場合は空の辞書
+    """
+    pushed = (article.metadata_ or {}).get(WP_METADATA_KEY) or {}
+
+    fields: dict[str, str] = {}
+    if pushed.get("title_hash") != sha256_hex(title):
+        fields["title"] = title
+    html_hash = pushed.get(HTML_HASH_KEY, pushed.get(LEGACY_HTML_HASH_KEY))
+    if html_hash != sha256_hex(html):
+        fields["content"] = html
+    return fields
+
+
+def record_pushed_content(article: Article, title: str, html: str) -> None:
+    """WordPressへ送信した内容のハッシュを記録
+
+    JSONBカラムの変更を検知させるため、metadata_ は新しい辞書で置き換えます。
+
+    Args:
+        article: 対象記事
+        title: 送信したタイトル
+        html: 送信した本文HTML
+    """
+    article.metadata_ = {
+        **(article.metadata_ or {}),
+        WP_METADATA_KEY: {
+            "title_hash": sha256_hex(title),
+            HTML_HASH_KEY: sha256_hex(html),
+            "pushed_at": datetime.utcnow().isoformat(),
+        },
+    }
@@ -1,5 +1,6 @@
 """WordPress API スキーマ"""
 
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -11,10 +12,50 @@ class PublishRequest(BaseModel):
     article_id: UUID = Field(..., description="記事ID")
 
 
-class PublishResponse(BaseModel):
-    """WordPress投稿レスポンス"""
+class PublishJobResponse(BaseModel):
+    """WordPress投稿ジョブレスポンス"""
 
+    job_id: str = Field(..., description="ジョブID（/api/batch/status/{job_id}で確認）")
     article_id: UUID = Field(..., description="記事ID")
-    wp_post_id: int = Field(..., description="WordPress投稿ID")
-    wp_url: str = Field(..., description="WordPress投稿URL")
-    status: str = Field(..., description="投稿ステータス（draft/publish）")
+    message: str = Field(..., description="ステータスメッセージ")
+
+
+class BulkPublishRequest(BaseModel):
+    """WordPress一括投稿リクエスト"""
+
+    article_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="記事IDリスト（最大200件）",
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=20,
+        description="同時実行数（省略時は設定値）",
+    )
+
+
+class BulkPublishItemResult(BaseModel):
+    """WordPress一括投稿の個別結果"""
+
+    article_id: UUID = Field(..., description="記事ID")
+    success: bool = Field(..., description="成功したかどうか")
+    wp_post_id: Optional[int] = Field(None, description="WordPress投稿ID")
+    wp_url: Optional[str] = Field(None, description="WordPress投稿URL")
+    status: Optional[str] = Field(None, description="投稿ステータス（draft/publish）")
+    updated_fields: Optional[list[str]] = Field(
+        None, description="送信したフィールド（同期時のみ、変更なしの場合は空）"
+    )
+    error: Optional[str] = Field(None, description="エラーメッセージ")
+
+
+class BulkPublishResponse(BaseModel):
+    """WordPress一括投稿レスポンス"""
+
+    total: int = Field(..., description="処理記事総数")
+    success: int = Field(..., description="成功件数")
+    failed: int = Field(..., description="失敗件数")
+    skipped: int = Field(0, description="変更がなく送信をスキップした件数")
+    results: list[BulkPublishItemResult] = Field(..., description="個別結果")
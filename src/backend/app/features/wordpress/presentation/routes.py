@@ -1,36 +1,34 @@
 """WordPress API ルート"""
 
-from datetime import datetime
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, status
-from sqlalchemy import select
+from arq.connections import ArqRedis
+from fastapi import APIRouter, HTTPException, status
 
 from app.features.articles.infrastructure.repository import ArticleRepository
-from app.features.categories.domain.models import Category
-from app.features.job_logs.domain.models import JobLog
-from app.features.sheets.infrastructure.google_sheets_service import sheets_service
-from app.features.wordpress.domain.schemas import PublishRequest, PublishResponse
-from app.shared.domain.enums import ArticleStatus, JobStatus, JobType
-from app.shared.domain.exceptions import NotFoundError, ValidationError
-from app.shared.infrastructure.dependencies import DbSession
-from app.shared.infrastructure.services.markdown_converter import markdown_converter
-from app.shared.infrastructure.services.wordpress_service import (
-    PostStatus,
-    wordpress_service,
+from app.features.wordpress.application.bulk_publisher import get_bulk_publisher
+from app.features.wordpress.domain.schemas import (
+    BulkPublishRequest,
+    BulkPublishResponse,
+    PublishJobResponse,
+    PublishRequest,
 )
+from app.shared.domain.exceptions import NotFoundError, ValidationError
+from app.shared.infrastructure.dependencies import DbSession, Queue
 
 router = APIRouter(prefix="/wordpress", tags=["WordPress"])
 
 
-@router.post("/draft", response_model=PublishResponse, status_code=status.HTTP_201_CREATED)
-async def create_draft(data: PublishRequest, db: DbSession):
+@router.post("/draft", response_model=PublishJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_draft(data: PublishRequest, db: DbSession, pool: Queue):
     """WordPress下書き作成
 
-    記事をWordPressに下書きとして投稿します。
+    記事をWordPressに下書きとして投稿するジョブをエンキューします。
     記事にコンテンツが存在し、まだWordPress投稿IDが割り当てられていない必要があります。
+    ジョブIDが返却されるので、/batch/status/{job_id}で結果を確認できます。
     """
     repo = ArticleRepository(db)
-    article = await repo.find_by_id(data.article_id)
+    article = await repo.find_by_id(data.article_id, with_content=True)
 
     if not article:
         raise NotFoundError("Article", str(data.article_id))
@@ -41,51 +39,39 @@ async def create_draft(data: PublishRequest, db: DbSession):
     if article.wp_post_id:
         raise ValidationError("Article already has WordPress post")
 
-    # Markdown → HTML変換
-    html_content = markdown_converter.convert(article.content)
+    return await _enqueue_publish_job(pool, "create_draft_task", article.id)
 
-    # WordPress投稿作成
-    wp_post = await wordpress_service.create_post(
-        title=article.title or article.keyword,
-        content=html_content,
-        status=PostStatus.DRAFT,
-    )
 
-    # 記事情報更新
-    article.wp_post_id = wp_post.id
-    article.wp_url = wp_post.link
+@router.post("/publish", response_model=PublishJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def publish_article(data: PublishRequest, db: DbSession, pool: Queue):
+    """WordPress記事公開
 
-    # ジョブログ記録
-    job_log = JobLog(
-        article_id=article.id,
-        job_type=JobType.PUBLISH,
-        status=JobStatus.SUCCESS,
-    )
-    db.add(job_log)
+    WordPress下書きを公開状態に変更するジョブをエンキューします。
+    事前に下書きが作成されている必要があります。
+    ジョブIDが返却されるので、/batch/status/{job_id}で結果を確認できます。
+    """
+    repo = ArticleRepository(db)
+    article = await repo.find_by_id(data.article_id)
 
-    await db.flush()
-    await db.refresh(article)
+    if not article:
+        raise NotFoundError("Article", str(data.article_id))
 
-    # Google Sheetsに同期
-    await _sync_to_sheets(db, article)
+    if not article.wp_post_id:
+        raise ValidationError("Create draft first")
 
-    return PublishResponse(
-        article_id=article.id,
-        wp_post_id=wp_post.id,
-        wp_url=wp_post.link,
-        status=wp_post.status,
-    )
+    return await _enqueue_publish_job(pool, "publish_article_task", article.id)
 
 
-@router.post("/publish", response_model=PublishResponse)
-async def publish_article(data: PublishRequest, db: DbSession):
-    """WordPress記事公開
+@router.post("/sync", response_model=PublishJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def sync_post(data: PublishRequest, db: DbSession, pool: Queue):
+    """WordPress投稿の差分同期
 
-    WordPress下書きを公開状態に変更します。
-    事前に下書きが作成されている必要があります。
+    編集・再生成された記事の内容を既存のWordPress投稿に反映するジョブをエンキューします。
+    前回送信時から変更のあったフィールドのみを送信し、
+    変更がない場合はWordPressへのリクエストを行いません。
     """
     repo = ArticleRepository(db)
-    article = await repo.find_by_id(data.article_id)
+    article = await repo.find_by_id(data.article_id, with_content=True)
 
     if not article:
         raise NotFoundError("Article", str(data.article_id))
@@ -93,54 +79,74 @@ async def publish_article(data: PublishRequest, db: DbSession):
     if not article.wp_post_id:
         raise ValidationError("Create draft first")
 
-    # WordPress投稿公開
-    wp_post = await wordpress_service.publish_post(article.wp_post_id)
+    if not article.content:
+        raise ValidationError("Article has no content")
 
-    # 記事ステータス更新
-    article.status = ArticleStatus.PUBLISHED
-    article.wp_url = wp_post.link
-    article.wp_published_at = datetime.utcnow()
+    return await _enqueue_publish_job(pool, "sync_post_task", article.id)
 
-    await db.flush()
-    await db.refresh(article)
 
-    # Google Sheetsに同期
-    await _sync_to_sheets(db, article)
+@router.post("/draft/bulk", response_model=BulkPublishResponse)
+async def create_drafts_bulk(data: BulkPublishRequest, db: DbSession):
+    """WordPress下書き一括作成
 
-    return PublishResponse(
-        article_id=article.id,
-        wp_post_id=wp_post.id,
-        wp_url=wp_post.link,
-        status=wp_post.status,
-    )
+    複数の記事をWordPressに下書きとして並列投稿します。
+    記事ごとに成否を返却し、一部が失敗しても他の記事の処理は継続します。
+    大量の記事は /api/batch/wordpress/draft でバックグラウンド実行してください。
+    """
+    publisher = get_bulk_publisher()
+    return await publisher.create_drafts(db, data.article_ids, data.concurrency)
+
+
+@router.post("/publish/bulk", response_model=BulkPublishResponse)
+async def publish_articles_bulk(data: BulkPublishRequest, db: DbSession):
+    """WordPress記事一括公開
+
+    複数のWordPress下書きを並列に公開状態へ変更します。
+    記事ごとに成否を返却し、一部が失敗しても他の記事の処理は継続します。
+    大量の記事は /api/batch/wordpress/publish でバックグラウンド実行してください。
+    """
+    publisher = get_bulk_publisher()
+    return await publisher.publish(db, data.article_ids, data.concurrency)
 
 
-async def _sync_to_sheets(db: DbSession, article) -> None:
-    """Google Sheetsに記事ステータスを同期
+@router.post("/sync/bulk", response_model=BulkPublishResponse)
+async def sync_posts_bulk(data: BulkPublishRequest, db: DbSession):
+    """WordPress投稿の一括差分同期
+
+    複数記事の最新内容を既存のWordPress投稿に並列で反映します。
+    変更のない記事はWordPressへのリクエストを行わずにスキップします。
+    大量の記事は /api/batch/wordpress/sync でバックグラウンド実行してください。
+    """
+    publisher = get_bulk_publisher()
+    return await publisher.sync_posts(db, data.article_ids, data.concurrency)
+
+
+async def _enqueue_publish_job(
+    pool: ArqRedis, task_name: str, article_id: UUID
+) -> PublishJobResponse:
+    """WordPress投稿ジョブをエンキュー
 
     Args:
-        db: データベースセッション
-        article: 同期する記事
+        pool: 共有の ArqRedis クライアント
+        task_name: ARQタスク名
+        article_id: 対象記事ID
 
-    Note:
-        エラーは無視して処理を継続
+    Returns:
+        ジョブID
     """
     try:
-        # カテゴリを取得してsheet_idを確認
-        result = await db.execute(
-            select(Category).where(Category.id == article.category_id)
+        job_id = str(uuid4())
+
+        await pool.enqueue_job(task_name, str(article_id), _job_id=job_id)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to enqueue WordPress job: {str(e)}"
         )
-        category = result.scalar_one_or_none()
-
-        if category and category.sheet_id:
-            sheets_service.update_article_status(
-                category.sheet_id,
-                article.keyword,
-                article.status,
-                article.title,
-                article.wp_url,
-                article.wp_post_id
-            )
-    except Exception:
-        # Sheetsのエラーは無視して処理を継続
-        pass
+
+    return PublishJobResponse(
+        job_id=job_id,
+        article_id=article_id,
+        message="WordPress job started",
+    )
@@ -0,0 +1,239 @@
+"""WordPress一括投稿サービスのテスト"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.features.articles.domain.models import Article
+from app.features.categories.domain.models import Category
+from app.features.job_logs.infrastructure.writer import pending_rows
+from app.features.wordpress.application import bulk_publisher
+from app.features.wordpress.application.bulk_publisher import WordPressBulkPublisher
+from app.features.wordpress.application.post_sync import (
+    changed_post_fields,
+    record_pushed_content,
+)
+from app.shared.domain import models  # noqa
+from app.shared.domain.enums import ArticleStatus
+from app.shared.domain.exceptions import ExternalServiceError
+from app.shared.infrastructure.services.markdown_converter import markdown_converter
+from app.shared.infrastructure.services.wordpress_service import WordPressPost
+from app.workers import tasks
+
+
+def _article(**kwargs) -> Article:
+    defaults = dict(
+        id=uuid4(),
+        category_id=uuid4(),
+        keyword="テスト",
+        title="テスト記事",
+        content="# テスト記事\n\n本文",
+        status=ArticleStatus.REVIEWED,
+    )
+    defaults.update(kwargs)
+    return Article(**defaults)
+
+
+def _mock_db(articles: list[Article], categories: list[Category] = ()):
+    """記事・カテゴリ取得クエリに対して指定の記事を返すモックセッション"""
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.flush = AsyncMock()
+    db.info = {}
+
+    articles_result = MagicMock()
+    articles_result.unique.return_value = articles_result
+    articles_result.scalars.return_value.all.return_value = articles
+    categories_result = MagicMock()
+    categories_result.scalars.return_value.all.return_value = list(categories)
+    db.execute = AsyncMock(side_effect=[articles_result, categories_result])
+    return db
+
+
+def _post(post_id: int, status: str = "draft") -> WordPressPost:
+    return WordPressPost(
+        id=post_id, title="t", status=status, link=f"https://example.com/?p={post_id}"
+    )
+
+
+class TestWordPressBulkPublisher:
+    """WordPressBulkPublisherのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_create_drafts_reports_per_item_results(self):
+        """個別の成否がリクエスト順に返却されることをテスト"""
+        ok = _article()
+        no_content = _article(content=None)
+        existing = _article(wp_post_id=10)
+        failing = _article()
+        missing_id = uuid4()
+
+        service = MagicMock()
+
+        async def create_post(title, content, status):
+            if title == "失敗":
+                raise ExternalServiceError("WordPress", "Create failed: boom")
+            return _post(100)
+
+        failing.title = "失敗"
+        service.create_post = AsyncMock(side_effect=create_post)
+
+        db = _mock_db([ok, no_content, existing, failing])
+        publisher = WordPressBulkPublisher(service)
+
+        ids = [ok.id, no_content.id, existing.id, failing.id, missing_id, ok.id]
+        result = await publisher.create_drafts(db, ids)
+
+        assert result.total == 5
+        assert result.success == 1
+        assert result.failed == 4
+        assert [r.article_id for r in result.results] == ids[:5]
+        assert result.results[0].wp_post_id == 100
+        assert result.results[1].error == "Article has no content"
+        assert result.results[2].error == "Article already has WordPress post"
+        assert "boom" in result.results[3].error
+        assert result.results[4].error == "Article not found"
+
+        assert ok.wp_post_id == 100
+        assert failing.wp_post_id is None
+        assert service.create_post.await_count == 2
+        # 送信対象の記事ごとにジョブログを記録
+        assert len(pending_rows(db)) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_drafts_respects_concurrency_limit(self):
+        """同時実行数が制限されることをテスト"""
+        articles = [_article() for _ in range(10)]
+        in_flight = 0
+        peak = 0
+
+        async def create_post(title, content, status):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _post(1)
+
+        service = MagicMock()
+        service.create_post = AsyncMock(side_effect=create_post)
+
+        publisher = WordPressBulkPublisher(service)
+        result = await publisher.create_drafts(
+            _mock_db(articles), [a.id for a in articles], concurrency=3
+        )
+
+        assert result.success == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_publish_updates_status(self):
+        """一括公開で記事ステータスが更新されることをテスト"""
+        draft = _article(wp_post_id=5)
+        not_drafted = _article()
+
+        service = MagicMock()
+        service.publish_post = AsyncMock(return_value=_post(5, status="publish"))
+
+        publisher = WordPressBulkPublisher(service)
+        result = await publisher.publish(
+            _mock_db([draft, not_drafted]), [draft.id, not_drafted.id]
+        )
+
+        assert result.success == 1
+        assert result.results[0].status == "publish"
+        assert result.results[1].error == "Create draft first"
+        assert draft.status == ArticleStatus.PUBLISHED
+        assert draft.wp_published_at is not None
+        service.publish_post.assert_awaited_once_with(5)
+
+    @pytest.mark.asyncio
+    async def test_sync_posts_skips_unchanged_articles(self):
+        """変更のない記事はHTTPリクエストを行わないことをテスト"""
+        unchanged = _article(wp_post_id=1)
+        changed = _article(wp_post_id=2)
+        html = markdown_converter.convert(unchanged.content)
+        record_pushed_content(unchanged, unchanged.title, html)
+        record_pushed_content(changed, "古いタイトル", html)
+
+        service = MagicMock()
+        service.update_post = AsyncMock(return_value=_post(2))
+
+        publisher = WordPressBulkPublisher(service)
+        result = await publisher.sync_posts(
+            _mock_db([unchanged, changed]), [unchanged.id, changed.id]
+        )
+
+        assert result.success == 2
+        assert result.skipped == 1
+        assert result.results[0].updated_fields == []
+        assert result.results[1].updated_fields == ["title"]
+        service.update_post.assert_awaited_once_with(2, title="テスト記事")
+        assert changed_post_fields(changed, changed.title, html) == {}
+
+    @pytest.mark.asyncio
+    async def test_sheets_sync_runs_in_thread(self, monkeypatch):
+        """Sheetsの同期がイベントループ外のスレッドで実行されることをテスト"""
+        category = Category(id=uuid4(), name="c", slug="c", sheet_id="sheet")
+        article = _article(category_id=category.id)
+        threads = []
+
+        sheets = MagicMock()
+        sheets.update_article_status.side_effect = (
+            lambda *args: threads.append(threading.current_thread())
+        )
+        monkeypatch.setattr(bulk_publisher, "sheets_service", sheets)
+
+        service = MagicMock()
+        service.create_post = AsyncMock(return_value=_post(7))
+
+        publisher = WordPressBulkPublisher(service)
+        await publisher.create_drafts(_mock_db([article], [category]), [article.id])
+
+        sheets.update_article_status.assert_called_once_with(
+            "sheet", article.keyword, article.status, article.title,
+            article.wp_url, 7,
+        )
+        assert threads[0] is not threading.main_thread()
+
+
+class TestBulkTasks:
+    """バックグラウンド一括投稿タスクのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_commits_after_each_chunk(self, monkeypatch):
+        """チャンクごとに別のトランザクションでコミットされることをテスト"""
+        sessions = []
+
+        @asynccontextmanager
+        async def session_maker():
+            db = AsyncMock()
+            sessions.append(db)
+            yield db
+
+        async def create_drafts(db, ids, concurrency):
+            assert not db.commit.called
+            return bulk_publisher._build_response(
+                list(ids),
+                {i: bulk_publisher._failure(i, "x") for i in ids},
+            )
+
+        publisher = MagicMock()
+        publisher.create_drafts = AsyncMock(side_effect=create_drafts)
+        monkeypatch.setattr(tasks, "async_session_maker", session_maker)
+        monkeypatch.setattr(tasks, "get_bulk_publisher", lambda: publisher)
+        monkeypatch.setattr(tasks.settings, "wordpress_bulk_chunk_size", 2)
+
+        ids = [str(uuid4()) for _ in range(5)]
+        result = await tasks.bulk_create_drafts_task({}, ids + ids[:1])
+
+        assert [len(c.args[1]) for c in publisher.create_drafts.await_args_list] == [2, 2, 1]
+        assert all(db.commit.await_count == 1 for db in sessions)
+        assert len(sessions) == 3
+        assert result["total"] == 5
+        assert result["failed"] == 5
+        assert [r["article_id"] for r in result["results"]] == ids
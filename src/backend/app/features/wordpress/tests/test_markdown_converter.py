@@ -31,6 +31,12 @@ class TestMarkdownConverter:
 
         assert "<em>italic</em>" in result
 
+    def test_convert_bold_italic(self):
+        """太字イタリック（***）の変換をテスト"""
+        result = markdown_converter.convert("***x*** と **太字**")
+
+        assert result == "<p><strong><em>x</em></strong> と <strong>太字</strong></p>"
+
     def test_convert_code(self):
         """インラインコードの変換をテスト"""
         markdown = "Use `code` here"
@@ -45,6 +51,12 @@ class TestMarkdownConverter:
 
         assert '<a href="https://google.com">Google</a>' in result
 
+    def test_convert_link_with_parentheses(self):
+        """URL に対応の取れた括弧を含むリンクの変換をテスト"""
+        result = markdown_converter.convert("[l](https://e.com/a_(b)) (注)")
+
+        assert result == '<p><a href="https://e.com/a_(b)">l</a> (注)</p>'
+
     def test_convert_complex(self):
         """複雑なMarkdownの変換をテスト"""
         markdown = """# タイトル
@@ -64,3 +76,69 @@ class TestMarkdownConverter:
         assert "<em>イタリック</em>" in result
         assert "<code>コード</code>" in result
         assert '<a href="https://example.com">リンク</a>' in result
+
+    def test_convert_unordered_list(self):
+        """箇条書きリストの変換をテスト"""
+        markdown = "- 項目1\n- 項目2\n  - ネスト\n- 項目3"
+        result = markdown_converter.convert(markdown)
+
+        assert result.count("<ul>") == 2
+        assert "<li>項目1</li>" in result
+        assert "<li>ネスト</li>" in result
+        assert "<li>項目3</li>" in result
+        assert "<p>" not in result
+
+    def test_convert_ordered_list(self):
+        """番号付きリストの変換をテスト"""
+        markdown = "1. 手順1\n2. 手順2"
+        result = markdown_converter.convert(markdown)
+
+        assert result == "<ol>\n<li>手順1</li>\n<li>手順2</li>\n</ol>"
+
+    def test_convert_table(self):
+        """表の変換をテスト"""
+        markdown = "| 項目 | 値 |\n|:---|---:|\n| A | **1** |"
+        result = markdown_converter.convert(markdown)
+
+        assert '<th style="text-align: left">項目</th>' in result
+        assert '<td style="text-align: right"><strong>1</strong></td>' in result
+        assert result.startswith("<table>")
+
+    def test_convert_fenced_code(self):
+        """コードブロックの変換をテスト（中身は変換せずエスケープ）"""
+        markdown = "```python\nif a < b:\n    print('**x**')\n```"
+        result = markdown_converter.convert(markdown)
+
+        assert '<pre><code class="language-python">' in result
+        assert "a &lt; b" in result
+        assert "**x**" in result
+        assert "<strong>" not in result
+
+    def test_convert_escapes_html(self):
+        """HTMLがエスケープされることをテスト"""
+        result = markdown_converter.convert("<script>alert(1)</script> & 本文")
+
+        assert "<script>" not in result
+        assert "&lt;script&gt;" in result
+        assert "&amp;" in result
+
+    def test_convert_blockquote_and_hr(self):
+        """引用と水平線の変換をテスト"""
+        result = markdown_converter.convert("> 引用\n\n---\n\n本文")
+
+        assert "<blockquote>\n<p>引用</p>\n</blockquote>" in result
+        assert "<hr>" in result
+        assert "<p>本文</p>" in result
+
+    def test_convert_unsafe_link(self):
+        """危険なスキームのリンクはテキストのみ出力することをテスト"""
+        result = markdown_converter.convert("[クリック](javascript:alert)")
+
+        assert "<a" not in result
+        assert "クリック" in result
+
+    def test_headings_are_not_wrapped_in_paragraphs(self):
+        """見出しと段落が別ブロックになることをテスト"""
+        result = markdown_converter.convert("## 見出し\n本文1行目\n本文2行目\n\n次の段落")
+
+        assert result == "<h2>見出し</h2>\n<p>本文1行目\n本文2行目</p>\n<p>次の段落</p>"
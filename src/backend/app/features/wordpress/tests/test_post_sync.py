@@ -0,0 +1,68 @@
+"""WordPress差分同期ユーティリティのテスト"""
+
+from uuid import uuid4
+
+from app.features.articles.domain.models import Article
+from app.features.wordpress.application.post_sync import (
+    WP_METADATA_KEY,
+    changed_post_fields,
+    record_pushed_content,
+)
+from app.shared.domain.hashing import sha256_hex
+
+
+def _article(metadata=None) -> Article:
+    return Article(id=uuid4(), category_id=uuid4(), keyword="KW", metadata_=metadata)
+
+
+class TestPostSync:
+    """差分同期ユーティリティのテスト"""
+
+    def test_never_pushed_sends_all_fields(self):
+        """送信履歴がない場合は全フィールドを送信することをテスト"""
+        article = _article()
+        assert changed_post_fields(article, "タイトル", "<p>本文</p>") == {
+            "title": "タイトル",
+            "content": "<p>本文</p>",
+        }
+
+    def test_unchanged_content_sends_nothing(self):
+        """変更がない場合は空になることをテスト"""
+        article = _article()
+        record_pushed_content(article, "タイトル", "<p>本文</p>")
+
+        assert changed_post_fields(article, "タイトル", "<p>本文</p>") == {}
+
+    def test_only_changed_field_is_sent(self):
+        """変更されたフィールドのみ送信することをテスト"""
+        article = _article()
+        record_pushed_content(article, "タイトル", "<p>本文</p>")
+
+        assert changed_post_fields(article, "タイトル", "<p>新しい本文</p>") == {
+            "content": "<p>新しい本文</p>"
+        }
+        assert changed_post_fields(article, "新タイトル", "<p>本文</p>") == {
+            "title": "新タイトル"
+        }
+
+    def test_legacy_html_hash_key_is_read(self):
+        """以前のキー（content_hash）で記録した本文HTMLのハッシュも参照することをテスト"""
+        article = _article({
+            WP_METADATA_KEY: {
+                "title_hash": sha256_hex("タイトル"),
+                "content_hash": sha256_hex("<p>本文</p>"),
+            }
+        })
+
+        assert changed_post_fields(article, "タイトル", "<p>本文</p>") == {}
+
+    def test_record_preserves_other_metadata(self):
+        """既存のメタデータを保持したまま記録することをテスト"""
+        original = {"char_count": 3000}
+        article = _article(original)
+        record_pushed_content(article, "タイトル", "<p>本文</p>")
+
+        assert article.metadata_["char_count"] == 3000
+        assert WP_METADATA_KEY in article.metadata_
+        # JSONBの変更検知のため新しい辞書に置き換える
+        assert article.metadata_ is not original
@@ -3,18 +3,26 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
 
 # すべてのモデルをインポート（SQLAlchemyリレーションシップ解決のため）
 from app.shared.domain import models  # noqa
 
+from app.features.analytics.presentation.routes import router as analytics_router
 from app.features.articles.presentation.routes import router as articles_router
 from app.features.articles.presentation.generate_routes import router as generate_router
+from app.features.batch.infrastructure.events import batch_events
 from app.features.batch.presentation.routes import router as batch_router
 from app.features.categories.presentation.routes import router as categories_router
 from app.features.sheets.presentation.routes import router as sheets_router
 from app.features.wordpress.presentation.routes import router as wordpress_router
+from app.shared.infrastructure.cache import cache
+from app.shared.infrastructure.compression import CompressionMiddleware
+from app.shared.infrastructure.db_metrics import db_metrics
+from app.shared.infrastructure.http_clients import http_clients
+from app.shared.infrastructure.queue import queue_pool
 
 settings = get_settings()
 
@@ -22,14 +30,23 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print(f"Starting application in {settings.app_env} mode")
+    await http_clients.startup()
+    await queue_pool.startup()
+    if settings.cache_enabled:
+        await cache.startup(str(settings.redis_url))
     yield
     print("Shutting down application")
+    await cache.shutdown()
+    await batch_events.shutdown()
+    await queue_pool.shutdown()
+    await http_clients.shutdown()
 
 
 app = FastAPI(
     title="記事自動生成システム API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -40,16 +57,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_level=settings.compression_brotli_level,
+        brotli_enabled=settings.compression_brotli_enabled,
+    )
+
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "env": settings.app_env}
 
 
+@app.get("/health/http")
+async def http_pool_stats():
+    """共有HTTPクライアントの接続プール使用状況"""
+    return http_clients.stats()
+
+
+@app.get("/health/db")
+async def db_pool_stats():
+    """データベース接続プールの使用状況・取得待ち時間・SQL実行時間
+
+    API プロセスの値と、ワーカーが Redis に書き出した直近の値を返却します。
+    """
+    stats = {"api": db_metrics.stats(), "workers": {}}
+    try:
+        stats["workers"] = await db_metrics.collect(queue_pool.get())
+    except Exception:
+        # Redis に接続できない場合は API の値のみ返却
+        pass
+    return stats
+
+
+@app.get("/health/queue")
+async def queue_pool_stats():
+    """ジョブキュー（Redis）への接続可否と接続プール・進捗イベント購読の使用状況"""
+    return {
+        "connected": await queue_pool.ping(),
+        **queue_pool.stats(),
+        "event_streams": batch_events.stats(),
+    }
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    """参照データキャッシュのヒット状況"""
+    return cache.stats()
+
+
 # APIルーター登録
 app.include_router(categories_router, prefix="/api")
 app.include_router(articles_router, prefix="/api")
 app.include_router(generate_router, prefix="/api")
 app.include_router(batch_router, prefix="/api")
 app.include_router(sheets_router, prefix="/api")
-app.include_router(wordpress_router, prefix="/api")
\ No newline at end of file
+app.include_router(wordpress_router, prefix="/api")
+app.include_router(analytics_router, prefix="/api")
\ No newline at end of file
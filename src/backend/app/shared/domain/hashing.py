@@ -0,0 +1,11 @@
+"""ハッシュの共通関数"""
+
+import hashlib
+
+
+def sha256_hex(value: str) -> str:
+    """文字列（UTF-8）のSHA-256ハッシュを16進数で取得
+
+    記事本文の版の重複判定や、WordPressへ送信した内容の差分判定に使用します。
+    """
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
@@ -0,0 +1,369 @@
+"""二層キャッシュ（プロセス内 + Redis）
+
+カテゴリ・プロンプトテンプレートのように、ほとんど変更されない参照データの
+読み取り結果をキャッシュします。
+
+- 1層目: プロセス内の辞書（local_ttl 秒、最大 local_max_entries 件）
+- 2層目: Redis（ttl 秒）。API・ワーカーの全プロセスで共有します
+- 値は Pydantic の TypeAdapter でJSONにシリアライズして Redis に保存します
+- 各エントリにタグを付け、タグ単位で無効化します。無効化は Redis の
+  Pub/Sub で全プロセスのプロセス内キャッシュにも通知します
+  （通知を受け取れなかった場合も local_ttl 秒で失効します）
+- Redis の値には、読み込み開始時点のタグの世代番号（Redis で共有し、無効化の
+  たびに INCR）を付けて保存し、取得時に現在の世代と一致しない値は捨てます。
+  他プロセスの無効化より前に読み込みを始めた古い値が、無効化の後に
+  保存されても ttl 秒間使われ続けることはありません
+- invalidate_on_change() でモデルを登録すると、そのモデルの行が ORM で
+  作成・更新・削除されたトランザクションのコミット後にタグを無効化します。
+  Core の一括 UPDATE / DELETE は検知しないため invalidate() を呼び出してください
+
+リポジトリは cached() デコレーター、または get_or_load() で利用します。
+startup() 前（テスト・スクリプトなど）はキャッシュせず、常に読み込み関数を
+実行します。存在しない値（None）はキャッシュしません。
+"""
+
+import asyncio
+import functools
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# コミット待ちの無効化タグを保持する Session.info のキー
+_PENDING_TAGS = "tiered_cache_pending_tags"
+
+
+@dataclass
+class _LocalEntry:
+    """プロセス内キャッシュのエントリ"""
+
+    value: Any
+    tags: frozenset[str]
+    expires_at: float
+
+
+class TieredCache:
+    """プロセス内 + Redis の二層キャッシュ"""
+
+    def __init__(
+        self,
+        namespace: str = "cache",
+        ttl: int = 3600,
+        local_ttl: float = 30.0,
+        local_max_entries: int = 1024,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local_max_entries = local_max_entries
+        self.enabled = False
+        self._local: OrderedDict[str, _LocalEntry] = OrderedDict()
+        # タグごとの無効化回数（読み込み中に無効化された値を保存しないため）
+        self._epochs: dict[str, int] = {}
+        self._redis: Optional[Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = {"local_hits": 0, "remote_hits": 0, "misses": 0}
+
+    @property
+    def channel(self) -> str:
+        """無効化通知の Pub/Sub チャンネル"""
+        return f"{self.namespace}:invalidate"
+
+    async def startup(self, redis_url: Optional[str] = None) -> None:
+        """キャッシュを有効化
+
+        Args:
+            redis_url: Redis のURL。省略時はプロセス内キャッシュのみ使用
+        """
+        if redis_url:
+            self._redis = Redis.from_url(redis_url)
+            pubsub = self._redis.pubsub()
+            await pubsub.subscribe(self.channel)
+            self._listener = asyncio.create_task(self._listen(pubsub))
+        self.enabled = True
+
+    async def shutdown(self) -> None:
+        """キャッシュを無効化して Redis 接続をクローズ"""
+        self.enabled = False
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._listener:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+        self._local.clear()
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """キャッシュから値を取得（なければ読み込んで保存）
+
+        Args:
+            key: キャッシュキー
+            loader: 値を読み込む関数
+            adapter: 値のJSONシリアライズに使う TypeAdapter
+            tags: 無効化に使うタグ
+
+        Returns:
+            キャッシュまたは loader から取得した値
+        """
+        if not self.enabled:
+            return await loader()
+
+        entry = self._local.get(key)
+        if entry and entry.expires_at > time.monotonic():
+            self._local.move_to_end(key)
+            self._stats["local_hits"] += 1
+            return entry.value
+
+        tags = frozenset(tags)
+        epochs = self._tag_epochs(tags)
+
+        # generations は読み込み開始時点の共有の世代（Redis を使わない場合は None）
+        value, generations = await self._get_remote(key, adapter, tags)
+        if value is not None:
+            self._stats["remote_hits"] += 1
+        else:
+            self._stats["misses"] += 1
+            value = await loader()
+            if value is None:
+                return None
+            if self._tag_epochs(tags) == epochs and generations is not None:
+                await self._set_remote(key, adapter.dump_json(value), tags, generations)
+
+        if self._tag_epochs(tags) == epochs:
+            self._set_local(key, value, tags)
+        return value
+
+    def cached(
+        self,
+        key: Callable[..., str],
+        tags: Callable[..., Iterable[str]],
+        type_: Any,
+    ) -> Callable:
+        """非同期関数の戻り値をキャッシュするデコレーター
+
+        Args:
+            key: 関数の引数からキャッシュキーを生成する関数
+            tags: 関数の引数からタグを生成する関数
+            type_: 戻り値の型（JSONシリアライズに使用）
+
+        Example:
+            >>> @cache.cached(
+            ...     key=lambda self, category_id: f"category:{category_id}",
+            ...     tags=lambda self, category_id: ["categories"],
+            ...     type_=Optional[CategoryResponse],
+            ... )
+            ... async def get_snapshot(self, category_id): ...
+        """
+        adapter = TypeAdapter(type_)
+
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await self.get_or_load(
+                    key(*args, **kwargs),
+                    lambda: func(*args, **kwargs),
+                    adapter,
+                    tags(*args, **kwargs),
+                )
+
+            return wrapper
+
+        return decorator
+
+    async def invalidate(self, *tags: str) -> None:
+        """タグの付いたエントリを全プロセスで無効化"""
+        self._invalidate_local(tags)
+        await self._invalidate_remote(tags)
+
+    def invalidate_on_change(self, model: type, *tags: str) -> None:
+        """モデルの行が変更されたらコミット後にタグを無効化するよう登録
+
+        Args:
+            model: ORMモデルクラス
+            tags: 無効化するタグ
+        """
+        _listen_session_events()
+
+        def mark(mapper, connection, target) -> None:
+            session = object_session(target)
+            if session is not None:
+                pending = session.info.setdefault(_PENDING_TAGS, {})
+                pending.setdefault(self, set()).update(tags)
+
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, mark)
+
+    def stats(self) -> dict[str, int]:
+        """ヒット数などの統計"""
+        return {**self._stats, "local_entries": len(self._local)}
+
+    def _on_commit(self, tags: set[str]) -> None:
+        """コミット後の無効化（同期コンテキストから呼び出し）"""
+        self._invalidate_local(tags)
+        if self._redis is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._invalidate_remote(tags))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _tag_epochs(self, tags: frozenset[str]) -> tuple[int, ...]:
+        return tuple(self._epochs.get(tag, 0) for tag in sorted(tags))
+
+    def _set_local(self, key: str, value: Any, tags: frozenset[str]) -> None:
+        self._local[key] = _LocalEntry(value, tags, time.monotonic() + self.local_ttl)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+    def _invalidate_local(self, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        for tag in tags:
+            self._epochs[tag] = self._epochs.get(tag, 0) + 1
+        for key in [key for key, entry in self._local.items() if entry.tags & tags]:
+            del self._local[key]
+
+    def _value_key(self, key: str) -> str:
+        return f"{self.namespace}:value:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def _generation_key(self, tag: str) -> str:
+        return f"{self.namespace}:generation:{tag}"
+
+    async def _get_remote(
+        self, key: str, adapter: TypeAdapter, tags: frozenset[str]
+    ) -> tuple[Any, Optional[bytes]]:
+        """Redis の値と、タグの現在の世代を1往復で取得
+
+        Returns:
+            値（ない・世代が古い場合は None）と現在の世代
+            （Redis を使わない・障害時は None）
+        """
+        if self._redis is None:
+            return None, None
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._value_key(key))
+                for tag in sorted(tags):
+                    pipe.get(self._generation_key(tag))
+                raw, *current = await pipe.execute()
+        except RedisError:
+            # Redis の障害時はデータベースから読み込む
+            return None, None
+
+        generations = ",".join(str(int(g or 0)) for g in current).encode()
+        if raw is None:
+            return None, generations
+        stamp, _, body = raw.partition(b"\n")
+        if stamp != generations:
+            # 無効化より前に読み込みを始めた値（無効化の後に保存されたもの）
+            return None, generations
+        return adapter.validate_json(body), generations
+
+    async def _set_remote(
+        self, key: str, raw: bytes, tags: frozenset[str], generations: bytes
+    ) -> None:
+        if self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                # JSON は改行を含まないため、世代との区切りに改行を使う
+                pipe.set(self._value_key(key), generations + b"\n" + raw, ex=self.ttl)
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), key)
+                    pipe.expire(self._tag_key(tag), self.ttl)
+                await pipe.execute()
+        except RedisError:
+            pass
+
+    async def _invalidate_remote(self, tags: Iterable[str]) -> None:
+        if self._redis is None:
+            return
+        tags = sorted(set(tags))
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.smembers(self._tag_key(tag))
+                members = await pipe.execute()
+            keys = {key.decode() for group in members for key in group}
+            async with self._redis.pipeline(transaction=False) as pipe:
+                # 世代を進めてから削除（以降に保存される古い世代の値は使われない）
+                for tag in tags:
+                    pipe.incr(self._generation_key(tag))
+                pipe.delete(*[self._tag_key(tag) for tag in tags])
+                if keys:
+                    pipe.delete(*[self._value_key(key) for key in keys])
+                pipe.publish(self.channel, json.dumps(tags))
+                await pipe.execute()
+        except RedisError:
+            pass
+
+    async def _listen(self, pubsub) -> None:
+        """他プロセスからの無効化通知を受信"""
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._invalidate_local(json.loads(message["data"]))
+        except RedisError:
+            # 通知が途絶えてもプロセス内キャッシュは local_ttl で失効する
+            pass
+        finally:
+            with suppress(RedisError):
+                await pubsub.aclose()
+
+
+_session_events_registered = False
+
+
+def _listen_session_events() -> None:
+    """コミット・ロールバック時のイベントを一度だけ登録"""
+    global _session_events_registered
+    if _session_events_registered:
+        return
+    _session_events_registered = True
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(session: Session) -> None:
+        for cache, tags in session.info.pop(_PENDING_TAGS, {}).items():
+            cache._on_commit(tags)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(session: Session) -> None:
+        session.info.pop(_PENDING_TAGS, None)
+
+
+# シングルトンインスタンス
+cache = TieredCache(
+    ttl=settings.cache_ttl,
+    local_ttl=settings.cache_local_ttl,
+    local_max_entries=settings.cache_local_max_entries,
+)
@@ -0,0 +1,141 @@
+"""レスポンス圧縮ミドルウェア
+
+クライアントの Accept-Encoding に応じて、JSON・テキストのレスポンスを
+brotli（優先）または gzip で圧縮します。記事本文を含むレスポンスは
+圧縮率が高いため、転送量を大きく削減できます。
+
+- 本体が minimum_size バイト未満のレスポンスは圧縮しません
+- SSE・ストリーミング（本体が複数チャンクで送信される）レスポンスは
+  逐次送信を妨げないよう圧縮しません
+- 圧縮したレスポンスの強いETagは弱いETagに変換します
+  （表現が変わるため。条件付きGETは弱い比較で判定します）
+"""
+
+import gzip
+from typing import Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 圧縮対象の Content-Type
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Accept-Encoding から受け入れ可能なエンコーディングを取得（q=0 を除く）"""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip())
+    return accepted
+
+
+class CompressionMiddleware:
+    """brotli / gzip 圧縮ミドルウェア"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_level: int = 4,
+        brotli_enabled: bool = True,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_level = brotli_level
+        self.brotli_enabled = brotli_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """使用するエンコーディングを選択（brotli を優先）"""
+        accepted = _accepted_encodings(accept_encoding)
+        if self.brotli_enabled and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """本体を圧縮"""
+        if encoding == "br":
+            return brotli.compress(body, mode=brotli.MODE_TEXT, quality=self.brotli_level)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+
+class _CompressionResponder:
+    """1レスポンス分の送信を仲介し、必要な場合に本体を圧縮"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if not self._is_compressible(Headers(raw=message["headers"])):
+                # 圧縮しないことがヘッダーで確定する場合（SSE など）は
+                # 最初の本体を待たずにすぐ送信
+                await self._send(message)
+                return
+            # 本体を確認するまで開始メッセージを保留
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            await self._send(message)
+            return
+
+        start, self.start_message = self.start_message, None
+        body = message.get("body", b"")
+        if message.get("more_body", False) or len(body) < self.middleware.minimum_size:
+            await self._send(start)
+            await self._send(message)
+            return
+
+        compressed = self.middleware.compress(body, self.encoding)
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    @staticmethod
+    def _is_compressible(headers: Headers) -> bool:
+        """圧縮対象のレスポンスか判定"""
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if content_type.startswith("text/event-stream"):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES)
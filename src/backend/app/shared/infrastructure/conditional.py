@@ -0,0 +1,140 @@
+"""条件付きGET（ETag / Last-Modified）
+
+レスポンスの検証子（ETag・Last-Modified）をレスポンス本体を構築する前に
+算出し、クライアントの If-None-Match / If-Modified-Since と一致する場合は
+本体をシリアライズせずに 304 Not Modified を返却します。
+
+ETag は行の id と updated_at から生成します。1行は強いETag、一覧は
+含まれる全行のキーと総数から生成する弱いETagで、行の追加・更新・削除で
+変化します。一覧の ETag は圧縮の有無に関わらず 200・304 とも W/ 付きの
+同じ形式です。一覧では削除を更新日時で表せないため Last-Modified は
+返却しません。
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import Header, Response, status
+
+# 検証子付きのレスポンスもキャッシュ利用前に必ず再検証させる
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """値の並びからETagを生成
+
+    Args:
+        parts: ETagの元になる値（str() で文字列化）
+        weak: 弱いETag（W/ 付き）にする場合は True
+
+    Returns:
+        引用符で囲んだETag
+    """
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8"))
+    etag = f'"{digest.hexdigest()[:32]}"'
+    return f"W/{etag}" if weak else etag
+
+
+def row_etag(row_id: UUID, updated_at: Optional[datetime]) -> str:
+    """1行のETagを生成"""
+    return make_etag(row_id, _isoformat(updated_at))
+
+
+def rows_etag(
+    keys: Iterable[tuple[UUID, Optional[datetime]]], *extra: Any
+) -> str:
+    """複数行（一覧）の弱いETagを生成
+
+    Args:
+        keys: 各行の (id, updated_at)
+        extra: 総数など、行以外にレスポンスに影響する値
+
+    Returns:
+        引用符で囲んだ弱いETag
+    """
+    parts = [f"{row_id}@{_isoformat(updated_at)}" for row_id, updated_at in keys]
+    return make_etag(*parts, *extra, weak=True)
+
+
+class ConditionalRequest:
+    """条件付きリクエストヘッダー"""
+
+    def __init__(
+        self,
+        if_none_match: Optional[str] = Header(None),
+        if_modified_since: Optional[str] = Header(None),
+    ):
+        self.if_none_match = if_none_match
+        self.if_modified_since = _parse_http_date(if_modified_since)
+
+    def is_not_modified(
+        self, etag: str, last_modified: Optional[datetime] = None
+    ) -> bool:
+        """クライアントのキャッシュが最新か判定
+
+        If-None-Match がある場合はそれのみで判定し（If-Modified-Since は無視）、
+        ない場合は If-Modified-Since と最終更新日時（秒単位）を比較します。
+
+        Args:
+            etag: 現在のETag
+            last_modified: 現在の最終更新日時
+
+        Returns:
+            304 を返却できる場合は True
+        """
+        if self.if_none_match is not None:
+            tags = [tag.strip() for tag in self.if_none_match.split(",")]
+            # GET の If-None-Match は弱い比較（W/ 接頭辞を無視）
+            return "*" in tags or etag.removeprefix("W/") in [
+                tag.removeprefix("W/") for tag in tags
+            ]
+        if self.if_modified_since is not None and last_modified is not None:
+            return last_modified.replace(microsecond=0) <= self.if_modified_since
+        return False
+
+    def not_modified(
+        self, etag: str, last_modified: Optional[datetime] = None
+    ) -> Optional[Response]:
+        """キャッシュが最新の場合に 304 レスポンスを生成
+
+        Returns:
+            304 レスポンス。本体を返却する必要がある場合は None
+        """
+        if not self.is_not_modified(etag, last_modified):
+            return None
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=validator_headers(etag, last_modified),
+        )
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime] = None
+) -> dict[str, str]:
+    """検証子のレスポンスヘッダーを生成"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def _isoformat(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    """HTTP日付をパース（不正な値は無視）"""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    # タイムゾーンのない値はHTTP日付として不正なため無視
+    return parsed if parsed.tzinfo else None
@@ -5,24 +5,70 @@ from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.core.config import get_settings
+from app.shared.infrastructure.db_metrics import InstrumentedAsyncQueuePool, db_metrics
 
 settings = get_settings()
 
+# 接続プール設定（DB_POOL_PROFILE に応じて API / ワーカー用のサイズ）
+pool_options = settings.db_pool_options()
+
 # 非同期エンジン作成
 engine = create_async_engine(
     settings.async_database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    **pool_options,
 )
+db_metrics.instrument("primary", engine)
+
+
+
+class AppSession(Session):
+    """アプリケーションのセッション（AsyncSession.sync_session のクラス）
+
+    ジョブログの書き込みなどのセッションイベントはこのクラスに登録し、
+    他のライブラリやテストが作成する Session には影響させません。
+    """
+
 
 # 非同期セッションメーカー
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=AppSession,
+    expire_on_commit=False,
+)
+
+# 読み取り専用エンジンの実行オプション
+# トランザクションを BEGIN READ ONLY で開始します（書き込みはサーバー側で拒否されます）。
+# 接続をプールに返却する際に解除されるため、プライマリの接続プールと共有できます。
+READ_ONLY_EXECUTION_OPTIONS = {"postgresql_readonly": True}
+
+# 読み取り専用エンジン
+# DATABASE_REPLICA_URL が設定されていればレプリカ用の接続プールを作成し、
+# 未設定の場合はプライマリの接続プールを共有します。
+if settings.database_replica_url:
+    replica_engine = create_async_engine(
+        settings.async_replica_database_url,
+        echo=settings.debug,
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options,
+    )
+    db_metrics.instrument("read", replica_engine)
+else:
+    replica_engine = engine
+read_engine = replica_engine.execution_options(**READ_ONLY_EXECUTION_OPTIONS)
+
+# 読み取り専用セッションメーカー
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    sync_session_class=AppSession,
     expire_on_commit=False,
+    autoflush=False,
 )
 
 
@@ -43,5 +89,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """読み取り専用データベースセッション依存性
+
+    GET など書き込みを行わないルートで使用します。読み取り専用トランザクションは
+    コミットせず、常にロールバックして終了します。分離レベルは READ COMMITTED
+    のため、1リクエスト内の複数のSQLは同一のスナップショットを参照しない点に
+    注意してください（一覧の件数と行の取得など）。
+    """
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
 # FastAPI依存性注入用の型アノテーション
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadOnlyDbSession = Annotated[AsyncSession, Depends(get_read_db)]
@@ -0,0 +1,201 @@
+"""データベース接続プールのメトリクス
+
+接続プールのサイズを実測値から決められるよう、エンジンごとに次の値を収集します。
+
+- 接続の取得待ち時間（プールが枯渇すると増加）と取得タイムアウト回数
+- 使用中・アイドル・オーバーフローの接続数
+- SQLの実行時間
+
+待ち時間・実行時間は直近 WINDOW_SIZE 件から平均・パーセンタイルを算出します。
+API は /health/db で、ワーカーはジョブ終了ごとに Redis に書き出した値を返却します。
+"""
+
+import json
+import os
+import socket
+import time
+from collections import deque
+from typing import Any, Optional, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# パーセンタイルの算出に使う直近のサンプル数
+WINDOW_SIZE = 2048
+
+# クエリ開始時刻を保持する Connection.info のキー
+_QUERY_START = "db_metrics_query_start"
+
+# ワーカーのメトリクスを書き出す Redis キーの接頭辞と保持期間（秒）
+REDIS_KEY_PREFIX = "metrics:db:"
+REDIS_TTL = 300
+# ワーカーがメトリクスを書き出す最小間隔（秒）
+PUBLISH_INTERVAL = 10.0
+
+
+class LatencyWindow:
+    """直近のレイテンシ（秒）の集計"""
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """サンプルを記録"""
+        self._samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> dict[str, float]:
+        """件数と直近の平均・p50・p95・p99・最大値（ミリ秒）"""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": self.count}
+
+        def percentile(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))] * 1000, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1] * 1000, 3),
+        }
+
+
+class PoolMetrics:
+    """1エンジン分のメトリクス"""
+
+    def __init__(self):
+        self.checkout_wait = LatencyWindow()
+        self.checkout_timeouts = 0
+        self.query = LatencyWindow()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """接続の取得待ち時間を計測するコネクションプール"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics:
+                self.metrics.checkout_timeouts += 1
+            raise
+        finally:
+            if self.metrics:
+                self.metrics.checkout_wait.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        # dispose() 後の新しいプールにもメトリクスを引き継ぐ
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class DbMetricsRegistry:
+    """エンジンごとのメトリクスのレジストリ"""
+
+    def __init__(self):
+        self._engines: dict[str, Union[AsyncEngine, Engine]] = {}
+        self._metrics: dict[str, PoolMetrics] = {}
+        self._published_at = 0.0
+
+    def instrument(self, name: str, engine: Union[AsyncEngine, Engine]) -> None:
+        """エンジンの計測を開始
+
+        Args:
+            name: メトリクス上のエンジン名（例: "primary"）
+            engine: poolclass=InstrumentedAsyncQueuePool で生成したエンジン
+        """
+        metrics = PoolMetrics()
+        sync_engine = _sync_engine(engine)
+        if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+            sync_engine.pool.metrics = metrics
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault(_QUERY_START, []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            metrics.query.observe(time.perf_counter() - conn.info[_QUERY_START].pop())
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _error(context):
+            conn = context.connection
+            starts = conn.info.get(_QUERY_START) if conn is not None else None
+            if starts:
+                starts.pop()
+
+        self._engines[name] = engine
+        self._metrics[name] = metrics
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """接続プールの使用状況と取得待ち時間・SQL実行時間
+
+        Returns:
+            エンジン名ごとのメトリクス
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for name, engine in self._engines.items():
+            pool = _sync_engine(engine).pool
+            metrics = self._metrics[name]
+            stats[name] = {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # overflow() は pool_size 未満の間は負の値
+                "overflow": max(pool.overflow(), 0),
+                "checkout_wait": metrics.checkout_wait.summary(),
+                "checkout_timeouts": metrics.checkout_timeouts,
+                "query": metrics.query.summary(),
+            }
+        return stats
+
+    async def publish(self, redis, process: str = "worker") -> None:
+        """このプロセスのメトリクスを Redis に書き出す（PUBLISH_INTERVAL 秒に1回まで）
+
+        Args:
+            redis: Redis クライアント
+            process: プロセスの種別
+        """
+        now = time.monotonic()
+        if now - self._published_at < PUBLISH_INTERVAL:
+            return
+        self._published_at = now
+        key = f"{REDIS_KEY_PREFIX}{process}:{socket.gethostname()}:{os.getpid()}"
+        await redis.set(key, json.dumps(self.stats()), ex=REDIS_TTL)
+
+    @staticmethod
+    async def collect(redis) -> dict[str, dict[str, Any]]:
+        """他プロセスが書き出したメトリクスを取得
+
+        Returns:
+            "{種別}:{ホスト名}:{PID}" ごとのメトリクス
+        """
+        keys = [key async for key in redis.scan_iter(match=f"{REDIS_KEY_PREFIX}*")]
+        if not keys:
+            return {}
+        values = await redis.mget(keys)
+        return {
+            (key.decode() if isinstance(key, bytes) else key).removeprefix(
+                REDIS_KEY_PREFIX
+            ): json.loads(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+
+def _sync_engine(engine: Union[AsyncEngine, Engine]) -> Engine:
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+
+# シングルトンインスタンス
+db_metrics = DbMetricsRegistry()
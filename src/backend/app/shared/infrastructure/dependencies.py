@@ -1,27 +1,54 @@
 """共通依存性"""
 
-from typing import Annotated
+from typing import Annotated, Optional
 
+from arq.connections import ArqRedis
 from fastapi import Depends, Query
 
-from app.shared.infrastructure.database import AsyncSession, get_db
+from app.shared.infrastructure.conditional import ConditionalRequest
+from app.shared.infrastructure.database import AsyncSession, get_db, get_read_db
+from app.shared.infrastructure.pagination import decode_cursor
+from app.shared.infrastructure.queue import get_queue
 
 # データベースセッション依存性
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
+# 読み取り専用データベースセッション依存性（コミットしない・レプリカに接続可能）
+ReadOnlyDbSession = Annotated[AsyncSession, Depends(get_read_db)]
+
 
 class PaginationParams:
-    """ページネーションパラメータ"""
+    """ページネーションパラメータ
+
+    cursor を指定した場合はキーセット方式（page は無視）、
+    指定しない場合は従来のページ番号方式で取得します。
+    """
 
     def __init__(
         self,
         page: int = Query(1, ge=1, description="ページ番号"),
         per_page: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
+        cursor: Optional[str] = Query(
+            None, description="前回レスポンスの next_cursor（指定時は page を無視）"
+        ),
+        include_total: Optional[bool] = Query(
+            None, description="総件数を含めるか（省略時はページ番号方式のみ含める）"
+        ),
     ):
-        self.page = page
+        self.cursor = decode_cursor(cursor)
+        self.page = None if self.cursor else page
         self.per_page = per_page
-        self.offset = (page - 1) * per_page
+        self.offset = 0 if self.cursor else (page - 1) * per_page
+        self.include_total = (
+            include_total if include_total is not None else self.cursor is None
+        )
 
 
 # ページネーション依存性
 Pagination = Annotated[PaginationParams, Depends()]
+
+# 条件付きリクエスト（If-None-Match / If-Modified-Since）依存性
+Conditional = Annotated[ConditionalRequest, Depends()]
+
+# ジョブキュー（ARQ）の共有Redisクライアント依存性
+Queue = Annotated[ArqRedis, Depends(get_queue)]
@@ -0,0 +1,151 @@
+"""共有HTTPクライアントレジストリ
+
+外部サービス用の httpx.AsyncClient をプロセス内で共有します。
+クライアントはAPI・ワーカーの起動時にまとめて生成し、終了時にクローズします。
+接続プールの上限・keep-alive・HTTP/2 は Settings から設定します。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class HttpClientConfig:
+    """HTTPクライアント設定"""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    timeout: float = 30.0
+    base_url: str = ""
+
+
+class HttpClientRegistry:
+    """名前付きHTTPクライアントのレジストリ"""
+
+    def __init__(self):
+        self._configs: dict[str, HttpClientConfig] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._request_counts: dict[str, int] = {}
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """接続プールの上限設定"""
+        return httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+
+    def register(self, name: str, config: HttpClientConfig) -> None:
+        """クライアント設定を登録
+
+        Args:
+            name: クライアント名
+            config: クライアント設定
+        """
+        self._configs[name] = config
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """クライアントを取得（未生成・クローズ済みの場合は生成）
+
+        Args:
+            name: 登録済みのクライアント名
+
+        Returns:
+            共有の httpx.AsyncClient
+
+        Raises:
+            KeyError: 未登録のクライアント名の場合
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._open(name)
+        return client
+
+    async def startup(self) -> None:
+        """登録済みのすべてのクライアントを生成"""
+        for name in self._configs:
+            self.get(name)
+
+    async def shutdown(self) -> None:
+        """すべてのクライアントをクローズ"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+
+    async def close(self, name: str) -> None:
+        """指定したクライアントをクローズ"""
+        client = self._clients.pop(name, None)
+        if client and not client.is_closed:
+            await client.aclose()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """接続プールの使用状況を取得
+
+        Returns:
+            クライアント名ごとの接続数・使用中・アイドル・待機中リクエスト数
+        """
+        limits = self.limits
+        stats: dict[str, dict[str, Any]] = {}
+        for name in self._configs:
+            client = self._clients.get(name)
+            pool = _connection_pool(client)
+            connections = list(getattr(pool, "connections", []))
+            in_use = sum(
+                1 for c in connections if not c.is_idle() and not c.is_closed()
+            )
+            idle = sum(1 for c in connections if c.is_idle())
+            queued = sum(
+                1
+                for r in getattr(pool, "_requests", [])
+                if getattr(r, "is_queued", lambda: False)()
+            )
+            stats[name] = {
+                "open": client is not None and not client.is_closed,
+                "http2": settings.http2_enabled,
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "connections": len(connections),
+                "in_use": in_use,
+                "idle": idle,
+                "queued_requests": queued,
+                "requests_total": self._request_counts.get(name, 0),
+            }
+        return stats
+
+    def _open(self, name: str) -> httpx.AsyncClient:
+        """クライアントを生成"""
+        config = self._configs[name]
+
+        async def count_request(request: httpx.Request) -> None:
+            self._request_counts[name] = self._request_counts.get(name, 0) + 1
+
+        client = httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=config.headers,
+            timeout=config.timeout,
+            limits=self.limits,
+            http2=settings.http2_enabled,
+            event_hooks={"request": [count_request]},
+        )
+        self._clients[name] = client
+        return client
+
+
+def _connection_pool(client: Optional[httpx.AsyncClient]) -> Any:
+    """クライアント内部の httpcore 接続プールを取得"""
+    if client is None or client.is_closed:
+        return None
+    transport = getattr(client, "_transport", None)
+    return getattr(transport, "_pool", None)
+
+
+# シングルトンインスタンス
+http_clients = HttpClientRegistry()
@@ -0,0 +1,54 @@
+"""カーソル（キーセット）ページネーション
+
+一覧を (created_at, id) の降順で取得し、最後の行のキーを不透明な
+カーソル文字列として返却します。次ページは OFFSET ではなく
+「キーがカーソルより小さい行」として取得するため、深いページでも
+取得コストが一定です。
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.shared.domain.exceptions import ValidationError
+
+# (created_at, id)
+CursorKey = tuple[datetime, UUID]
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """キーをカーソル文字列にエンコード
+
+    Args:
+        created_at: 最後の行の作成日時
+        row_id: 最後の行のID
+
+    Returns:
+        URLセーフなカーソル文字列
+    """
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[CursorKey]:
+    """カーソル文字列をキーにデコード
+
+    Args:
+        cursor: encode_cursor で生成したカーソル文字列
+
+    Returns:
+        (created_at, id)。カーソル未指定の場合は None
+
+    Raises:
+        ValidationError: カーソルが不正な場合
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor")
@@ -0,0 +1,92 @@
+"""ジョブキュー（ARQ）のRedis接続プール
+
+API プロセスで1つの ArqRedis クライアント（内部に接続プールを持つ）を共有します。
+クライアントは起動時に生成して終了時にクローズするため、ジョブの投入や
+ステータスの確認のたびに接続・ハンドシェイクを行いません。
+
+- 接続数の上限は redis_max_connections で設定します
+- アイドル状態が redis_health_check_interval 秒を超えた接続は、
+  使用前に PING で確認してから再利用します（切断されていれば再接続）
+- 起動時に Redis に接続できなくても API は起動し、コマンド実行時に再接続します
+"""
+
+from contextlib import suppress
+from typing import Any, Optional
+
+from arq.connections import ArqRedis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class QueuePool:
+    """共有の ArqRedis クライアント"""
+
+    def __init__(
+        self,
+        redis_url: str,
+        max_connections: int = 20,
+        health_check_interval: int = 30,
+        connect_timeout: float = 1.0,
+    ):
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self._redis: Optional[ArqRedis] = None
+
+    def get(self) -> ArqRedis:
+        """クライアントを取得（未生成の場合は生成）"""
+        if self._redis is None:
+            self._redis = ArqRedis.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                health_check_interval=self.health_check_interval,
+                socket_connect_timeout=self.connect_timeout,
+            )
+        return self._redis
+
+    async def startup(self) -> None:
+        """クライアントを生成して接続を確認"""
+        await self.ping()
+
+    async def shutdown(self) -> None:
+        """クライアントと接続プールをクローズ"""
+        if self._redis is not None:
+            redis, self._redis = self._redis, None
+            with suppress(RedisError, OSError):
+                await redis.aclose()
+
+    async def ping(self) -> bool:
+        """Redis に接続できるか確認"""
+        try:
+            return bool(await self.get().ping())
+        except (RedisError, OSError):
+            return False
+
+    def stats(self) -> dict[str, Any]:
+        """接続プールの使用状況"""
+        if self._redis is None:
+            return {"open": False, "in_use": 0, "idle": 0}
+        pool = self._redis.connection_pool
+        return {
+            "open": True,
+            "max_connections": pool.max_connections,
+            "in_use": len(pool._in_use_connections),
+            "idle": len(pool._available_connections),
+        }
+
+
+# シングルトンインスタンス
+queue_pool = QueuePool(
+    str(settings.redis_url),
+    max_connections=settings.redis_max_connections,
+    health_check_interval=settings.redis_health_check_interval,
+)
+
+
+def get_queue() -> ArqRedis:
+    """共有の ArqRedis クライアントを取得（依存性）"""
+    return queue_pool.get()
@@ -0,0 +1,31 @@
+"""JSONレスポンス
+
+API全体の既定レスポンスクラスは orjson でエンコードする ORJSONResponse です
+（main.py で設定）。大きな記事本文を含むレスポンスは、構築済みの Pydantic
+モデルを ModelResponse で返却します。FastAPI の response_model による
+再検証と辞書への変換を経由せず、pydantic-core がモデルから直接JSONを生成します。
+"""
+
+from typing import Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    """Pydanticモデルを直接JSONにシリアライズするレスポンス"""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        model: BaseModel,
+        status_code: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        exclude_unset: bool = False,
+    ):
+        super().__init__(
+            content=model.model_dump_json(exclude_unset=exclude_unset),
+            status_code=status_code,
+            headers=headers,
+        )
@@ -1,13 +1,52 @@
 """Markdown → HTML 変換ユーティリティ"""
 
+import html
 import re
+from typing import Optional
+
+# ブロック要素の開始となり得る行頭文字（これ以外で始まる行は表でなければ段落）
+_BLOCK_START_CHARS = frozenset("`~#-*_+&0123456789")
+
+_FENCE_BLOCK = re.compile(
+    r"^[ ]{0,3}(`{3,}|~{3,})[ \t]*([\w+#-]*)[^\n]*(?:\n|\Z)(.*?)(?:^[ ]{0,3}\1[ \t]*(?:\n|\Z)|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_BLANK_LINES = re.compile(r"\n(?:[ \t]*\n)+")
+# 2行目以降にブロック記法の行頭文字を含むか（含まなければ段落のみ）
+_SPECIAL_LINE_START = re.compile(r"\n[ \t]*[`~#\-*_+&\d]")
+_HEADING = re.compile(r"[ ]{0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*")
+_HR = re.compile(r"[ ]{0,3}(?:(?:-[ \t]*){3,}|(?:\*[ \t]*){3,}|(?:_[ \t]*){3,})")
+_LIST_ITEM = re.compile(r"([ \t]*)(?:([-*+])|(\d{1,9})[.)])[ \t]+(.*)")
+_QUOTE = re.compile(r"[ ]{0,3}&gt;[ ]?")
+_TABLE_SEPARATOR = re.compile(r"[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*")
+_CELL_SEPARATOR = re.compile(r"(?<!\\)\|")
+
+# インライン要素のパターン（すべての分岐が記号で始まるため先頭文字で絞り込まれる）
+_INLINE = re.compile(
+    r"\\(?P<escaped>[\\`*_\[\]()#+\-.!|])"
+    r"|`(?P<code>[^`\n]+)`"
+    # ***太字イタリック*** は ** より先に判定（** で分割すると * が残るため）
+    r"|\*\*\*(?P<bold_italic>[^*\s](?:[^\n]*?[^*\s])?)\*\*\*"
+    r"|\*\*(?P<bold>[^\n]+?)\*\*"
+    r"|\*(?P<italic>[^*\s](?:[^*\n]*?[^*\s])?)\*"
+    # URL は対応の取れた括弧を含められる（例: Wikipedia の URL）
+    r'|\[(?P<link_text>[^\]\n]+)\]\((?P<href>(?:[^()\s"|]|\([^()\s"|]*\))+)\)'
+)
+
+_UNSAFE_URL = re.compile(r"\s*(?:javascript|vbscript|data):", re.IGNORECASE)
 
 
 class MarkdownConverter:
     """Markdown to HTML converter
 
-    シンプルなMarkdown構文をHTMLに変換します。
-    本格的な変換が必要な場合は、python-markdownなどのライブラリを使用してください。
+    記事生成プロンプトが出力するMarkdown記法（見出し、段落、太字、イタリック、
+    インラインコード、リンク、箇条書き・番号付きリスト、表、コードブロック、
+    引用、水平線）をHTMLに変換します。
+
+    入力全体を1回だけHTMLエスケープし、コードブロックを切り出した後、
+    空行で区切ったまとまりごとに先頭から1回だけ走査します。ブロック記法を
+    含まないまとまりは段落としてそのまま出力し、含む場合のみ行単位で判定します。
+    インライン要素はブロックごとにコンパイル済みの1つのパターンで置換します。
     """
 
     @staticmethod
@@ -20,31 +59,264 @@ class MarkdownConverter:
         Returns:
             HTML形式のテキスト
         """
-        html = markdown
+        escaped = html.escape(markdown, quote=False)
+        return _render_blocks(escaped)
+
+
+def _line_kind(line: str, next_line: str) -> Optional[str]:
+    """行が開始するブロックの種類を判定（段落の行は None）"""
+    stripped = line.lstrip()
+    if not stripped:
+        return "blank"
+    if stripped[0] in _BLOCK_START_CHARS:
+        if _HR.fullmatch(line):
+            return "hr"
+        if _HEADING.fullmatch(line):
+            return "heading"
+        if _LIST_ITEM.fullmatch(line):
+            return "list"
+        if _QUOTE.match(line):
+            return "quote"
+    if "|" in line and _TABLE_SEPARATOR.fullmatch(next_line):
+        return "table"
+    return None
+
+
+def _render_blocks(text: str) -> str:
+    """HTMLエスケープ済みのMarkdownをブロック単位でHTMLに変換"""
+    out: list[str] = []
+    # 開いているリスト（タグ名, インデント幅）。空行をまたいで継続する
+    lists: list[tuple[str, int]] = []
+    position = 0
+
+    # コードブロックは中身を変換せずに出力（空行を含み得るため先に切り出す）
+    if "```" in text or "~~~" in text:
+        for fence in _FENCE_BLOCK.finditer(text):
+            _render_chunks(text[position:fence.start()], out, lists)
+            _close_lists(out, lists)
+            language = fence.group(2)
+            class_attr = f' class="language-{language}"' if language else ""
+            code = fence.group(3).rstrip("\n")
+            out.append(f"<pre><code{class_attr}>{code}</code></pre>")
+            position = fence.end()
+
+    _render_chunks(text[position:], out, lists)
+    _close_lists(out, lists)
+    return "\n".join(out)
+
+
+def _render_chunks(text: str, out: list[str], lists: list[tuple[str, int]]) -> None:
+    """空行で区切ったまとまりごとに出力
+
+    ブロック記法を含まないまとまりは行単位の判定を省略して段落として出力します。
+    """
+    for chunk in _BLANK_LINES.split(text):
+        head = chunk[:1]
+        if (
+            head
+            and head not in _BLOCK_START_CHARS
+            and not head.isspace()
+            and "|" not in chunk
+            and _SPECIAL_LINE_START.search(chunk) is None
+        ):
+            _close_lists(out, lists)
+            out.append(f"<p>{_render_inline(chunk.rstrip())}</p>")
+            continue
+
+        heading = _HEADING.fullmatch(chunk) if head == "#" else None
+        if heading:
+            _close_lists(out, lists)
+            out.append(_heading(heading))
+        elif chunk.strip():
+            _render_lines(chunk.split("\n"), out, lists)
+
+
+def _render_lines(lines: list[str], out: list[str], lists: list[tuple[str, int]]) -> None:
+    """空行を含まない行の並びをブロック単位で出力"""
+    count = len(lines)
+    index = 0
+
+    while index < count:
+        line = lines[index]
+        kind = _line_kind(line, lines[index + 1] if index + 1 < count else "")
+
+        if kind == "blank":
+            index += 1
+            continue
+
+        if kind == "list":
+            # 項目と、空行を挟まないインデントされた継続行をまとめて処理
+            end = index + 1
+            while end < count:
+                following = lines[end]
+                continued = following[:1].isspace() and following.strip()
+                if not continued and _LIST_ITEM.fullmatch(following) is None:
+                    break
+                end += 1
+            _render_list(out, lists, lines[index:end])
+            index = end
+            continue
+
+        _close_lists(out, lists)
+
+        if kind == "heading":
+            out.append(_heading(_HEADING.fullmatch(line)))
+            index += 1
+        elif kind == "hr":
+            out.append("<hr>")
+            index += 1
+        elif kind == "quote":
+            end = index + 1
+            while end < count and _QUOTE.match(lines[end]):
+                end += 1
+            inner = "\n".join(_QUOTE.sub("", quoted, count=1) for quoted in lines[index:end])
+            out.append(f"<blockquote>\n{_render_blocks(inner)}\n</blockquote>")
+            index = end
+        elif kind == "table":
+            end = index + 2
+            while end < count and "|" in lines[end]:
+                end += 1
+            out.append(_render_table(lines[index:end]))
+            index = end
+        else:
+            end = index + 1
+            while end < count and _line_kind(
+                lines[end], lines[end + 1] if end + 1 < count else ""
+            ) is None:
+                end += 1
+            paragraph = "\n".join(lines[index:end]).strip()
+            out.append(f"<p>{_render_inline(paragraph)}</p>")
+            index = end
 
-        # 見出し（h6 → h1の順で処理）
-        for i in range(6, 0, -1):
-            pattern = rf"^{'#' * i}\s+(.+)$"
-            replacement = rf"<h{i}>\1</h{i}>"
-            html = re.sub(pattern, replacement, html, flags=re.MULTILINE)
 
-        # 太字
-        html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
+def _heading(match: re.Match) -> str:
+    """見出しを生成"""
+    level = len(match.group(1))
+    return f"<h{level}>{_render_inline(match.group(2) or '')}</h{level}>"
 
-        # イタリック
-        html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
 
-        # インラインコード
-        html = re.sub(r"`(.+?)`", r"<code>\1</code>", html)
+def _render_list(out: list[str], lists: list[tuple[str, int]], block: list[str]) -> None:
+    """リストブロックを出力（インデントでネストを判定）"""
+    for line in block:
+        item = _LIST_ITEM.fullmatch(line)
+        if item is None:
+            # リスト項目の継続行
+            if lists:
+                out[-1] += "<br>" + _render_inline(line.strip())
+            continue
+
+        indent = len(item.group(1))
+        tag = "ul" if item.group(2) else "ol"
+        text = _render_inline(item.group(4))
+
+        while lists and indent < lists[-1][1]:
+            _close_list(out, lists)
+
+        if lists and indent == lists[-1][1]:
+            if lists[-1][0] == tag:
+                out[-1] += "</li>"
+                out.append(f"<li>{text}")
+                continue
+            _close_list(out, lists)
+
+        start = item.group(3)
+        start_attr = f' start="{int(start)}"' if start and int(start) != 1 else ""
+        out.append(f"<{tag}{start_attr}>")
+        out.append(f"<li>{text}")
+        lists.append((tag, indent))
+
+
+def _close_list(out: list[str], lists: list[tuple[str, int]]) -> None:
+    tag, _ = lists.pop()
+    out[-1] += "</li>"
+    out.append(f"</{tag}>")
+
+
+def _close_lists(out: list[str], lists: list[tuple[str, int]]) -> None:
+    while lists:
+        _close_list(out, lists)
+
+
+def _render_table(lines: list[str]) -> str:
+    """表ブロックを生成"""
+    header = _split_row(lines[0])
+    alignments = [_alignment(cell) for cell in _split_row(lines[1])]
+
+    rows = [
+        "<table>",
+        "<thead>",
+        _table_row(header, "th", alignments),
+        "</thead>",
+        "<tbody>",
+    ]
+    rows.extend(_table_row(_split_row(line), "td", alignments) for line in lines[2:])
+    rows.extend(["</tbody>", "</table>"])
+    return "\n".join(rows)
+
+
+def _split_row(line: str) -> list[str]:
+    """表の行をセルに分割"""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.strip() for cell in _CELL_SEPARATOR.split(line)]
+
+
+def _alignment(separator: str) -> Optional[str]:
+    """区切り行のセルから列の揃えを取得"""
+    if separator.startswith(":") and separator.endswith(":"):
+        return "center"
+    if separator.endswith(":"):
+        return "right"
+    if separator.startswith(":"):
+        return "left"
+    return None
+
+
+def _table_row(cells: list[str], tag: str, alignments: list[Optional[str]]) -> str:
+    """表の1行を生成"""
+    rendered = []
+    for index, cell in enumerate(cells):
+        align = alignments[index] if index < len(alignments) else None
+        style = f' style="text-align: {align}"' if align else ""
+        rendered.append(f"<{tag}{style}>{_render_inline(cell)}</{tag}>")
+    return "<tr>" + "".join(rendered) + "</tr>"
+
+
+def _render_inline(text: str) -> str:
+    """インライン要素をHTMLに変換
+
+    Args:
+        text: HTMLエスケープ済みのMarkdownテキスト
+
+    Returns:
+        HTML文字列
+    """
+    return _INLINE.sub(_replace_inline, text)
 
-        # リンク
-        html = re.sub(r"\[(.+?)\]\((.+?)\)", r'<a href="\2">\1</a>', html)
 
-        # 改行を<br>に変換（2つ以上の改行は段落として扱う）
-        html = re.sub(r"\n\n+", "</p><p>", html)
-        html = f"<p>{html}</p>"
+def _replace_inline(match: re.Match) -> str:
+    """インライン要素の1つの一致をHTMLに置換"""
+    kind = match.lastgroup
+    if kind == "escaped":
+        return f"&#{ord(match.group('escaped'))};"
+    if kind == "code":
+        return f"<code>{match.group('code')}</code>"
+    if kind == "bold_italic":
+        return f"<strong><em>{_render_inline(match.group('bold_italic'))}</em></strong>"
+    if kind == "bold":
+        return f"<strong>{_render_inline(match.group('bold'))}</strong>"
+    if kind == "italic":
+        return f"<em>{_render_inline(match.group('italic'))}</em>"
 
-        return html
+    label = _render_inline(match.group("link_text"))
+    href = match.group("href")
+    # 危険なスキームはテキストのみ出力
+    if _UNSAFE_URL.match(href):
+        return label
+    return f'<a href="{href}">{label}</a>'
 
 
 # シングルトンインスタンス
@@ -3,7 +3,6 @@
 import base64
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
 from xmlrpc import client as xmlrpc_client
 
 import httpx
@@ -11,6 +10,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import get_settings
 from app.shared.domain.exceptions import ExternalServiceError
+from app.shared.infrastructure.http_clients import HttpClientConfig, http_clients
 
 settings = get_settings()
 
@@ -35,6 +35,8 @@ class WordPressPost:
 class WordPressService:
     """WordPress REST APIクライアント"""
 
+    CLIENT_NAME = "wordpress"
+
     def __init__(self):
         # URLの正規化（プロトコルがない場合はhttps://を追加）
         url = settings.wordpress_url.rstrip("/")
@@ -45,7 +47,18 @@ class WordPressService:
         # WordPress.comサイトもセルフホストサイトも標準のWP REST API v2を使用
         # WordPress.comサイトでもApplication Passwordsは標準のWP REST APIで動作する
         self.api_url = f"{self.base_url}/wp-json/wp/v2"
-        self._client: Optional[httpx.AsyncClient] = None
+
+        # 共有レジストリに登録（API・ワーカーの起動時に接続プールを生成）
+        http_clients.register(
+            self.CLIENT_NAME,
+            HttpClientConfig(
+                headers={
+                    "Authorization": self.auth_header,
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+            ),
+        )
 
     @property
     def auth_header(self) -> str:
@@ -57,16 +70,8 @@ class WordPressService:
         return f"Basic {encoded}"
 
     async def get_client(self) -> httpx.AsyncClient:
-        """HTTPクライアントを取得（遅延初期化）"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                headers={
-                    "Authorization": self.auth_header,
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
-        return self._client
+        """共有HTTPクライアントを取得"""
+        return http_clients.get(self.CLIENT_NAME)
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30))
     async def create_post(
@@ -114,10 +119,42 @@ class WordPressService:
             link=data["link"],
         )
 
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=30))
+    async def update_post(
+        self,
+        post_id: int,
+        title: str | None = None,
+        content: str | None = None,
+    ) -> WordPressPost:
+        """WordPress投稿を更新（指定されたフィールドのみ送信）"""
+        client = await self.get_client()
+
+        payload = {}
+        if title is not None:
+            payload["title"] = title
+        if content is not None:
+            payload["content"] = content
+
+        # 標準のWP REST API v2を使用
+        response = await client.post(
+            f"{self.api_url}/posts/{post_id}",
+            json=payload,
+        )
+
+        if response.status_code >= 400:
+            raise ExternalServiceError("WordPress", f"Update failed: {response.text}")
+
+        data = response.json()
+        return WordPressPost(
+            id=data["id"],
+            title=data["title"]["rendered"],
+            status=data["status"],
+            link=data["link"],
+        )
+
     async def close(self):
         """HTTPクライアントをクローズ"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        await http_clients.close(self.CLIENT_NAME)
 
 
 # シングルトンインスタンス
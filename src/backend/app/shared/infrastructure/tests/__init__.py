@@ -0,0 +1 @@
+"""共有インフラストラクチャのテスト"""
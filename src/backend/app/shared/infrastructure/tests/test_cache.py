@@ -0,0 +1,295 @@
+"""二層キャッシュのテスト"""
+
+import asyncio
+import os
+from typing import Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Integer, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.shared.infrastructure.cache import TieredCache
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+ITEM = TypeAdapter(Optional[Item])
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Row(_Base):
+    __tablename__ = "cache_test_rows"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+async def _started(**options) -> TieredCache:
+    cache = TieredCache(**options)
+    await cache.startup()
+    return cache
+
+
+class TestTieredCache:
+    """プロセス内キャッシュのテスト"""
+
+    async def test_loads_once(self):
+        """2回目以降は読み込み関数を呼ばないことをテスト"""
+        cache = await _started()
+        loader = AsyncMock(return_value=Item(id=1, name="a"))
+
+        first = await cache.get_or_load("item:1", loader, ITEM, ["items"])
+        second = await cache.get_or_load("item:1", loader, ITEM, ["items"])
+
+        assert first == second == Item(id=1, name="a")
+        assert loader.await_count == 1
+        assert cache.stats()["local_hits"] == 1
+
+    async def test_disabled_before_startup(self):
+        """startup() 前はキャッシュしないことをテスト"""
+        cache = TieredCache()
+        loader = AsyncMock(return_value=Item(id=1, name="a"))
+
+        await cache.get_or_load("item:1", loader, ITEM)
+        await cache.get_or_load("item:1", loader, ITEM)
+
+        assert loader.await_count == 2
+
+    async def test_none_is_not_cached(self):
+        """存在しない値はキャッシュしないことをテスト"""
+        cache = await _started()
+        loader = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load("item:1", loader, ITEM) is None
+        assert await cache.get_or_load("item:1", loader, ITEM) is None
+        assert loader.await_count == 2
+
+    async def test_invalidate_by_tag(self):
+        """タグの付いたエントリのみ無効化されることをテスト"""
+        cache = await _started()
+        items = AsyncMock(return_value=Item(id=1, name="a"))
+        others = AsyncMock(return_value=Item(id=2, name="b"))
+        await cache.get_or_load("item:1", items, ITEM, ["items"])
+        await cache.get_or_load("other:2", others, ITEM, ["others"])
+
+        await cache.invalidate("items")
+        await cache.get_or_load("item:1", items, ITEM, ["items"])
+        await cache.get_or_load("other:2", others, ITEM, ["others"])
+
+        assert items.await_count == 2
+        assert others.await_count == 1
+
+    async def test_invalidated_during_load_is_not_stored(self):
+        """読み込み中に無効化された値は保存しないことをテスト"""
+        cache = await _started()
+
+        async def loader():
+            await cache.invalidate("items")
+            return Item(id=1, name="old")
+
+        await cache.get_or_load("item:1", loader, ITEM, ["items"])
+
+        assert cache.stats()["local_entries"] == 0
+
+    async def test_local_ttl_and_max_entries(self):
+        """有効期限切れ・上限超過のエントリが破棄されることをテスト"""
+        expired = await _started(local_ttl=0)
+        loader = AsyncMock(return_value=Item(id=1, name="a"))
+        await expired.get_or_load("item:1", loader, ITEM)
+        await expired.get_or_load("item:1", loader, ITEM)
+        assert loader.await_count == 2
+
+        bounded = await _started(local_max_entries=2)
+        for i in range(3):
+            loader = AsyncMock(return_value=Item(id=i, name="a"))
+            await bounded.get_or_load(f"item:{i}", loader, ITEM)
+        assert bounded.stats()["local_entries"] == 2
+
+    async def test_cached_decorator(self):
+        """デコレーターで引数ごとにキャッシュされることをテスト"""
+        cache = await _started()
+        calls = []
+
+        class Repository:
+            @cache.cached(
+                key=lambda self, item_id: f"item:{item_id}",
+                tags=lambda self, item_id: ["items"],
+                type_=Optional[Item],
+            )
+            async def find(self, item_id: int) -> Optional[Item]:
+                calls.append(item_id)
+                return Item(id=item_id, name="a")
+
+        repo = Repository()
+        assert (await repo.find(1)).id == 1
+        assert (await repo.find(1)).id == 1
+        assert (await repo.find(item_id=2)).id == 2
+        assert calls == [1, 2]
+
+
+class TestInvalidateOnChange:
+    """ORM の変更による無効化のテスト"""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine("sqlite://")
+        _Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+
+    async def test_invalidated_after_commit(self, session):
+        """コミット後に無効化され、ロールバック時は無効化されないことをテスト"""
+        cache = await _started()
+        cache.invalidate_on_change(_Row, "rows")
+        loader = AsyncMock(return_value=Item(id=1, name="a"))
+        await cache.get_or_load("row:1", loader, ITEM, ["rows"])
+
+        session.add(_Row(id=1, name="a"))
+        session.flush()
+        session.rollback()
+        await cache.get_or_load("row:1", loader, ITEM, ["rows"])
+        assert loader.await_count == 1
+
+        session.add(_Row(id=1, name="a"))
+        session.flush()
+        assert cache.stats()["local_entries"] == 1
+        session.commit()
+        assert cache.stats()["local_entries"] == 0
+
+
+class FakeRedis:
+    """キャッシュが使うコマンドのみを実装した Redis（パイプラインは逐次実行）"""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self._pending = []
+
+    def pipeline(self, transaction: bool = True):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        # get / set / incr などはパイプラインに積み、execute で実行
+        command = getattr(self, f"_{name}")
+        return lambda *args, **kwargs: self._pending.append((command, args, kwargs))
+
+    async def execute(self):
+        pending, self._pending = self._pending, []
+        return [command(*args, **kwargs) for command, args, kwargs in pending]
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def _incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+    def _sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(m.encode() for m in members)
+
+    def _smembers(self, key):
+        return self.data.get(key, set())
+
+    def _expire(self, key, seconds):
+        pass
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def _publish(self, channel, message):
+        pass
+
+
+async def _with_redis(redis: FakeRedis) -> TieredCache:
+    """同じ Redis を共有するプロセスのキャッシュ（Pub/Sub の通知は届かない）"""
+    cache = await _started()
+    cache._redis = redis
+    return cache
+
+
+class TestSharedGeneration:
+    """Redis の値の世代のテスト"""
+
+    async def test_stale_load_after_remote_invalidation_is_ignored(self):
+        """他プロセスの無効化より前に始めた読み込みの値が使われないことをテスト"""
+        redis = FakeRedis()
+        first, second = await _with_redis(redis), await _with_redis(redis)
+
+        async def stale_loader():
+            # 読み込み中に別プロセスが無効化（first には通知が届いていない）
+            await second.invalidate("items")
+            return Item(id=1, name="old")
+
+        await first.get_or_load("item:1", stale_loader, ITEM, ["items"])
+        assert redis.data["cache:value:item:1"].startswith(b"0\n")
+
+        fresh = AsyncMock(return_value=Item(id=1, name="new"))
+        value = await second.get_or_load("item:1", fresh, ITEM, ["items"])
+
+        assert value == Item(id=1, name="new")
+        assert fresh.await_count == 1
+        assert redis.data["cache:value:item:1"].startswith(b"1\n")
+
+    async def test_current_generation_is_shared(self):
+        """現在の世代の値は他プロセスから利用されることをテスト"""
+        redis = FakeRedis()
+        first, second = await _with_redis(redis), await _with_redis(redis)
+        await first.invalidate("items")
+
+        loader = AsyncMock(return_value=Item(id=1, name="a"))
+        await first.get_or_load("item:1", loader, ITEM, ["items"])
+        value = await second.get_or_load("item:1", loader, ITEM, ["items"])
+
+        assert value == Item(id=1, name="a")
+        assert loader.await_count == 1
+        assert second.stats()["remote_hits"] == 1
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_REDIS_URL, reason="TEST_REDIS_URL not set")
+class TestRedisTier:
+    """Redis 層のテスト（Redisが必要）"""
+
+    async def test_shared_between_processes(self):
+        """Redis の値を共有し、無効化が他プロセスに通知されることをテスト"""
+        namespace = f"cache-test-{os.getpid()}"
+        first, second = TieredCache(namespace), TieredCache(namespace)
+        await first.startup(TEST_REDIS_URL)
+        await second.startup(TEST_REDIS_URL)
+        try:
+            loader = AsyncMock(return_value=Item(id=1, name="a"))
+            await first.get_or_load("item:1", loader, ITEM, ["items"])
+            value = await second.get_or_load("item:1", loader, ITEM, ["items"])
+
+            assert value == Item(id=1, name="a")
+            assert loader.await_count == 1
+            assert second.stats()["remote_hits"] == 1
+
+            await first.invalidate("items")
+            await asyncio.sleep(0.2)
+
+            assert second.stats()["local_entries"] == 0
+            await second.get_or_load("item:1", loader, ITEM, ["items"])
+            assert loader.await_count == 2
+        finally:
+            await first.shutdown()
+            await second.shutdown()
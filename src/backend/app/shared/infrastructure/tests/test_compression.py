@@ -0,0 +1,120 @@
+"""レスポンス圧縮ミドルウェアのテスト"""
+
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.shared.infrastructure.compression import CompressionMiddleware
+
+BODY = "日本語の記事本文です。" * 200
+
+
+def _client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/article")
+    async def article():
+        return PlainTextResponse(BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/events")
+    async def events():
+        async def stream():
+            yield f"data: {BODY}\n\n"
+            yield "data: done\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def _get(client: TestClient, path: str, accept_encoding: str):
+    # 生の本体を確認するため自動展開を使わずにストリームで取得
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCompressionMiddleware:
+    """圧縮ミドルウェアのテスト"""
+
+    def test_prefers_brotli(self):
+        """brotli を受け入れる場合は brotli で圧縮することをテスト"""
+        response, body = _get(_client(), "/article", "gzip, br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert brotli.decompress(body).decode() == BODY
+
+    def test_gzip(self):
+        """gzip のみ受け入れる場合は gzip で圧縮することをテスト"""
+        response, body = _get(_client(), "/article", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body).decode() == BODY
+        assert len(body) < len(BODY.encode()) / 5
+
+    def test_brotli_disabled(self):
+        """brotli 無効時は gzip を使用することをテスト"""
+        response, _ = _get(_client(brotli_enabled=False), "/article", "br, gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+
+    @pytest.mark.parametrize("accept_encoding", ["", "identity", "gzip;q=0, br;q=0"])
+    def test_not_accepted(self, accept_encoding):
+        """圧縮を受け入れない場合は圧縮しないことをテスト"""
+        response, body = _get(_client(), "/article", accept_encoding)
+
+        assert "content-encoding" not in response.headers
+        assert body.decode() == BODY
+
+    def test_below_minimum_size(self):
+        """閾値未満の本体は圧縮しないことをテスト"""
+        response, body = _get(_client(), "/small", "br")
+
+        assert "content-encoding" not in response.headers
+        assert body == b'{"status":"ok"}'
+
+    def test_streaming_is_not_compressed(self):
+        """SSE は圧縮しないことをテスト"""
+        response, body = _get(_client(), "/events", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert body.decode().endswith("data: done\n\n")
+
+    def test_etag_is_weakened(self):
+        """圧縮したレスポンスのETagが弱いETagになることをテスト"""
+        response, _ = _get(_client(), "/article", "gzip")
+
+        assert response.headers["etag"] == 'W/"abc"'
+
+    @pytest.mark.asyncio
+    async def test_passthrough_start_is_not_held(self):
+        """圧縮しないレスポンスの開始メッセージを本体より前に送信することをテスト"""
+        sent = []
+
+        async def app(scope, receive, send):
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            })
+            # 最初のイベントの前にヘッダーがクライアントに届いていること
+            assert [m["type"] for m in sent] == ["http.response.start"]
+            await send({"type": "http.response.body", "body": b": ok\n\n", "more_body": True})
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        await CompressionMiddleware(app)(scope, None, send)
+
+        assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
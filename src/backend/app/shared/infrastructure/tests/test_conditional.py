@@ -0,0 +1,146 @@
+"""条件付きGETのテスト"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.features.articles.presentation.routes import get_article, list_articles
+from app.shared.domain import models  # noqa
+from app.shared.infrastructure.conditional import (
+    ConditionalRequest,
+    row_etag,
+    rows_etag,
+    validator_headers,
+)
+from app.shared.infrastructure.dependencies import PaginationParams
+
+UPDATED_AT = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+HTTP_DATE = "Fri, 02 Jan 2026 03:04:05 GMT"
+
+
+def _request(if_none_match=None, if_modified_since=None) -> ConditionalRequest:
+    return ConditionalRequest(
+        if_none_match=if_none_match, if_modified_since=if_modified_since
+    )
+
+
+class TestEtag:
+    """ETag生成のテスト"""
+
+    def test_row_etag_changes_with_updated_at(self):
+        """更新日時が変わるとETagが変わることをテスト"""
+        row_id = uuid4()
+
+        etag = row_etag(row_id, UPDATED_AT)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == row_etag(row_id, UPDATED_AT)
+        assert etag != row_etag(row_id, UPDATED_AT + timedelta(microseconds=1))
+
+    def test_rows_etag_changes_with_rows_and_total(self):
+        """行の削除・総数の変化でETagが変わることをテスト"""
+        keys = [(uuid4(), UPDATED_AT), (uuid4(), UPDATED_AT)]
+
+        etag = rows_etag(keys, 10)
+
+        assert etag != rows_etag(keys[:1], 10)
+        assert etag != rows_etag(keys, 11)
+
+    def test_rows_etag_is_weak(self):
+        """一覧のETagは弱いETagで、W/ の有無に関わらず一致することをテスト"""
+        etag = rows_etag([(uuid4(), UPDATED_AT)], 1)
+
+        assert etag.startswith('W/"')
+        assert _request(if_none_match=etag).is_not_modified(etag)
+        assert _request(if_none_match=etag.removeprefix("W/")).is_not_modified(etag)
+
+
+class TestConditionalRequest:
+    """If-None-Match / If-Modified-Since 判定のテスト"""
+
+    def test_without_conditions(self):
+        """条件がない場合は本体を返却することをテスト"""
+        assert _request().not_modified('"a"', UPDATED_AT) is None
+
+    @pytest.mark.parametrize("header", ['"a"', '"b", "a"', 'W/"a"', "*"])
+    def test_if_none_match(self, header):
+        """ETagが一致する場合は 304 を返却することをテスト"""
+        response = _request(if_none_match=header).not_modified('"a"', UPDATED_AT)
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"a"'
+        assert response.headers["Last-Modified"] == HTTP_DATE
+        assert response.body == b""
+
+    def test_if_none_match_takes_precedence(self):
+        """If-None-Match が不一致なら If-Modified-Since は無視することをテスト"""
+        request = _request(if_none_match='"b"', if_modified_since=HTTP_DATE)
+
+        assert request.not_modified('"a"', UPDATED_AT) is None
+
+    def test_if_modified_since(self):
+        """最終更新日時を秒単位で比較することをテスト"""
+        assert _request(if_modified_since=HTTP_DATE).is_not_modified('"a"', UPDATED_AT)
+        assert not _request(if_modified_since=HTTP_DATE).is_not_modified(
+            '"a"', UPDATED_AT + timedelta(seconds=1)
+        )
+
+    @pytest.mark.parametrize("header", ["invalid", "Fri, 02 Jan 2026 03:04:05"])
+    def test_invalid_if_modified_since_is_ignored(self, header):
+        """不正な If-Modified-Since は無視することをテスト"""
+        assert not _request(if_modified_since=header).is_not_modified('"a"', UPDATED_AT)
+
+    def test_validator_headers(self):
+        """検証子ヘッダーをテスト"""
+        assert validator_headers('"a"') == {"ETag": '"a"', "Cache-Control": "no-cache"}
+
+
+class TestArticleDetail:
+    """記事取得の条件付きGETのテスト"""
+
+    async def test_not_modified_skips_loading_article(self):
+        """キャッシュが最新の場合は記事本体を読み込まないことをテスト"""
+        article_id = uuid4()
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = UPDATED_AT
+        session.execute = AsyncMock(return_value=result)
+
+        response = await get_article(
+            article_id,
+            session,
+            _request(if_none_match=row_etag(article_id, UPDATED_AT)),
+        )
+
+        assert response.status_code == 304
+        assert session.execute.await_count == 1
+        statement = session.execute.await_args.args[0]
+        assert [column.name for column in statement.selected_columns] == ["updated_at"]
+
+
+class TestArticleList:
+    """記事一覧の条件付きGETのテスト"""
+
+    async def test_etag_covers_returned_rows_only(self):
+        """先読みした1件を除いた返却行からETagを生成することをテスト"""
+        rows = [{"id": uuid4(), "updated_at": UPDATED_AT} for _ in range(3)]
+        pagination = PaginationParams(page=1, per_page=2, cursor=None, include_total=True)
+        etag = rows_etag([(row["id"], row["updated_at"]) for row in rows[:2]], 5, True)
+
+        with patch.object(
+            ArticleRepository, "find_all_fields", AsyncMock(return_value=(rows, 5))
+        ):
+            response = await list_articles(
+                AsyncMock(),
+                pagination,
+                _request(if_none_match=etag),
+                category_id=None,
+                status=None,
+                fields=None,
+            )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
@@ -0,0 +1,63 @@
+"""読み取り専用セッションのテスト"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.shared.infrastructure import database
+from app.shared.infrastructure.database import READ_ONLY_EXECUTION_OPTIONS, get_read_db
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+async def test_read_session_never_commits():
+    """読み取り専用セッションはコミットせずロールバックすることをテスト"""
+    sessions = get_read_db()
+    session = await anext(sessions)
+
+    with patch.object(session, "commit") as commit, \
+            patch.object(session, "rollback") as rollback:
+        with pytest.raises(StopAsyncIteration):
+            await anext(sessions)
+
+    commit.assert_not_called()
+    rollback.assert_awaited_once()
+    assert session.bind is database.read_engine
+
+
+def test_read_engine_shares_primary_pool_without_replica():
+    """レプリカ未設定の場合はプライマリの接続プールを共有することをテスト"""
+    if database.settings.database_replica_url:
+        pytest.skip("DATABASE_REPLICA_URL is set")
+
+    assert database.read_engine.sync_engine.pool is database.engine.sync_engine.pool
+    assert database.read_engine.get_execution_options() == READ_ONLY_EXECUTION_OPTIONS
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+async def test_read_engine_rejects_writes():
+    """読み取り専用エンジンで書き込みが拒否され、プールの接続には残らないことをテスト"""
+    url = TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(url, pool_size=1, max_overflow=0)
+    read_engine = engine.execution_options(**READ_ONLY_EXECUTION_OPTIONS)
+    try:
+        async with read_engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+            assert (
+                await conn.execute(text("SHOW transaction_read_only"))
+            ).scalar() == "on"
+            with pytest.raises(DBAPIError, match="read-only transaction"):
+                await conn.execute(text("CREATE TEMPORARY TABLE t (id int)"))
+
+        # 同じ接続をプライマリとして使うと書き込みできる
+        async with engine.connect() as conn:
+            assert (
+                await conn.execute(text("SHOW transaction_read_only"))
+            ).scalar() == "off"
+    finally:
+        await engine.dispose()
@@ -0,0 +1,106 @@
+"""接続プール設定・メトリクスのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.config import Settings
+from app.shared.infrastructure.db_metrics import (
+    DbMetricsRegistry,
+    InstrumentedAsyncQueuePool,
+    LatencyWindow,
+    PoolMetrics,
+)
+
+
+def _settings(**values) -> Settings:
+    return Settings(
+        secret_key="secret",
+        database_url="postgresql://u:p@localhost/db",
+        redis_url="redis://localhost:6379",
+        google_api_key="key",
+        wordpress_url="https://example.com",
+        wordpress_username="user",
+        wordpress_app_password="password",
+        google_credentials_json="{}",
+        **values,
+    )
+
+
+class TestPoolOptions:
+    """プロファイルごとのプール設定のテスト"""
+
+    def test_api_profile(self):
+        options = _settings(db_pool_profile="api", db_pool_size=15).db_pool_options()
+
+        assert options["pool_size"] == 15
+        assert options["max_overflow"] == 10
+        assert options["connect_args"] == {"statement_cache_size": 100}
+
+    def test_worker_profile_follows_max_jobs(self):
+        """ワーカーのプールサイズは既定で同時実行ジョブ数と同じになることをテスト"""
+        options = _settings(
+            db_pool_profile="worker", worker_max_jobs=4, db_statement_cache_size=0
+        ).db_pool_options()
+
+        assert options["pool_size"] == 4
+        assert options["max_overflow"] == 0
+        assert options["connect_args"]["statement_cache_size"] == 0
+
+    def test_worker_pool_size_override(self):
+        options = _settings(
+            db_pool_profile="worker", db_worker_pool_size=6, db_command_timeout=5
+        ).db_pool_options()
+
+        assert options["pool_size"] == 6
+        assert options["connect_args"]["command_timeout"] == 5
+
+
+class TestMetrics:
+    """メトリクス収集のテスト"""
+
+    def test_latency_summary(self):
+        window = LatencyWindow(size=100)
+        for ms in range(1, 201):
+            window.observe(ms / 1000)
+
+        summary = window.summary()
+
+        assert summary["count"] == 200
+        assert summary["p50_ms"] == 151
+        assert summary["max_ms"] == 200
+        assert LatencyWindow().summary() == {"count": 0}
+
+    async def test_checkout_wait_and_timeouts(self):
+        """接続の取得待ち時間とタイムアウトが記録されることをテスト"""
+        pool = InstrumentedAsyncQueuePool(
+            MagicMock, pool_size=1, max_overflow=0, timeout=0.05
+        )
+        pool.metrics = PoolMetrics()
+
+        connection = await greenlet_spawn(pool.connect)
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+        await greenlet_spawn(connection.close)
+
+        assert pool.metrics.checkout_wait.count == 2
+        assert pool.metrics.checkout_wait.summary()["max_ms"] >= 50
+        assert pool.metrics.checkout_timeouts == 1
+
+    def test_query_latency_and_pool_usage(self):
+        """SQLの実行時間とプールの使用状況が記録されることをテスト"""
+        registry = DbMetricsRegistry()
+        engine = create_engine("sqlite://", poolclass=QueuePool)
+        registry.instrument("test", engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+            stats = registry.stats()["test"]
+            assert stats["checked_out"] == 1
+
+        assert registry.stats()["test"]["query"]["count"] == 2
@@ -0,0 +1,63 @@
+"""共有HTTPクライアントレジストリのテスト"""
+
+import pytest
+
+from app.shared.infrastructure.http_clients import HttpClientConfig, HttpClientRegistry
+
+
+class TestHttpClientRegistry:
+    """HttpClientRegistryのテスト"""
+
+    def setup_method(self):
+        self.registry = HttpClientRegistry()
+        self.registry.register(
+            "example", HttpClientConfig(headers={"X-Test": "1"}, timeout=5.0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_startup_opens_and_reuses_client(self):
+        """起動時に生成したクライアントが共有されることをテスト"""
+        await self.registry.startup()
+        client = self.registry.get("example")
+
+        assert not client.is_closed
+        assert client.headers["X-Test"] == "1"
+        assert self.registry.get("example") is client
+
+        await self.registry.shutdown()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_get_reopens_closed_client(self):
+        """クローズ後の取得で新しいクライアントが生成されることをテスト"""
+        client = self.registry.get("example")
+        await self.registry.close("example")
+
+        reopened = self.registry.get("example")
+        assert reopened is not client
+        assert not reopened.is_closed
+
+        await self.registry.shutdown()
+
+    def test_get_unknown_client_raises(self):
+        """未登録のクライアント名でエラーになることをテスト"""
+        with pytest.raises(KeyError):
+            self.registry.get("unknown")
+
+    @pytest.mark.asyncio
+    async def test_stats_reports_pool_usage(self):
+        """接続プールの使用状況が取得できることをテスト"""
+        stats = self.registry.stats()["example"]
+        assert stats["open"] is False
+        assert stats["connections"] == 0
+
+        await self.registry.startup()
+        stats = self.registry.stats()["example"]
+
+        assert stats["open"] is True
+        assert stats["max_connections"] > 0
+        assert stats["in_use"] == 0
+        assert stats["queued_requests"] == 0
+        assert stats["requests_total"] == 0
+
+        await self.registry.shutdown()
@@ -0,0 +1,34 @@
+"""カーソルページネーションのテスト"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.shared.domain.exceptions import ValidationError
+from app.shared.infrastructure.pagination import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """カーソルのエンコード・デコードのテスト"""
+
+    def test_round_trip(self):
+        """エンコードしたキーが復元されることをテスト"""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        cursor = encode_cursor(created_at, row_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, row_id)
+
+    def test_empty_cursor(self):
+        """未指定の場合は None を返すことをテスト"""
+        assert decode_cursor(None) is None
+        assert decode_cursor("") is None
+
+    @pytest.mark.parametrize("cursor", ["invalid", "e30", "WyJ4IiwieSJd"])
+    def test_invalid_cursor(self, cursor):
+        """不正なカーソルは400エラーになることをテスト"""
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor)
@@ -0,0 +1,243 @@
+"""主要クエリの実行計画のテスト（PostgreSQLが必要）
+
+一時スキーマにテーブル・インデックスを作成してデータを投入し、
+記事一覧・記事検索・テンプレート検索・ジョブログ取得がインデックスを使うことを
+確認します。
+実行には TEST_DATABASE_URL（postgresql://...）を設定してください。
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.features.articles.domain.models import Article
+from app.features.articles.domain.schemas import ARTICLE_SUMMARY_FIELDS
+from app.features.articles.infrastructure.repository import ArticleRepository
+from app.features.job_logs.domain.models import JobLog
+from app.features.job_logs.infrastructure.partitions import (
+    MonthPartition,
+    add_months,
+    create_partitions,
+    month_start,
+)
+from app.features.prompt_templates.domain.models import PromptTemplate
+from app.shared.domain import models  # noqa
+from app.shared.domain.enums import ArticleStatus
+from app.shared.infrastructure.database import Base
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"),
+]
+
+CATEGORY_COUNT = 50
+ARTICLES_PER_CATEGORY = 400
+
+SEED_SQL = f"""
+INSERT INTO categories (id, name, slug, created_at, updated_at)
+SELECT gen_random_uuid(), 'category-' || i, 'category-' || i, now(), now()
+FROM generate_series(1, {CATEGORY_COUNT}) AS i;
+
+INSERT INTO prompt_templates
+    (id, category_id, name, system_prompt, user_prompt_template, is_active, version,
+     created_at, updated_at)
+SELECT gen_random_uuid(), c.id, 'template-' || v, 's', 'u', v = 1, v, now(), now()
+FROM categories c, generate_series(1, 5) AS v;
+
+INSERT INTO articles (id, category_id, keyword, status, created_at, updated_at)
+SELECT gen_random_uuid(), c.id, 'keyword-' || i,
+       (ARRAY['PENDING', 'GENERATING', 'FAILED', 'REVIEW_PENDING', 'REVIEWED',
+              'PUBLISHED'])[1 + i % 6]::articlestatus,
+       now() - make_interval(secs => i), now()
+FROM categories c, generate_series(1, {ARTICLES_PER_CATEGORY}) AS i;
+
+UPDATE articles SET title = 'Title ' || keyword || ' ' || md5(id::text);
+
+INSERT INTO article_contents
+    (id, article_id, revision, content_hash, content, char_count, created_at)
+SELECT gen_random_uuid(), a.id, 1, md5(a.id::text),
+       repeat(md5(random()::text), 20) || ' ' || a.keyword, 660, now()
+FROM articles a;
+
+UPDATE articles a SET current_content_id = c.id
+FROM article_contents c WHERE c.article_id = a.id;
+
+INSERT INTO job_logs (id, article_id, job_type, status, created_at)
+SELECT gen_random_uuid(), a.id, 'GENERATE', 'SUCCESS', now() - make_interval(days => 31 * j)
+FROM articles a, generate_series(0, 2) AS j;
+
+ANALYZE;
+"""
+
+
+@pytest_asyncio.fixture
+async def connection():
+    """データ投入済みの一時スキーマに接続"""
+    url = TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(url)
+    schema = f"plan_test_{uuid.uuid4().hex[:8]}"
+
+    async with engine.connect() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+        await conn.execute(text(f"SET search_path TO {schema}, public"))
+        await conn.run_sync(Base.metadata.create_all)
+        # job_logs の直近4か月分のパーティション
+        current = month_start(datetime.now(timezone.utc))
+        await create_partitions(
+            conn, [MonthPartition(add_months(current, -i)) for i in range(4)]
+        )
+        for statement in SEED_SQL.split(";\n"):
+            if statement.strip():
+                await conn.execute(text(statement))
+        try:
+            yield conn
+        finally:
+            await conn.rollback()
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            await conn.commit()
+    await engine.dispose()
+
+
+async def _plan_indexes(conn, query, dialect=None) -> set[str]:
+    """クエリの実行計画で使われたインデックス名を取得
+
+    ESCAPE などの文字列リテラルを含むクエリは、接続の設定
+    （standard_conforming_strings）に合わせて dialect に conn.dialect を指定します。
+    """
+    sql = query.compile(
+        dialect=dialect or postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    indexes: set[str] = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            indexes.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return indexes
+
+
+async def _first_id(conn, model):
+    return (await conn.execute(select(model.id).limit(1))).scalar_one()
+
+
+def _article_list(**filters):
+    """ArticleRepository.find_all と同じ形の一覧クエリ"""
+    query = select(Article)
+    for column, value in filters.items():
+        query = query.where(getattr(Article, column) == value)
+    return query.order_by(Article.created_at.desc(), Article.id.desc()).limit(21)
+
+
+class TestQueryPlans:
+    """主要クエリがインデックスを使うことのテスト"""
+
+    async def test_article_list_by_category(self, connection):
+        category_id = (
+            await connection.execute(select(Article.category_id).limit(1))
+        ).scalar_one()
+
+        indexes = await _plan_indexes(connection, _article_list(category_id=category_id))
+
+        assert "ix_articles_category_id_created_at_id" in indexes
+
+    async def test_article_list_by_status(self, connection):
+        indexes = await _plan_indexes(
+            connection, _article_list(status=ArticleStatus.REVIEWED)
+        )
+
+        assert "ix_articles_status_created_at_id" in indexes
+
+    async def test_article_list_cursor_page(self, connection):
+        row = (
+            await connection.execute(
+                select(Article.created_at, Article.id)
+                .order_by(Article.created_at.desc())
+                .offset(5000)
+                .limit(1)
+            )
+        ).one()
+        query = (
+            select(Article)
+            .where(tuple_(Article.created_at, Article.id) < tuple(row))
+            .order_by(Article.created_at.desc(), Article.id.desc())
+            .limit(21)
+        )
+
+        indexes = await _plan_indexes(connection, query)
+
+        assert "ix_articles_created_at_id" in indexes
+
+    async def test_article_search_uses_both_trigram_indexes(self, connection):
+        query = ArticleRepository.search_query("keyword-399", ARTICLE_SUMMARY_FIELDS)
+
+        indexes = await _plan_indexes(connection, query, dialect=connection.dialect)
+
+        assert "ix_articles_title_trgm" in indexes
+        assert "ix_article_contents_content_trgm" in indexes
+
+    async def test_active_template_lookup(self, connection):
+        category_id = (
+            await connection.execute(select(PromptTemplate.category_id).limit(1))
+        ).scalar_one()
+        query = (
+            select(PromptTemplate)
+            .where(PromptTemplate.category_id == category_id)
+            .where(PromptTemplate.is_active == True)  # noqa: E712
+        )
+
+        indexes = await _plan_indexes(connection, query)
+
+        assert "ix_prompt_templates_category_id_is_active" in indexes
+
+    async def test_job_logs_by_article(self, connection):
+        article_id = await _first_id(connection, Article)
+        query = (
+            select(JobLog)
+            .where(JobLog.article_id == article_id)
+            .order_by(JobLog.created_at.desc())
+        )
+
+        indexes = await _plan_indexes(connection, query)
+
+        # 各パーティションのインデックス（親の ix_job_logs_article_id_created_at から作成）
+        assert indexes
+        assert all(name.endswith("article_id_created_at_idx") for name in indexes)
+
+    async def test_job_logs_recent_window_prunes_partitions(self, connection):
+        since = datetime.now(timezone.utc) - timedelta(days=7)
+        query = select(JobLog.status).where(JobLog.created_at >= since)
+        sql = query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+
+        result = await connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        relations: set[str] = set()
+        nodes = [plan[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            if "Relation Name" in node:
+                relations.add(node["Relation Name"])
+            nodes.extend(node.get("Plans", []))
+
+        # 直近7日間は当月と前月のパーティションのみ
+        assert relations
+        assert len(relations) <= 2
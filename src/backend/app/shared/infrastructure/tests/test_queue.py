@@ -0,0 +1,59 @@
+"""ジョブキュー接続プールのテスト"""
+
+import pytest
+
+from app.shared.infrastructure.queue import QueuePool
+
+
+class TestQueuePool:
+    """QueuePoolのテスト"""
+
+    def setup_method(self):
+        # 接続できないポートを指定（Redis サーバーは不要）
+        self.pool = QueuePool(
+            "redis://127.0.0.1:1/0", max_connections=5, connect_timeout=0.2
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_reuses_client(self):
+        """同じクライアントが共有されることをテスト"""
+        client = self.pool.get()
+        assert self.pool.get() is client
+        assert client.connection_pool.max_connections == 5
+
+        await self.pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_resets_client(self):
+        """クローズ後の取得で新しいクライアントが生成されることをテスト"""
+        client = self.pool.get()
+        await self.pool.shutdown()
+
+        assert self.pool.stats()["open"] is False
+        assert self.pool.get() is not client
+
+        await self.pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stats_reports_pool_usage(self):
+        """接続プールの使用状況が取得できることをテスト"""
+        assert self.pool.stats() == {"open": False, "in_use": 0, "idle": 0}
+
+        self.pool.get()
+        stats = self.pool.stats()
+
+        assert stats["open"] is True
+        assert stats["max_connections"] == 5
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 0
+
+        await self.pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_ping_unreachable_returns_false(self):
+        """Redis に接続できない場合に False を返すことをテスト"""
+        assert await self.pool.ping() is False
+        # 起動時に接続できなくても例外にしない
+        await self.pool.startup()
+
+        await self.pool.shutdown()
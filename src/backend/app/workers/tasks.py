@@ -4,18 +4,35 @@ This module defines background tasks that run asynchronously
 using ARQ (Async Redis Queue) for article generation and
 batch processing operations.
 """
+from datetime import timedelta
 from typing import Any, Optional
 from uuid import UUID
 
-from arq import create_pool
+from arq import create_pool, cron, func
 from arq.connections import RedisSettings
 
 from app.core.config import get_settings
+from app.features.analytics.infrastructure.repository import GenerationRollupRepository
 from app.features.articles.application.article_generator import get_article_generator
-from app.shared.infrastructure.database import async_session_maker
+from app.features.batch.infrastructure.events import BatchProgress
+from app.features.job_logs.infrastructure.partitions import manage_partitions
+from app.features.wordpress.application.bulk_publisher import (
+    get_bulk_publisher,
+    merge_responses,
+)
+from app.features.wordpress.domain.schemas import BulkPublishResponse
+from app.shared.infrastructure.cache import cache
+from app.shared.infrastructure.database import async_session_maker, engine
+from app.shared.infrastructure.db_metrics import db_metrics
+from app.shared.infrastructure.http_clients import http_clients
 
 settings = get_settings()
 
+# Default per-job timeout (seconds)
+JOB_TIMEOUT = 300
+# batch_generate_task runs a whole selector chunk, so its timeout grows with it
+BATCH_JOB_TIMEOUT = settings.batch_job_timeout
+
 
 async def generate_article_task(
     ctx: dict,
@@ -26,7 +43,8 @@ async def generate_article_task(
 
     This task is executed by ARQ workers and generates article
     content using Claude API. The task is idempotent and can be
-    safely retried.
+    safely retried. Progress events are published to the job's
+    event stream (see ``GET /api/batch/{job_id}/events``).
 
     Args:
         ctx: ARQ context dictionary
@@ -47,19 +65,14 @@ async def generate_article_task(
         ...     {'temperature': 0.7}
         ... )
     """
-    async with async_session_maker() as db:
-        generator = get_article_generator()
-        result = await generator.generate(db, UUID(article_id), options)
-        await db.commit()
-
-        return {
-            "success": result.success,
-            "article_id": str(result.article_id),
-            "title": result.title,
-            "char_count": result.char_count,
-            "errors": result.errors,
-            "duration_ms": result.duration_ms
-        }
+    progress = BatchProgress.from_context(ctx, total=1)
+    success = False
+    try:
+        result = await _generate_article(progress, 0, article_id, options)
+        success = result["success"]
+        return result
+    finally:
+        await progress.publish("completed", success=int(success), failed=int(not success))
 
 
 async def batch_generate_task(
@@ -71,6 +84,9 @@ async def batch_generate_task(
 
     Generates multiple articles sequentially. Each article is
     generated independently, so partial success is possible.
+    Per-article progress and a final ``completed`` event are
+    published to the job's event stream; ``completed`` is sent even
+    if the job times out or is cancelled.
 
     Args:
         ctx: ARQ context dictionary
@@ -91,33 +107,323 @@ async def batch_generate_task(
         ...     {'char_count_min': 2000}
         ... )
     """
+    progress = BatchProgress.from_context(ctx, total=len(article_ids))
     results = []
 
-    for article_id in article_ids:
-        try:
-            result = await generate_article_task(ctx, article_id, options)
-            results.append(result)
-        except Exception as e:
-            # Record error but continue processing other articles
-            results.append({
-                "success": False,
-                "article_id": article_id,
-                "title": None,
-                "char_count": 0,
-                "errors": [str(e)],
-                "duration_ms": 0
-            })
-
-    success_count = sum(1 for r in results if r["success"])
+    try:
+        for index, article_id in enumerate(article_ids):
+            try:
+                result = await _generate_article(progress, index, article_id, options)
+                results.append(result)
+            except Exception as e:
+                # Record error but continue processing other articles
+                results.append({
+                    "success": False,
+                    "article_id": article_id,
+                    "title": None,
+                    "char_count": 0,
+                    "errors": [str(e)],
+                    "duration_ms": 0
+                })
+    finally:
+        # Also sent on timeout/cancellation; unprocessed articles count as failed
+        success_count = sum(1 for r in results if r["success"])
+        failed_count = len(article_ids) - success_count
+        await progress.publish("completed", success=success_count, failed=failed_count)
 
     return {
         "total": len(article_ids),
         "success": success_count,
-        "failed": len(article_ids) - success_count,
+        "failed": failed_count,
         "results": results
     }
 
 
+async def _generate_article(
+    progress: BatchProgress,
+    index: int,
+    article_id: str,
+    options: Optional[dict]
+) -> dict:
+    """Generate one article and publish its progress events.
+
+    Publishes ``started``, ``generated`` (from the generator) and then
+    ``validated`` or ``failed``. Exceptions are re-raised after the
+    ``failed`` event.
+    """
+    await progress.publish("started", article_id=article_id, index=index)
+    try:
+        async with async_session_maker() as db:
+            generator = get_article_generator()
+            result = await generator.generate(
+                db,
+                UUID(article_id),
+                options,
+                progress=progress.for_article(article_id, index)
+            )
+            await db.commit()
+    except Exception as e:
+        await progress.publish(
+            "failed", article_id=article_id, index=index, errors=[str(e)]
+        )
+        raise
+
+    await progress.publish(
+        "validated" if result.success else "failed",
+        article_id=article_id,
+        index=index,
+        duration_ms=result.duration_ms,
+        title=result.title,
+        char_count=result.char_count,
+        errors=result.errors or None
+    )
+
+    return {
+        "success": result.success,
+        "article_id": str(result.article_id),
+        "title": result.title,
+        "char_count": result.char_count,
+        "errors": result.errors,
+        "duration_ms": result.duration_ms
+    }
+
+
+async def create_draft_task(ctx: dict, article_id: str) -> dict:
+    """Background task for creating a single WordPress draft.
+
+    Runs the WordPress request, article update, PUBLISH job log and
+    Sheets sync outside the HTTP request that enqueued it.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_id: UUID string of the article to push as a draft
+
+    Returns:
+        Dictionary with the article result:
+        - article_id: str
+        - success: bool
+        - wp_post_id: int | None
+        - wp_url: str | None
+        - status: str | None
+        - error: str | None
+    """
+    async with async_session_maker() as db:
+        publisher = get_bulk_publisher()
+        result = await publisher.create_drafts(db, [UUID(article_id)])
+        await db.commit()
+
+        return result.results[0].model_dump(mode="json")
+
+
+async def publish_article_task(ctx: dict, article_id: str) -> dict:
+    """Background task for publishing a single WordPress draft.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_id: UUID string of the article to publish
+
+    Returns:
+        Dictionary with the article result (same shape as create_draft_task)
+    """
+    async with async_session_maker() as db:
+        publisher = get_bulk_publisher()
+        result = await publisher.publish(db, [UUID(article_id)])
+        await db.commit()
+
+        return result.results[0].model_dump(mode="json")
+
+
+async def sync_post_task(ctx: dict, article_id: str) -> dict:
+    """Background task for incrementally syncing a single WordPress post.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_id: UUID string of the article to sync
+
+    Returns:
+        Dictionary with the article result (same shape as create_draft_task,
+        plus updated_fields)
+    """
+    async with async_session_maker() as db:
+        publisher = get_bulk_publisher()
+        result = await publisher.sync_posts(db, [UUID(article_id)])
+        await db.commit()
+
+        return result.results[0].model_dump(mode="json")
+
+
+async def bulk_create_drafts_task(
+    ctx: dict,
+    article_ids: list[str],
+    concurrency: Optional[int] = None
+) -> dict:
+    """Background task for bulk WordPress draft creation.
+
+    Loads each chunk of articles in one query and pushes them to
+    WordPress concurrently through the shared HTTP client, committing
+    after every chunk. Each article is handled independently, so
+    partial success is possible.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_ids: List of article UUID strings to push as drafts
+        concurrency: Optional concurrent request limit
+
+    Returns:
+        Dictionary with bulk results:
+        - total: int - Total number of articles
+        - success: int - Number of drafts created
+        - failed: int - Number of failures
+        - results: list[dict] - Individual article results
+    """
+    result = await _publish_in_chunks("create_drafts", article_ids, concurrency)
+    return result.model_dump(mode="json")
+
+
+async def bulk_publish_task(
+    ctx: dict,
+    article_ids: list[str],
+    concurrency: Optional[int] = None
+) -> dict:
+    """Background task for bulk WordPress publishing.
+
+    Publishes existing WordPress drafts concurrently. Each article
+    is handled independently, so partial success is possible.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_ids: List of article UUID strings to publish
+        concurrency: Optional concurrent request limit
+
+    Returns:
+        Dictionary with bulk results (same shape as bulk_create_drafts_task)
+    """
+    result = await _publish_in_chunks("publish", article_ids, concurrency)
+    return result.model_dump(mode="json")
+
+
+async def bulk_sync_posts_task(
+    ctx: dict,
+    article_ids: list[str],
+    concurrency: Optional[int] = None
+) -> dict:
+    """Background task for incremental WordPress post sync.
+
+    Pushes only the fields whose content hash changed since the last
+    push. Unchanged articles are skipped without any HTTP request, so
+    periodic "sync all" runs are cheap.
+
+    Args:
+        ctx: ARQ context dictionary
+        article_ids: List of article UUID strings to sync
+        concurrency: Optional concurrent request limit
+
+    Returns:
+        Dictionary with bulk results (same shape as bulk_create_drafts_task)
+    """
+    result = await _publish_in_chunks("sync_posts", article_ids, concurrency)
+    return result.model_dump(mode="json")
+
+
+async def _publish_in_chunks(
+    operation: str,
+    article_ids: list[str],
+    concurrency: Optional[int],
+) -> BulkPublishResponse:
+    """Run a bulk publisher operation and commit after every chunk.
+
+    Each chunk runs in its own session and transaction, so the WordPress
+    post ids (and job logs) of finished chunks are saved even if the job
+    times out or the worker dies later. A retried job then skips the
+    articles that already have a post instead of creating duplicates.
+
+    Args:
+        operation: WordPressBulkPublisher method name
+        article_ids: List of article UUID strings
+        concurrency: Optional concurrent request limit
+
+    Returns:
+        Merged response of all chunks
+    """
+    publisher = get_bulk_publisher()
+    ids = list(dict.fromkeys(UUID(aid) for aid in article_ids))
+    chunk_size = settings.wordpress_bulk_chunk_size
+    responses = []
+    for start in range(0, len(ids), chunk_size):
+        async with async_session_maker() as db:
+            response = await getattr(publisher, operation)(
+                db, ids[start:start + chunk_size], concurrency
+            )
+            await db.commit()
+        responses.append(response)
+    return merge_responses(responses)
+
+
+async def manage_job_log_partitions_task(ctx: dict) -> dict:
+    """Cron task that maintains the monthly job_logs partitions.
+
+    Creates partitions for the upcoming months and detaches and drops
+    partitions older than the retention window. Runs daily and once at
+    worker startup, so inserts never hit a month without a partition.
+
+    Args:
+        ctx: ARQ context dictionary
+
+    Returns:
+        Dictionary with partition changes:
+        - created: list[str] - Names of created partitions
+        - dropped: list[str] - Names of dropped partitions
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        return await manage_partitions(
+            conn,
+            retention_months=settings.job_log_retention_months,
+            ahead=settings.job_log_partitions_ahead,
+        )
+
+
+async def refresh_generation_rollups_task(ctx: dict) -> dict:
+    """Cron task that incrementally refreshes the generation analytics rollups.
+
+    Recomputes only the most recent hours (see ANALYTICS_LATENESS_MINUTES)
+    from job_logs, so each run scans the current partitions only.
+
+    Args:
+        ctx: ARQ context dictionary
+
+    Returns:
+        Dictionary with the refreshed window:
+        - since: str | None - Start of the recomputed hours (None if no logs)
+    """
+    async with async_session_maker() as db:
+        repo = GenerationRollupRepository(db)
+        since = await repo.refresh(
+            timedelta(minutes=settings.analytics_lateness_minutes)
+        )
+        await db.commit()
+
+        return {"since": since.isoformat() if since else None}
+
+
+async def startup(ctx: dict) -> None:
+    """Open shared clients when the worker starts."""
+    await http_clients.startup()
+    if settings.cache_enabled:
+        await cache.startup(str(settings.redis_url))
+
+
+async def shutdown(ctx: dict) -> None:
+    """Close shared clients when the worker stops."""
+    await cache.shutdown()
+    await http_clients.shutdown()
+
+
+async def after_job_end(ctx: dict) -> None:
+    """Publish this worker's DB pool metrics for the API's /health/db."""
+    await db_metrics.publish(ctx["redis"])
+
+
 class WorkerSettings:
     """ARQ worker configuration.
 
@@ -126,16 +432,47 @@ class WorkerSettings:
 
     Attributes:
         functions: List of task functions to register
+        cron_jobs: Periodic tasks (job_logs partitions, analytics rollups)
+        on_startup: Hook that opens shared clients
+        on_shutdown: Hook that closes shared clients
+        after_job_end: Hook that publishes DB pool metrics
         redis_settings: Redis connection settings
-        max_jobs: Maximum concurrent jobs
-        job_timeout: Maximum execution time per job (seconds)
+        max_jobs: Maximum concurrent jobs (also the worker DB pool size)
+        job_timeout: Maximum execution time per job (seconds);
+            batch_generate_task and the bulk WordPress tasks have
+            their own timeouts
         keep_result: How long to keep job results (seconds)
     """
 
-    functions = [generate_article_task, batch_generate_task]
+    functions = [
+        generate_article_task,
+        func(batch_generate_task, timeout=BATCH_JOB_TIMEOUT),
+        create_draft_task,
+        publish_article_task,
+        sync_post_task,
+        func(bulk_create_drafts_task, timeout=settings.wordpress_bulk_job_timeout),
+        func(bulk_publish_task, timeout=settings.wordpress_bulk_job_timeout),
+        func(bulk_sync_posts_task, timeout=settings.wordpress_bulk_job_timeout),
+    ]
+    cron_jobs = [
+        cron(
+            manage_job_log_partitions_task,
+            hour={3},
+            minute={15},
+            run_at_startup=True,
+        ),
+        cron(
+            refresh_generation_rollups_task,
+            minute=set(range(0, 60, settings.analytics_refresh_interval_minutes)),
+            run_at_startup=True,
+        ),
+    ]
+    on_startup = startup
+    on_shutdown = shutdown
+    after_job_end = after_job_end
     redis_settings = RedisSettings.from_dsn(str(settings.redis_url))
-    max_jobs = 10
-    job_timeout = 300  # 5 minutes
+    max_jobs = settings.worker_max_jobs
+    job_timeout = JOB_TIMEOUT  # 5 minutes
     keep_result = 3600  # 1 hour
 
 
@@ -143,6 +480,9 @@ class WorkerSettings:
 async def get_redis_pool():
     """Create and return Redis pool for ARQ.
 
+    Intended for scripts and one-off jobs; the API process shares a single
+    pool via ``app.shared.infrastructure.queue.queue_pool`` instead.
+
     Returns:
         ARQ Redis pool
 
@@ -0,0 +1,6 @@
+"""Performance benchmarks.
+
+Run from src/backend, e.g.::
+
+    python -m benchmarks.markdown_converter
+"""
@@ -0,0 +1,143 @@
+"""Benchmark: article response serialization, FastAPI default vs. orjson.
+
+"fastapi" is what the routes did before: the endpoint builds the response
+model, FastAPI validates it again against ``response_model`` and renders
+it with ``json.dumps``. "orjson" is the current path: list rows are put
+into models with ``model_construct`` and every response is serialized
+once with ``model_dump_json`` (pydantic-core) via ``ModelResponse``.
+
+Usage (from src/backend)::
+
+    python -m benchmarks.article_responses
+    python -m benchmarks.article_responses --per-page 100 --repeat 50
+"""
+import argparse
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.features.articles.domain.schemas import (
+    ARTICLE_SUMMARY_FIELDS,
+    ArticleListItem,
+    ArticleListResponse,
+    ArticleResponse,
+)
+from app.shared.domain.enums import ArticleStatus
+from app.shared.infrastructure.responses import ModelResponse
+from benchmarks.corpus import load_corpus
+from benchmarks.utils import measure, print_timings
+
+LIST_FIELD = create_response_field(name="list", type_=ArticleListResponse)
+DETAIL_FIELD = create_response_field(name="detail", type_=ArticleResponse)
+
+
+def _row(index: int, content: str) -> dict:
+    now = datetime.now(timezone.utc) - timedelta(seconds=index)
+    return {
+        "id": uuid.uuid4(),
+        "category_id": uuid.uuid4(),
+        "prompt_template_id": uuid.uuid4(),
+        "keyword": f"キーワード{index}",
+        "title": content.splitlines()[0].lstrip("# "),
+        "status": ArticleStatus.REVIEW_PENDING,
+        "wp_post_id": None,
+        "wp_url": None,
+        "wp_published_at": None,
+        "created_at": now,
+        "updated_at": now,
+        "content": content,
+        "metadata_": {"char_count": len(content), "model": "claude"},
+    }
+
+
+def _fastapi_render(field, content) -> bytes:
+    """Validate against the response field and render with json.dumps."""
+    # serialize_response never awaits, so drive it without an event loop
+    coroutine = serialize_response(
+        field=field, response_content=content, exclude_unset=True
+    )
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        value = done.value
+    return JSONResponse(jsonable_encoder(value)).body
+
+
+def legacy_list(rows: list[dict]) -> bytes:
+    page = ArticleListResponse(
+        items=[
+            ArticleListItem.model_validate(
+                {k: v for k, v in row.items() if k in ARTICLE_SUMMARY_FIELDS}
+            )
+            for row in rows
+        ],
+        total=None,
+        per_page=len(rows),
+        next_cursor=None,
+    )
+    return _fastapi_render(LIST_FIELD, page)
+
+
+def orjson_list(rows: list[dict]) -> bytes:
+    page = ArticleListResponse.model_construct(
+        items=[
+            ArticleListItem.model_construct(
+                **{k: v for k, v in row.items() if k in ARTICLE_SUMMARY_FIELDS}
+            )
+            for row in rows
+        ],
+        total=None,
+        per_page=len(rows),
+        next_cursor=None,
+    )
+    return ModelResponse(page, exclude_unset=True).body
+
+
+def legacy_detail(row: dict) -> bytes:
+    return _fastapi_render(DETAIL_FIELD, ArticleResponse.model_validate(row))
+
+
+def orjson_detail(row: dict) -> bytes:
+    return ModelResponse(ArticleResponse.model_validate(row)).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="directory of .md articles")
+    parser.add_argument("--count", type=int, default=50, help="synthetic article count")
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, count=args.count)
+    rows = [_row(i, article) for i, article in enumerate(corpus)]
+    pages = [
+        [_row(i, corpus[i % len(corpus)]) for i in range(args.per_page)]
+        for _ in range(10)
+    ]
+
+    print(f"list: {len(pages)} pages x {args.per_page} summary items")
+    print_timings(
+        [
+            measure("fastapi", legacy_list, pages, args.repeat),
+            measure("orjson", orjson_list, pages, args.repeat),
+        ],
+        baseline="fastapi",
+    )
+    print(f"\ndetail: {len(rows)} articles with content")
+    print_timings(
+        [
+            measure("fastapi", legacy_detail, rows, args.repeat),
+            measure("orjson", orjson_detail, rows, args.repeat),
+        ],
+        baseline="fastapi",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: response compression, CPU time vs. bytes on the wire.
+
+Payloads are the JSON bodies the API sends for article pages: list pages
+of summary items and article details with their Markdown content. Each
+setting of CompressionMiddleware is timed on the same payloads.
+
+Usage (from src/backend)::
+
+    python -m benchmarks.compression
+    python -m benchmarks.compression --corpus exported_articles/ --repeat 20
+"""
+import argparse
+from pathlib import Path
+
+from app.features.articles.domain.schemas import (
+    ARTICLE_SUMMARY_FIELDS,
+    ArticleListItem,
+    ArticleListResponse,
+    ArticleResponse,
+)
+from app.shared.infrastructure.compression import CompressionMiddleware
+from benchmarks.article_responses import _row
+from benchmarks.corpus import load_corpus
+from benchmarks.utils import measure
+
+SETTINGS = [
+    ("gzip", 1),
+    ("gzip", 6),
+    ("gzip", 9),
+    ("br", 1),
+    ("br", 4),
+    ("br", 5),
+    ("br", 6),
+]
+
+
+def _payloads(corpus: list[str], per_page: int) -> dict[str, list[bytes]]:
+    rows = [_row(i, article) for i, article in enumerate(corpus)]
+    details = [ArticleResponse.model_validate(row).model_dump_json().encode() for row in rows]
+    pages = []
+    for start in range(0, len(rows), per_page):
+        items = [
+            ArticleListItem(**{field: row[field] for field in ARTICLE_SUMMARY_FIELDS})
+            for row in rows[start:start + per_page]
+        ]
+        page = ArticleListResponse(items=items, total=len(rows), page=1, per_page=per_page)
+        pages.append(page.model_dump_json(exclude_unset=True).encode())
+    return {"detail": details, f"list ({per_page} items)": pages}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="directory of .md articles")
+    parser.add_argument("--count", type=int, default=50, help="synthetic article count")
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, count=args.count)
+    for name, payloads in _payloads(corpus, args.per_page).items():
+        raw = sum(len(p) for p in payloads) // len(payloads)
+        print(f"\n{name}: {len(payloads)} payloads, mean {raw} bytes")
+        print(f"{'setting':<12}{'mean µs':>10}{'p95 µs':>10}{'bytes':>10}{'ratio':>8}{'MB/s':>8}")
+        for encoding, level in SETTINGS:
+            middleware = CompressionMiddleware(
+                None, gzip_level=level, brotli_level=level
+            )
+            timing = measure(
+                f"{encoding}-{level}",
+                lambda body: middleware.compress(body, encoding),
+                payloads,
+                args.repeat,
+            )
+            size = sum(len(middleware.compress(p, encoding)) for p in payloads) // len(payloads)
+            print(
+                f"{timing.name:<12}{timing.mean_us:>10.1f}{timing.p95_us:>10.1f}"
+                f"{size:>10}{raw / size:>7.1f}x{raw / timing.mean_us:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
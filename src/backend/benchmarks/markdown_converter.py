@@ -0,0 +1,54 @@
+"""Benchmark: single-pass MarkdownConverter vs. the previous regex converter.
+
+Usage (from src/backend)::
+
+    python -m benchmarks.markdown_converter
+    python -m benchmarks.markdown_converter --corpus exported_articles/ --repeat 50
+"""
+import argparse
+import re
+from pathlib import Path
+
+from app.shared.infrastructure.services.markdown_converter import markdown_converter
+from benchmarks.corpus import load_corpus
+from benchmarks.utils import measure, print_timings
+
+
+def legacy_convert(markdown: str) -> str:
+    """The previous converter: one full-string re.sub pass per syntax."""
+    html = markdown
+    for i in range(6, 0, -1):
+        pattern = rf"^{'#' * i}\s+(.+)$"
+        replacement = rf"<h{i}>\1</h{i}>"
+        html = re.sub(pattern, replacement, html, flags=re.MULTILINE)
+    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
+    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
+    html = re.sub(r"`(.+?)`", r"<code>\1</code>", html)
+    html = re.sub(r"\[(.+?)\]\((.+?)\)", r'<a href="\2">\1</a>', html)
+    html = re.sub(r"\n\n+", "</p><p>", html)
+    return f"<p>{html}</p>"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="directory of .md articles")
+    parser.add_argument("--count", type=int, default=50, help="synthetic article count")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, count=args.count)
+    sizes = [len(a) for a in corpus]
+    print(
+        f"corpus: {len(corpus)} articles, "
+        f"{min(sizes)}-{max(sizes)} chars (mean {sum(sizes) // len(sizes)})"
+    )
+
+    timings = [
+        measure("legacy (re.sub)", legacy_convert, corpus, args.repeat),
+        measure("single-pass", markdown_converter.convert, corpus, args.repeat),
+    ]
+    print_timings(timings, baseline="legacy (re.sub)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: single-scan ResponseParser vs. the previous multi-pass parser.
+
+Each article is wrapped in a ```markdown fence, as the LLM returns it.
+
+Usage (from src/backend)::
+
+    python -m benchmarks.response_parser
+    python -m benchmarks.response_parser --corpus exported_articles/ --repeat 50
+"""
+import argparse
+import re
+from pathlib import Path
+
+from app.features.articles.application.response_parser import get_response_parser
+from benchmarks.corpus import load_corpus
+from benchmarks.utils import measure, print_timings
+
+
+def legacy_parse(response: str) -> tuple[str, str, int]:
+    """The previous parser: two fence passes, a title search and four count passes."""
+    content = re.sub(r"^```(?:markdown)?\n?", "", response, flags=re.MULTILINE)
+    content = re.sub(r"```$", "", content, flags=re.MULTILINE).strip()
+    match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+    title = match.group(1).strip() if match else ""
+    plain = re.sub(r"^#+\s+", "", content, flags=re.MULTILINE)
+    plain = re.sub(r"\*\*(.+?)\*\*", r"\1", plain)
+    plain = re.sub(r"\*(.+?)\*", r"\1", plain)
+    plain = re.sub(r"`(.+?)`", r"\1", plain)
+    return title, content, len(plain)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, help="directory of .md articles")
+    parser.add_argument("--count", type=int, default=50, help="synthetic article count")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = [
+        f"```markdown\n{article}\n```"
+        for article in load_corpus(args.corpus, count=args.count)
+    ]
+    sizes = [len(a) for a in corpus]
+    print(
+        f"corpus: {len(corpus)} responses, "
+        f"{min(sizes)}-{max(sizes)} chars (mean {sum(sizes) // len(sizes)})"
+    )
+
+    response_parser = get_response_parser()
+    timings = [
+        measure("legacy (re.sub)", legacy_parse, corpus, args.repeat),
+        measure("single-scan", response_parser.parse, corpus, args.repeat),
+    ]
+    print_timings(timings, baseline="legacy (re.sub)")
+
+
+if __name__ == "__main__":
+    main()
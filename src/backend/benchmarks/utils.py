@@ -0,0 +1,46 @@
+"""Shared timing helpers for benchmarks."""
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+
+@dataclass
+class Timing:
+    """Per-item timing summary in microseconds."""
+
+    name: str
+    mean_us: float
+    median_us: float
+    p95_us: float
+
+
+def measure(name: str, func: Callable, items: Iterable, repeat: int = 20) -> Timing:
+    """Call ``func`` on every item ``repeat`` times and summarise per-call time."""
+    items = list(items)
+    samples: list[float] = []
+    for _ in range(repeat):
+        for item in items:
+            start = time.perf_counter()
+            func(item)
+            samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    return Timing(
+        name=name,
+        mean_us=statistics.fmean(samples),
+        median_us=statistics.median(samples),
+        p95_us=samples[int(len(samples) * 0.95) - 1],
+    )
+
+
+def print_timings(timings: list[Timing], baseline: str) -> None:
+    """Print timings as a table with speedup relative to ``baseline``."""
+    base = next(t for t in timings if t.name == baseline)
+    print(f"{'name':<20}{'mean µs':>12}{'median µs':>12}{'p95 µs':>12}{'speedup':>10}")
+    for t in timings:
+        speedup = base.mean_us / t.mean_us
+        print(
+            f"{t.name:<20}{t.mean_us:>12.1f}{t.median_us:>12.1f}"
+            f"{t.p95_us:>12.1f}{speedup:>9.2f}x"
+        )
@@ -32,11 +32,54 @@ export interface Article {
 
 export interface ArticleListResponse {
   items: Article[];
-  total: number;
+  total?: number | null;
+  page?: number | null;
+  per_page: number;
+  next_cursor?: string | null;
+}
+
+export interface ArticleSearchItem extends Article {
+  rank: number;
+  title_highlight?: string | null;
+  snippet?: string | null;
+}
+
+export interface ArticleSearchResponse {
+  items: ArticleSearchItem[];
+  q: string;
   page: number;
   per_page: number;
 }
 
+export interface JobStatusResponse {
+  job_id: string;
+  status: 'queued' | 'in_progress' | 'complete' | 'failed' | 'not_found' | 'unknown';
+  result?: Record<string, any> | null;
+}
+
+export interface PublishJobResponse {
+  job_id: string;
+  article_id: string;
+  message: string;
+}
+
+// バックグラウンドジョブの完了を待機（失敗時は例外）
+const waitForJob = async (jobId: string, intervalMs = 1000) => {
+  for (;;) {
+    const { data } = await api.get<JobStatusResponse>(`/batch/status/${jobId}`);
+    if (data.status === 'complete') {
+      if (data.result?.success === false) {
+        throw new Error(data.result.error || 'Job failed');
+      }
+      return data.result;
+    }
+    if (data.status === 'failed' || data.status === 'not_found') {
+      throw new Error(data.result?.error || `Job ${data.status}`);
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+};
+
 export const categoriesApi = {
   list: () => api.get<Category[]>('/categories'),
   create: (data: { name: string; slug: string }) => api.post<Category>('/categories', data),
@@ -47,10 +90,33 @@ export const categoriesApi = {
 };
 
 export const articlesApi = {
-  list: (params?: { category_id?: string; status?: string; page?: number; per_page?: number }) =>
+  list: (params?: {
+    category_id?: string;
+    status?: string;
+    page?: number;
+    per_page?: number;
+    cursor?: string;
+    include_total?: boolean;
+    fields?: string;
+  }) =>
     api.get<ArticleListResponse>('/articles', { params }),
+  search: (params: {
+    q: string;
+    category_id?: string;
+    status?: string;
+    page?: number;
+    per_page?: number;
+  }) => api.get<ArticleSearchResponse>('/articles/search', { params }),
   create: (data: { category_id: string; keyword: string; prompt_template_id?: string }) =>
     api.post<Article>('/articles', data),
+  bulkCreate: (data: { category_id: string; keywords: string[]; prompt_template_id?: string }) =>
+    api.post<{
+      requested: number;
+      duplicates: number;
+      created: number;
+      skipped: number;
+      ids: string[];
+    }>('/articles/bulk', data),
   get: (id: string) => api.get<Article>(`/articles/${id}`),
   update: (id: string, data: { keyword?: string; title?: string; content?: string; status?: string }) =>
     api.patch<Article>(`/articles/${id}`, data),
@@ -70,14 +136,24 @@ export const sheetsApi = {
 };
 
 export const wordpressApi = {
-  draft: (articleId: string) => api.post('/wordpress/draft', { article_id: articleId }),
-  publish: (articleId: string) => api.post('/wordpress/publish', { article_id: articleId }),
+  draft: async (articleId: string) => {
+    const { data } = await api.post<PublishJobResponse>('/wordpress/draft', { article_id: articleId });
+    return waitForJob(data.job_id);
+  },
+  publish: async (articleId: string) => {
+    const { data } = await api.post<PublishJobResponse>('/wordpress/publish', { article_id: articleId });
+    return waitForJob(data.job_id);
+  },
+  sync: async (articleId: string) => {
+    const { data } = await api.post<PublishJobResponse>('/wordpress/sync', { article_id: articleId });
+    return waitForJob(data.job_id);
+  },
 };
 
 export const batchApi = {
   generate: (articleIds: string[], options?: Record<string, any>) =>
     api.post('/batch/generate', { article_ids: articleIds, options }),
-  status: (jobId: string) => api.get(`/batch/status/${jobId}`),
+  status: (jobId: string) => api.get<JobStatusResponse>(`/batch/status/${jobId}`),
   generateSingle: (articleId: string) =>
     api.post(`/batch/generate/single/${articleId}`),
 };